@@ -0,0 +1,123 @@
+
+#Measures how long PRUDPLiteMessage.decode takes for a burst of coalesced
+#packets, as received from a single TCP or WebSocket read. For comparison
+#the burst is also parsed by the old decoder, which resliced the buffer
+#after every packet.
+#
+#   python benchmarks/prudp_decode.py -size 65536
+
+from nintendo.nex import prudp
+from nintendo.settings import Settings
+import argparse
+import random
+import struct
+import time
+import os
+
+
+class Client:
+	minor_version = 4
+
+
+def make_burst(size):
+	random.seed(0)
+	encoder = prudp.PRUDPLiteMessage(Client(), Settings())
+
+	data = b""
+	count = 0
+	while len(data) < size:
+		packet = prudp.PRUDPPacket(prudp.TYPE_DATA, prudp.FLAG_RELIABLE | prudp.FLAG_NEED_ACK)
+		packet.source_type = packet.dest_type = 10
+		packet.source_port = packet.dest_port = 1
+		packet.packet_id = count & 0xFFFF
+		packet.fragment_id = 1
+		packet.payload = os.urandom(random.randint(0, 200))
+		data += encoder.encode(packet)
+		count += 1
+	return data, count
+
+
+class ResliceMessage(prudp.PRUDPLiteMessage):
+	#The decoder before it was changed to parse the data in place
+	def decode(self, data):
+		self.buffer += data
+
+		packets = []
+		while self.buffer:
+			if len(self.buffer) < 12: return packets
+
+			packet = prudp.PRUDPPacket()
+
+			magic, option_size, payload_size, stream_types, source_port, dest_port, \
+				fragment_id, type_flags, packet_id = struct.unpack_from("<BBHBBBBHH", self.buffer)
+
+			if magic != 0x80:
+				self.reset()
+				return packets
+			if len(self.buffer) < 12 + option_size + payload_size:
+				return packets
+
+			packet.source_type = stream_types >> 4
+			packet.dest_type = stream_types & 0xF
+			packet.source_port = source_port
+			packet.dest_port = dest_port
+			packet.fragment_id = fragment_id
+			packet.flags = type_flags >> 4
+			packet.type = type_flags & 0xF
+			packet.packet_id = packet_id
+			packet.session_id = 0
+
+			option_data = self.buffer[12 : 12 + option_size]
+			options = prudp.decode_options(option_data)
+			if options is None:
+				self.reset()
+				return packets
+
+			packet.payload = self.buffer[12 + option_size : 12 + option_size + payload_size]
+			self.buffer = self.buffer[12 + option_size + payload_size:]
+			packets.append(packet)
+		return packets
+
+
+def decode_reslice(data):
+	decoder = ResliceMessage(Client(), Settings())
+	return decoder.decode(data)
+
+
+def decode_view(data):
+	decoder = prudp.PRUDPLiteMessage(Client(), Settings())
+	return decoder.decode(data)
+
+
+def measure(func, data, repeat):
+	best = None
+	for i in range(repeat):
+		start = time.perf_counter()
+		result = func(data)
+		elapsed = time.perf_counter() - start
+		if best is None or elapsed < best:
+			best = elapsed
+	return best, result
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-size", type=int, default=65536, help="size of the burst in bytes")
+	parser.add_argument("-repeat", type=int, default=10, help="number of runs, the fastest is reported")
+	args = parser.parse_args()
+
+	data, count = make_burst(args.size)
+	print("%i packets in %i bytes" %(count, len(data)))
+
+	reslice_time, expected = measure(decode_reslice, data, args.repeat)
+	view_time, packets = measure(decode_view, data, args.repeat)
+	payloads = [bytes(packet.payload) for packet in packets]
+	if payloads != [packet.payload for packet in expected]:
+		print("The decoders produced different payloads")
+
+	print("reslice: %8.2f ms" %(reslice_time * 1000))
+	print("decode:  %8.2f ms" %(view_time * 1000))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,60 @@
+
+#Measures the RC4 throughput with pycryptodome and with the pure Python
+#fallback. The data is encrypted once in a single call and once split
+#into packets, which is how PacketEncoder uses it.
+#
+#   python benchmarks/rc4.py -size 1048576 -packet 1024
+
+from nintendo.common import crypto
+import argparse
+import time
+import os
+
+
+def measure(key, data, packet):
+	rc4 = crypto.RC4(key)
+	start = time.perf_counter()
+	rc4.crypt(data)
+	bulk = time.perf_counter() - start
+
+	rc4 = crypto.RC4(key)
+	start = time.perf_counter()
+	for i in range(0, len(data), packet):
+		rc4.crypt(data[i : i + packet])
+	packets = time.perf_counter() - start
+	return bulk, packets
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-size", type=int, default=1048576, help="number of bytes to encrypt")
+	parser.add_argument("-packet", type=int, default=1024, help="packet size in bytes")
+	args = parser.parse_args()
+
+	key = b"CD&ML"
+	data = os.urandom(args.size)
+
+	backends = [("fallback", None)]
+	if crypto.ARC4:
+		backends.insert(0, ("pycryptodome", crypto.ARC4))
+	else:
+		print("pycryptodome is not installed")
+
+	native = crypto.ARC4
+	results = []
+	try:
+		for name, backend in backends:
+			crypto.ARC4 = backend
+			results.append(crypto.RC4(key).crypt(data))
+			bulk, packets = measure(key, data, args.packet)
+			mb = args.size / 1000000
+			print("%s: %8.1f MB/s bulk, %8.1f MB/s in %i byte packets" %(name, mb / bulk, mb / packets, args.packet))
+	finally:
+		crypto.ARC4 = native
+
+	if len(set(results)) != 1:
+		print("The backends produced different output")
+
+
+if __name__ == "__main__":
+	main()
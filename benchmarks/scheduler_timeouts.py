@@ -0,0 +1,80 @@
+
+#Compares the cost of a scheduler tick and of removing a timeout while
+#many timeouts are pending. The heap based scheduler is compared with
+#a model of the old event list, which checked every timeout on every
+#tick and removed events with list.remove.
+#
+#   python benchmarks/scheduler_timeouts.py -timeouts 10000
+
+from nintendo.common import scheduler
+import argparse
+import time
+
+
+class ListTimeout:
+	def __init__(self, timeout):
+		self.deadline = time.time() + timeout
+
+	def update(self):
+		if time.time() >= self.deadline:
+			return True
+		return False
+
+
+def measure(func, count):
+	start = time.perf_counter()
+	for i in range(count):
+		func()
+	return (time.perf_counter() - start) / count
+
+
+def bench_list(timeouts, ticks):
+	events = [ListTimeout(60) for i in range(timeouts)]
+
+	def tick():
+		for event in list(events):
+			event.update()
+
+	tick_time = measure(tick, ticks)
+
+	start = time.perf_counter()
+	for event in events[::-1]:
+		events.remove(event)
+	remove_time = (time.perf_counter() - start) / timeouts
+	return tick_time, remove_time
+
+
+def bench_heap(timeouts, ticks):
+	#The timeouts are attached directly, so that the scheduler
+	#thread does not run them in the background
+	events = []
+	for i in range(timeouts):
+		event = scheduler.Timeout(None, None, 60)
+		event.attach()
+		events.append(event)
+
+	tick_time = measure(scheduler.process_events, ticks)
+
+	start = time.perf_counter()
+	for event in events:
+		event.kill()
+	remove_time = (time.perf_counter() - start) / timeouts
+
+	scheduler.next_deadline()
+	return tick_time, remove_time
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-timeouts", type=int, default=10000, help="number of pending timeouts")
+	parser.add_argument("-ticks", type=int, default=100, help="number of ticks to measure")
+	args = parser.parse_args()
+
+	print("%i pending timeouts" %args.timeouts)
+	for name, bench in [("list", bench_list), ("heap", bench_heap)]:
+		tick_time, remove_time = bench(args.timeouts, args.ticks)
+		print("%s: %10.1f us per tick, %6.2f us per removal" %(name, tick_time * 1000000, remove_time * 1000000))
+
+
+if __name__ == "__main__":
+	main()
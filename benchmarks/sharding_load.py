@@ -0,0 +1,78 @@
+
+#Load generator for the secure server of example_server.py. Every client
+#process logs in over and over and calls SecureConnection.register a few
+#times per login. Prints the logins and calls per second, and checks
+#that no connection id was handed out twice.
+#
+#Start the server with one or more workers first, for example:
+#   python example_server.py 4
+#   python benchmarks/sharding_load.py -clients 8
+
+from nintendo.nex import backend, secure
+from nintendo.games import Friends
+import multiprocessing
+import argparse
+import time
+
+import logging
+logging.basicConfig(level=logging.ERROR)
+
+
+def run_client(host, port, calls, duration, results):
+	logins = 0
+	ids = []
+
+	deadline = time.monotonic() + duration
+	while time.monotonic() < deadline:
+		client = backend.BackEndClient("friends.cfg")
+		client.configure(Friends.ACCESS_KEY, Friends.NEX_VERSION)
+		client.connect(host, port)
+		client.login("guest", "MMQea3n!fsik")
+		logins += 1
+		ids.append(client.public_station["RVCID"])
+
+		proto = secure.SecureConnectionClient(client.secure_client)
+		for i in range(calls):
+			response = proto.register([client.local_station])
+			ids.append(response.connection_id)
+		client.close()
+
+	results.put((logins, ids))
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-host", default="127.0.0.1")
+	parser.add_argument("-port", type=int, default=1223, help="port of the authentication server")
+	parser.add_argument("-clients", type=int, default=4, help="number of client processes")
+	parser.add_argument("-calls", type=int, default=10, help="register calls per login")
+	parser.add_argument("-duration", type=float, default=10, help="seconds per client process")
+	args = parser.parse_args()
+
+	results = multiprocessing.Queue()
+	processes = []
+	start = time.perf_counter()
+	for i in range(args.clients):
+		process = multiprocessing.Process(
+			target=run_client, args=(args.host, args.port, args.calls, args.duration, results)
+		)
+		process.start()
+		processes.append(process)
+
+	logins = 0
+	ids = []
+	for process in processes:
+		count, connection_ids = results.get()
+		logins += count
+		ids += connection_ids
+	for process in processes:
+		process.join()
+	elapsed = time.perf_counter() - start
+
+	calls = len(ids) - logins
+	print("%i clients: %.1f logins/s, %.1f calls/s" %(args.clients, logins / elapsed, calls / elapsed))
+	print("%i connection ids, %i duplicates" %(len(ids), len(ids) - len(set(ids))))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,87 @@
+
+#Micro benchmarks for the primitives of StreamOut and StreamIn, and for
+#lists of primitives in the NEX streams. Lists are encoded and decoded
+#once in bulk and once with a function that handles one element at a
+#time, which is what happened for every list before the bulk path.
+#
+#   python benchmarks/streams.py -count 100000
+
+from nintendo.common import streams
+from nintendo.nex import streams as nexstreams
+from nintendo.settings import Settings
+import argparse
+import time
+
+
+PRIMITIVES = [
+	("u8", 200), ("u16", 50000), ("u32", 3000000000), ("u64", 1 << 60),
+	("s32", -100000), ("float", 0.5), ("double", 0.25)
+]
+
+
+def measure(func):
+	start = time.perf_counter()
+	func()
+	return time.perf_counter() - start
+
+
+def bench_primitive(name, value, count):
+	values = [value] * count
+
+	output = streams.StreamOut()
+	write = getattr(output, name)
+	def encode():
+		for value in values:
+			write(value)
+	encode_time = measure(encode)
+
+	input = streams.StreamIn(output.get())
+	read = getattr(input, name)
+	def decode():
+		for i in range(count):
+			read()
+	decode_time = measure(decode)
+	return encode_time, decode_time
+
+
+def bench_list(settings, values, bulk):
+	output = nexstreams.StreamOut(settings)
+	if bulk:
+		encode_time = measure(lambda: output.list(values, output.u64))
+	else:
+		encode_time = measure(lambda: output.list(values, lambda value: output.u64(value)))
+
+	input = nexstreams.StreamIn(output.get(), settings)
+	if bulk:
+		decode_time = measure(lambda: input.list(input.u64))
+	else:
+		decode_time = measure(lambda: input.list(lambda: input.u64()))
+	return encode_time, decode_time
+
+
+def best(bench, repeat, *args):
+	#Reports the fastest run for encoding and decoding separately
+	results = [bench(*args) for i in range(repeat)]
+	return min(result[0] for result in results), min(result[1] for result in results)
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-count", type=int, default=100000, help="number of values per benchmark")
+	parser.add_argument("-repeat", type=int, default=5, help="number of runs, the fastest is reported")
+	args = parser.parse_args()
+
+	print("ns per value, %i values" %args.count)
+	for name, value in PRIMITIVES:
+		encode_time, decode_time = best(bench_primitive, args.repeat, name, value, args.count)
+		print("%-12s write %6.1f, read %6.1f" %(name, encode_time / args.count * 1e9, decode_time / args.count * 1e9))
+
+	settings = Settings("default.cfg")
+	values = list(range(args.count))
+	for name, bulk in [("list u64", False), ("list u64[]", True)]:
+		encode_time, decode_time = best(bench_list, args.repeat, settings, values, bulk)
+		print("%-12s write %6.1f, read %6.1f" %(name, encode_time / args.count * 1e9, decode_time / args.count * 1e9))
+
+
+if __name__ == "__main__":
+	main()
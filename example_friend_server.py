@@ -1,9 +1,7 @@
 
 from nintendo.nex import backend, service, kerberos, \
-    authentication, secure, friends, common
+    authentication, secure, friends, common, sharding
 from nintendo.games import Friends
-import collections
-import itertools
 import secrets
 import time
 import argparse
@@ -16,31 +14,23 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S")
 logger = logging.getLogger(__name__)
 
-User = collections.namedtuple("User", "pid name password")
-
-users = [
-    User(2, "Quazal Rendez-Vous", "password"),
-    User(100, "guest", "MMQea3n!fsik"),
-    User(1337, "1337", "password"),
-    # More accounts here
-]
+users = kerberos.KeyStore(kerberos.KeyDerivationOld(65000, 1024))
+users.add(2, "Quazal Rendez-Vous", "password")
+users.add(100, "guest", "MMQea3n!fsik")
+users.add(1337, "1337", "password")
+# More accounts here
 
 
 def get_user_by_name(name):
-    for user in users:
-        if user.name == name:
-            return user
+    return users.get_by_name(name)
 
 
 def get_user_by_pid(pid):
-    for user in users:
-        if user.pid == pid:
-            return user
+    return users.get_by_pid(pid)
 
 
 def derive_key(user):
-    deriv = kerberos.KeyDerivationOld(65000, 1024)
-    return deriv.derive_key(user.password.encode("ascii"), user.pid)
+    return users.get_key(user.pid)
 
 
 SECURE_SERVER = "Quazal Rendez-Vous"
@@ -111,9 +101,11 @@ class AuthenticationServer(authentication.AuthenticationServer):
 
 
 class SecureConnectionServer(secure.SecureConnectionServer):
-    def __init__(self):
+    def __init__(self, store):
         super().__init__()
-        self.connection_id = itertools.count(10)
+        # Connection ids and station urls go through the store, so
+        # that they are shared if the server runs on multiple workers
+        self.store = store
 
     def register(self, context, urls):
         addr = context.client.remote_address()
@@ -122,15 +114,29 @@ class SecureConnectionServer(secure.SecureConnectionServer):
         station["port"] = addr[1]
         station["type"] = 3
 
+        connection_id = self.store.next_id("connection_id", 10)
+        station["RVCID"] = connection_id
+        self.store.set("station:%i" % context.pid, str(station))
+
         response = common.RMCResponse()
         response.result = common.Result(0x10001)  # Success
-        response.connection_id = next(self.connection_id)
+        response.connection_id = connection_id
         response.public_station = station
         return response
 
     def register_ex(self, context, urls, login_data):
         return self.register(context, urls)
 
+    def request_urls(self, context, cid, pid):
+        station = self.store.get("station:%i" % pid)
+
+        response = common.RMCResponse()
+        response.result = station is not None
+        response.urls = []
+        if station:
+            response.urls.append(common.StationURL.parse(station))
+        return response
+
 
 class FriendsServer(friends.FriendsServer):
     def __init__(self):
@@ -174,15 +180,17 @@ def main():
     args = parser.parse_args()
     host = args.host
     if args.pid and args.username and args.password:
-        users.append(User(args.pid, args.username, args.password))
+        users.add(args.pid, args.username, args.password)
 
     settings = backend.Settings("friends.cfg")
     settings.set("nex.access_key", Friends.ACCESS_KEY)
     settings.set("prudp.ping_timeout", 30.0)
 
+    # Derive the keys of all accounts before the first login
+    users.precompute()
     server_key = derive_key(get_user_by_name(SECURE_SERVER))
     secure_server = service.RMCServer(settings)
-    secure_server.register_protocol(SecureConnectionServer())
+    secure_server.register_protocol(SecureConnectionServer(sharding.LocalStore()))
     secure_server.register_protocol(FriendsServer())
     secure_server.start(host, 60021, key=server_key)
     logger.info("friends secure server {}:60021".format(host))
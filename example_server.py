@@ -1,38 +1,29 @@
 
 from nintendo.nex import backend, service, kerberos, \
-	authentication, secure, friends, common
+	authentication, secure, friends, common, sharding
 from nintendo.settings import Settings
 from nintendo.games import Friends
-import collections
-import itertools
 import secrets
 import time
+import sys
 
 import logging
 logging.basicConfig(level=logging.INFO)
 
 
-User = collections.namedtuple("User", "pid name password")
-
-users = [
-	User(2, "Quazal Rendez-Vous", "password"),
-	User(100, "guest", "MMQea3n!fsik")
-	#More accounts here
-]
+users = kerberos.KeyStore(kerberos.KeyDerivationOld(65000, 1024))
+users.add(2, "Quazal Rendez-Vous", "password")
+users.add(100, "guest", "MMQea3n!fsik")
+#More accounts here
 
 def get_user_by_name(name):
-	for user in users:
-		if user.name == name:
-			return user
+	return users.get_by_name(name)
 			
 def get_user_by_pid(pid):
-	for user in users:
-		if user.pid == pid:
-			return user
+	return users.get_by_pid(pid)
 			
 def derive_key(user):
-	deriv = kerberos.KeyDerivationOld(65000, 1024)
-	return deriv.derive_key(user.password.encode("ascii"), user.pid)
+	return users.get_key(user.pid)
 
 	
 SECURE_SERVER = "Quazal Rendez-Vous"
@@ -100,9 +91,11 @@ class AuthenticationServer(authentication.AuthenticationServer):
 		
 		
 class SecureConnectionServer(secure.SecureConnectionServer):
-	def __init__(self):
+	def __init__(self, store):
 		super().__init__()
-		self.connection_id = itertools.count(10)
+		#Connection ids and station urls go through the store, so
+		#that they are shared if the server runs on multiple workers
+		self.store = store
 	
 	def register(self, context, urls):
 		addr = context.client.remote_address()
@@ -111,14 +104,28 @@ class SecureConnectionServer(secure.SecureConnectionServer):
 		station["port"] = addr[1]
 		station["type"] = 3
 		
+		connection_id = self.store.next_id("connection_id", 10)
+		station["RVCID"] = connection_id
+		self.store.set("station:%i" %context.pid, str(station))
+		
 		response = common.RMCResponse()
 		response.result = common.Result(0x10001) #Success
-		response.connection_id = next(self.connection_id)
+		response.connection_id = connection_id
 		response.public_station = station
 		return response
 	
 	def register_ex(self, context, urls, login_data):
 		return self.register(context, urls)
+		
+	def request_urls(self, context, cid, pid):
+		station = self.store.get("station:%i" %pid)
+		
+		response = common.RMCResponse()
+		response.result = station is not None
+		response.urls = []
+		if station:
+			response.urls.append(common.StationURL.parse(station))
+		return response
 
 
 class FriendsServer(friends.FriendsServer):
@@ -128,15 +135,28 @@ class FriendsServer(friends.FriendsServer):
 settings = Settings("friends.cfg")
 settings.set("nex.access_key", Friends.ACCESS_KEY)
 
+#Derive the keys of all accounts before the first login
+users.precompute()
+server_key = derive_key(get_user_by_name("Quazal Rendez-Vous"))
+
+def start_secure_server(settings, index, store):
+	secure_server = service.RMCServer(settings)
+	secure_server.register_protocol(SecureConnectionServer(store))
+	secure_server.register_protocol(FriendsServer())
+	secure_server.start("", 1224, key=server_key)
+
+#Pass a number of worker processes to run the secure server on
+#multiple cores. The workers must be started before any server
+#in this process.
+workers = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+if workers:
+	sharded_server = sharding.ShardedServer(settings, workers)
+	sharded_server.start(start_secure_server)
+else:
+	start_secure_server(settings, 0, sharding.LocalStore())
+
 auth_server = service.RMCServer(settings)
 auth_server.register_protocol(AuthenticationServer(settings))
 auth_server.start("", 1223)
 
-server_key = derive_key(get_user_by_name("Quazal Rendez-Vous"))
-
-secure_server = service.RMCServer(settings)
-secure_server.register_protocol(SecureConnectionServer())
-secure_server.register_protocol(FriendsServer())
-secure_server.start("", 1224, key=server_key)
-
 input("Press enter to exit...\n")
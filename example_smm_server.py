@@ -1,9 +1,7 @@
 
 from nintendo.nex import backend, service, kerberos, \
-    authentication, secure, datastoresmm, common, messagedelivery
+    authentication, secure, datastoresmm, common, messagedelivery, sharding
 from nintendo.games import SMM
-import collections
-import itertools
 import secrets
 import time
 import argparse
@@ -23,35 +21,24 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S")
 logger = logging.getLogger(__name__)
 
-User = collections.namedtuple("User", "pid name password")
-
-users = [
-    User(1, "unknown", "password"),
-    User(2, "Quazal Rendez-Vous", "password"),
-    User(100, "guest", "MMQea3n!fsik"),
-    User(1337, "1337", "password"),
-    # More accounts here
-]
+users = kerberos.KeyStore(kerberos.KeyDerivationOld(65000, 1024))
+users.add(1, "unknown", "password")
+users.add(2, "Quazal Rendez-Vous", "password")
+users.add(100, "guest", "MMQea3n!fsik")
+users.add(1337, "1337", "password")
+# More accounts here
 
 
 def get_user_by_name(name):
-    for user in users:
-        if user.name == name:
-            return user
+    return users.get_by_name(name)
 
 
 def get_user_by_pid(pid):
-    for user in users:
-        if user.pid == pid:
-            return user
+    return users.get_by_pid(pid)
 
 
-def derive_key(settings, user):
-    if settings.get("kerberos.key_derivation") == 0:
-        key_derivation = kerberos.KeyDerivationOld(65000, 1024)
-    else:
-        key_derivation = kerberos.KeyDerivationNew(1, 1)
-    return key_derivation.derive_key(user.password.encode("ascii"), user.pid)
+def derive_key(user):
+    return users.get_key(user.pid)
 
 
 SECURE_SERVER = "Quazal Rendez-Vous"
@@ -108,8 +95,8 @@ class AuthenticationServer(authentication.AuthenticationServer):
     def generate_ticket(self, source, target):
         settings = self.settings
 
-        user_key = derive_key(settings, source)
-        server_key = derive_key(settings, target)
+        user_key = derive_key(source)
+        server_key = derive_key(target)
         session_key = secrets.token_bytes(settings.get("kerberos.key_size"))
 
         internal = kerberos.ServerTicket()
@@ -126,9 +113,11 @@ class AuthenticationServer(authentication.AuthenticationServer):
 
 
 class SecureConnectionServer(secure.SecureConnectionServer):
-    def __init__(self):
+    def __init__(self, store):
         super().__init__()
-        self.connection_id = itertools.count(10)
+        # Connection ids and station urls go through the store, so
+        # that they are shared if the server runs on multiple workers
+        self.store = store
 
     def register(self, context, urls):
         addr = context.client.remote_address()
@@ -137,15 +126,29 @@ class SecureConnectionServer(secure.SecureConnectionServer):
         station["port"] = addr[1]
         station["type"] = 3
 
+        connection_id = self.store.next_id("connection_id", 10)
+        station["RVCID"] = connection_id
+        self.store.set("station:%i" % context.pid, str(station))
+
         response = common.RMCResponse()
         response.result = common.Result(0x10001)  # Success
-        response.connection_id = next(self.connection_id)
+        response.connection_id = connection_id
         response.public_station = station
         return response
 
     def register_ex(self, context, urls, login_data):
         return self.register(context, urls)
 
+    def request_urls(self, context, cid, pid):
+        station = self.store.get("station:%i" % pid)
+
+        response = common.RMCResponse()
+        response.result = station is not None
+        response.urls = []
+        if station:
+            response.urls.append(common.StationURL.parse(station))
+        return response
+
 
 class DataStoreSmmServer(datastoresmm.DataStoreSmmServer):
     def __init__(self, settings):
@@ -611,7 +614,7 @@ def main():
     args = parser.parse_args()
     host = args.host
     if args.pid and args.username and args.password:
-        users.append(User(args.pid, args.username, args.password))
+        users.add(args.pid, args.username, args.password)
 
     settings = backend.Settings("default.cfg")
     settings.set("nex.access_key", SMM.ACCESS_KEY)
@@ -619,9 +622,14 @@ def main():
     settings.set("prudp.ping_timeout", 10.0)
 
     secure_server_port = 59921
-    server_key = derive_key(settings, get_user_by_name(SECURE_SERVER))
+    if settings.get("kerberos.key_derivation") != 0:
+        users.set_key_derivation(kerberos.KeyDerivationNew(1, 1))
+
+    # Derive the keys of all accounts before the first login
+    users.precompute()
+    server_key = derive_key(get_user_by_name(SECURE_SERVER))
     secure_server = service.RMCServer(settings)
-    secure_server.register_protocol(SecureConnectionServer())
+    secure_server.register_protocol(SecureConnectionServer(sharding.LocalStore()))
     secure_server.register_protocol(DataStoreSmmServer(settings))
     secure_server.register_protocol(MessageDeliveryServer(settings))
     secure_server.start(host, secure_server_port, key=server_key)
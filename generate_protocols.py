@@ -732,6 +732,31 @@ MAPPED_TYPES = {
 	"sint32": "s32",
 	"sint64": "s64",
 }
+
+#Fixed-size types that can be packed together with a single struct
+STRUCT_FORMATS = {
+	"uint8": "B",
+	"uint16": "H",
+	"uint32": "I",
+	"uint64": "Q",
+	
+	"sint8": "b",
+	"sint16": "h",
+	"sint32": "i",
+	"sint64": "q",
+	
+	"float": "f",
+	"double": "d",
+	"bool": "?"
+}
+
+#Consecutive fixed-size fields are loaded and saved with a single
+#precompiled struct, unless --no-fast-path is given
+FAST_PATH = "--no-fast-path" not in sys.argv
+
+#Structures are generated with __slots__ if --slots is given, which
+#reduces their memory usage but prevents adding other attributes
+SLOTS = "--slots" in sys.argv
 				
 class CodeGenerator:
 	def process(self, file):
@@ -759,6 +784,8 @@ class CodeGenerator:
 		stream.write_line("# This file was generated automatically by generate_protocols.py")
 		stream.write_line()
 		stream.write_line("from nintendo.nex import common")
+		if FAST_PATH:
+			stream.write_line("import struct")
 		stream.write_line()
 		stream.write_line("import logging")
 		stream.write_line("logger = logging.getLogger(__name__)")
@@ -787,6 +814,19 @@ class CodeGenerator:
 		stream.write_line("class %s(%s):" %(struct.name, parent))
 		stream.indent()
 		
+		self.struct_name = struct.name
+		self.struct_runs = []
+		if FAST_PATH:
+			self.find_struct_runs(struct.body)
+			for i, run in enumerate(self.struct_runs):
+				format = "".join(STRUCT_FORMATS[field.type.name] for field in run)
+				stream.write_line('FIELDS_%i = struct.Struct("<%s")' %(i, format))
+			if self.struct_runs:
+				stream.write_line()
+		
+		if SLOTS:
+			self.generate_struct_slots(stream, struct)
+		
 		self.generate_struct_init(stream, struct)
 		self.generate_struct_version(stream, struct)
 		self.generate_struct_check(stream, struct)
@@ -798,6 +838,20 @@ class CodeGenerator:
 			stream.write_line('common.DataHolder.register(%s, "%s")' %(struct.name, struct.name))
 		stream.write_line()
 		
+	def generate_struct_slots(self, stream, struct):
+		#Fields of the parent class are covered by its own slots
+		names = []
+		self.find_field_names(struct.body, names)
+		stream.write_line("__slots__ = %s" %names)
+		stream.write_line()
+		
+	def find_field_names(self, body, names):
+		for field in body.fields:
+			if isinstance(field, Variable):
+				names.append(field.name)
+			elif isinstance(field, Conditional):
+				self.find_field_names(field.body, names)
+		
 	def generate_struct_init(self, stream, struct):
 		stream.write_line("def __init__(self):")
 		stream.indent()
@@ -871,10 +925,36 @@ class CodeGenerator:
 		stream.unindent()
 		stream.write_line()
 		
+	def find_struct_runs(self, body):
+		run = []
+		for field in body.fields + [None]:
+			if isinstance(field, Variable) and field.type.name in STRUCT_FORMATS:
+				run.append(field)
+			else:
+				if len(run) > 1:
+					self.struct_runs.append(run)
+				run = []
+				if isinstance(field, Conditional):
+					self.find_struct_runs(field.body)
+					
+	def find_struct_run(self, field):
+		for i, run in enumerate(self.struct_runs):
+			if run[0] is field:
+				return i, run
+		for run in self.struct_runs:
+			if field in run:
+				return None, None
+		return None, [field]
+		
 	def generate_struct_load_body(self, stream, body):
 		for field in body.fields:
 			if isinstance(field, Variable):
-				stream.write_line("self.%s = %s" %(field.name, self.make_extract(field.type)))
+				index, run = self.find_struct_run(field)
+				if index is not None:
+					names = ", ".join("self.%s" %field.name for field in run)
+					stream.write_line("%s = stream.fields(%s.FIELDS_%i)" %(names, self.struct_name, index))
+				elif run:
+					stream.write_line("self.%s = %s" %(field.name, self.make_extract(field.type)))
 			elif isinstance(field, Conditional):
 				self.generate_if_statement(stream, field, "stream.")
 				stream.indent()
@@ -891,7 +971,12 @@ class CodeGenerator:
 	def generate_struct_save_body(self, stream, body):
 		for field in body.fields:
 			if isinstance(field, Variable):
-				stream.write_line(self.make_encode(field.type, "self.%s" %field.name))
+				index, run = self.find_struct_run(field)
+				if index is not None:
+					names = ", ".join("self.%s" %field.name for field in run)
+					stream.write_line("stream.fields(%s.FIELDS_%i, %s)" %(self.struct_name, index, names))
+				elif run:
+					stream.write_line(self.make_encode(field.type, "self.%s" %field.name))
 			elif isinstance(field, Conditional):
 				self.generate_if_statement(stream, field, "stream.")
 				stream.indent()
@@ -946,21 +1031,25 @@ class CodeGenerator:
 	def generate_client_method(self, stream, proto, method):
 		class_name = self.make_class_name(proto.name, "Client")
 	
-		param = ", ".join(["self"] + [param.name for param in method.request.vars])
+		names = [param.name for param in method.request.vars]
+		param = ", ".join(["self"] + names)
 		stream.write_line("def %s(%s):" %(method.name, param))
+		stream.write_line("\treturn self.client.wait(self.%s_async(%s))" %(method.name, ", ".join(names)))
+		stream.write_line()
 		
+		stream.write_line("def %s_async(%s):" %(method.name, param))
 		stream.indent()
 		stream.write_line('logger.info("%s.%s()")' %(class_name, method.name))
 		stream.write_line("#--- request ---")
 		stream.write_line("stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_%s)" %method.name.upper())
 		for param in method.request.vars:
 			stream.write_line(self.make_encode(param.type, param.name))
-		stream.write_line("self.client.send_message(stream)")
 		
 		stream.write_line()
 		stream.write_line("#--- response ---")
+		stream.write_line("def decode(stream):")
+		stream.indent()
 		if len(method.response.vars) > 1:
-			stream.write_line("stream = self.client.get_response(call_id)")
 			stream.write_line("obj = common.RMCResponse()")
 			for var in method.response.vars:
 				stream.write_line("obj.%s = %s" %(var.name, self.make_extract(var.type)))
@@ -968,14 +1057,14 @@ class CodeGenerator:
 			stream.write_line("return obj")
 		elif len(method.response.vars) == 1:
 			value = method.response.vars[0]
-			stream.write_line("stream = self.client.get_response(call_id)")
 			stream.write_line("%s = %s" %(value.name, self.make_extract(value.type)))
 			stream.write_line('logger.info("%s.%s -> done")' %(class_name, method.name))
 			stream.write_line("return %s" %value.name)
 		else:
-			stream.write_line("self.client.get_response(call_id)")
 			stream.write_line('logger.info("%s.%s -> done")' %(class_name, method.name))
 		stream.unindent()
+		stream.write_line("return self.client.call(stream, call_id, decode)")
+		stream.unindent()
 		
 	def generate_server(self, stream, proto):
 		server_name = self.make_class_name(proto.name, "Server")
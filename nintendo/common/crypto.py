@@ -1,34 +1,102 @@
 
+import collections
+
+try:
+	from Crypto.Cipher import ARC4
+except ImportError:
+	ARC4 = None
+
+
+def has_native_rc4(key_size):
+	#Keys that pycryptodome accepts are scheduled in C, which
+	#is faster than a cache lookup
+	return ARC4 is not None and key_size in ARC4.key_size
+
+
+def rc4_schedule(key):
+	state = list(range(256))
+
+	p = 0
+	for i in range(256):
+		p = (p + state[i] + key[i % len(key)]) & 0xFF
+		state[i], state[p] = state[p], state[i]
+	return state
+
+
+class RC4Cache:
+	def __init__(self, size):
+		self.size = size
+		self.states = collections.OrderedDict()
+
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key):
+		if key in self.states:
+			self.hits += 1
+			self.states.move_to_end(key)
+			return self.states[key]
+
+		self.misses += 1
+		state = rc4_schedule(key)
+		if self.size > 0:
+			self.states[key] = state
+			if len(self.states) > self.size:
+				self.states.popitem(False)
+		return state
+
+
 class RC4:
-	def __init__(self, key, reset=False):
+	def __init__(self, key, reset=False, cache=None):
 		self.reinit = reset
+		self.cache = cache
 		self.set_key(key)
-		
+
 	def set_key(self, key):
 		self.key = key
+		self.cipher = None
+		if has_native_rc4(len(key)):
+			self.initial = None
+		elif self.cache:
+			self.initial = self.cache.get(bytes(key))
+		else:
+			self.initial = rc4_schedule(key)
 		self.reset()
-		
+
 	def reset(self):
-		self.state = list(range(256))
-		self.x = self.y = 0
-		
-		p = 0
-		for i in range(256):
-			p = (p + self.state[i] + self.key[i % len(self.key)]) % 256
-			self.state[i], self.state[p] = self.state[p], self.state[i]
-		
+		if self.initial is None:
+			self.cipher = ARC4.new(self.key)
+		else:
+			self.state = self.initial[:]
+			self.x = self.y = 0
+
 	def crypt(self, data):
-		out = []
-		for char in data:
-			self.x = (self.x + 1) % 256
-			self.y = (self.y + self.state[self.x]) % 256
-			p, q = self.state[self.y], self.state[self.x]
-			self.state[self.x], self.state[self.y] = p, q
-			
-			mask = self.state[(p + q) % 256]
-			out.append(char ^ mask)
-			
+		if self.cipher:
+			out = self.cipher.encrypt(data)
+		else:
+			out = self.crypt_python(data)
+
 		if self.reinit:
 			self.reset()
 
-		return bytes(out)
+		return out
+
+	def crypt_python(self, data):
+		state = self.state
+		x, y = self.x, self.y
+
+		stream = []
+		for char in data:
+			x = (x + 1) & 0xFF
+			p = state[x]
+			y = (y + p) & 0xFF
+			q = state[y]
+			state[x], state[y] = q, p
+			stream.append(state[(p + q) & 0xFF])
+
+		self.x, self.y = x, y
+
+		#Apply the key stream to all bytes at once
+		size = len(stream)
+		mask = int.from_bytes(bytes(stream), "little")
+		return (int.from_bytes(data, "little") ^ mask).to_bytes(size, "little")
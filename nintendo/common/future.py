@@ -0,0 +1,23 @@
+
+import concurrent.futures
+import asyncio
+
+
+class Future(concurrent.futures.Future):
+	#Futures are completed by the scheduler thread. They can be
+	#waited on from other threads with result() or awaited from
+	#an asyncio event loop.
+	def __await__(self):
+		return asyncio.wrap_future(self).__await__()
+
+	def map(self, func):
+		#Returns a future that holds the result of func applied
+		#to the result of this future
+		future = Future()
+		def callback(self):
+			try:
+				future.set_result(func(self.result()))
+			except BaseException as e:
+				future.set_exception(e)
+		self.add_done_callback(callback)
+		return future
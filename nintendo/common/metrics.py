@@ -0,0 +1,70 @@
+
+from . import http, scheduler
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class MetricsWriter:
+	#Writes metrics in the Prometheus text format
+	def __init__(self):
+		self.lines = []
+
+	def metric(self, name, type, help):
+		self.lines.append("# HELP %s %s" %(name, help))
+		self.lines.append("# TYPE %s %s" %(name, type))
+
+	def sample(self, name, value, **labels):
+		if labels:
+			fields = ['%s="%s"' %(key, value) for key, value in labels.items()]
+			name += "{%s}" %",".join(fields)
+		if isinstance(value, float):
+			value = repr(value)
+		self.lines.append("%s %s" %(name, value))
+
+	def single(self, name, type, help, value):
+		self.metric(name, type, help)
+		self.sample(name, value)
+
+	def get(self):
+		return "\n".join(self.lines) + "\n"
+
+
+def collect_scheduler(writer):
+	writer.single("scheduler_events", "gauge", "Number of socket events and callbacks", len(scheduler.events) + len(scheduler.callbacks))
+	writer.single("scheduler_timeouts", "gauge", "Number of pending timeouts", scheduler.count_timeouts())
+	writer.single("scheduler_passes_total", "counter", "Number of passes over the events", scheduler.passes)
+	writer.single("scheduler_timeouts_fired_total", "counter", "Number of timeouts that expired", scheduler.timeouts_fired)
+	writer.single("scheduler_lag_seconds_total", "counter", "Total delay between timeout deadlines and their processing", float(scheduler.lag_total))
+	writer.single("scheduler_lag_seconds", "gauge", "Delay of the most recently processed timeout", float(scheduler.last_lag))
+
+
+class MetricsServer(http.HTTPServer):
+	#Serves the output of all collectors at /metrics. A collector
+	#is called with a MetricsWriter on every scrape.
+	def __init__(self, ssl=False, server=None):
+		super().__init__(ssl, server)
+		self.collectors = [collect_scheduler]
+
+	def add_collector(self, collector):
+		self.collectors.append(collector)
+
+	def remove_collector(self, collector):
+		self.collectors.remove(collector)
+
+	def collect(self):
+		writer = MetricsWriter()
+		for collector in self.collectors:
+			collector(writer)
+		return writer.get()
+
+	def handle(self, request):
+		if request.path != "/metrics":
+			return http.HTTPResponse(404)
+		if request.method != "GET":
+			return http.HTTPResponse(405)
+
+		response = http.HTTPResponse(200)
+		response.headers["Content-Type"] = "text/plain; version=0.0.4"
+		response.body = self.collect()
+		return response
@@ -1,132 +1,453 @@
 
+import selectors
+import socket
 import threading
+import heapq
+import itertools
 import time
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+#Upper bound on the sleep time while callbacks are registered,
+#because callbacks must be polled on every tick
+POLL_INTERVAL = 0.02
+
+#Maximum number of passes over the event list before the
+#event loop goes back to sleep
+MAX_PASSES = 64
+
+
 class Event:
 	def __init__(self, callback, param):
 		self.callback = callback
 		self.param = param
-		
+
 	def trigger(self, *args):
 		if self.param is None:
 			self.callback(*args)
 		else:
 			self.callback(*args, self.param)
-		
+
+	def attach(self):
+		events[self] = True
+
 	def kill(self):
-		if self in events:
-			events.remove(self)
-		
+		if events.pop(self, None):
+			self.detach()
+
+	def detach(self): pass
+
+	#Returns True if the event made progress, which means
+	#that other events may have become ready as well
 	def update(self): raise NotImplementedError("Event.update")
 
 
-class Socket(Event):
+class FileEvent(Event):
 	def __init__(self, callback, param, socket):
 		super().__init__(callback, param)
 		self.socket = socket
-		
+		self.fd = None
+
+	def attach(self):
+		super().attach()
+		self.fd = watch(self.socket)
+
+	def detach(self):
+		#May be called by the scheduler thread and by the thread
+		#that removes the event at the same time
+		with lock:
+			if self.fd is not None:
+				unwatch(self.fd)
+				self.fd = None
+
+
+class Socket(FileEvent):
 	def update(self):
 		data = self.socket.recv()
 		if data is not None:
+			if not data:
+				#The socket stays readable after it has been
+				#closed, so stop waking up for it
+				self.detach()
 			self.trigger(data)
-			
-			
-class Server(Event):
-	def __init__(self, callback, param, socket):
-		super().__init__(callback, param)
-		self.socket = socket
-		
+			return bool(data)
+		return False
+
+
+class Server(FileEvent):
 	def update(self):
 		client = self.socket.accept()
 		if client is not None:
 			self.trigger(client)
+			return True
+		return False
+
 
-		
 class Timeout(Event):
 	def __init__(self, callback, param, timeout, repeat=False):
 		super().__init__(callback, param)
 		self.timeout = timeout
 		self.repeat = repeat
 
+		self.active = False
+		self.entry = None
+		self.deadline = None
+
+	def attach(self):
+		self.active = True
 		self.reset()
-		
+
+	def kill(self):
+		self.active = False
+		with lock:
+			self.cancel()
+
+	def cancel(self):
+		#The heap entry is left behind and skipped when it is popped
+		if self.entry:
+			self.entry[2] = None
+			self.entry = None
+
 	def update(self):
-		if time.time() > self.deadline:
-			self.trigger()
-			if self.repeat:
-				self.reset()
-			else:
-				self.kill()
-				
+		self.entry = None
+		self.trigger()
+		if self.repeat and self.active:
+			self.reset()
+		else:
+			self.active = False
+		return True
+
 	def reset(self):
-		self.deadline = time.time() + self.timeout
-		
-		
+		self.deadline = time.monotonic() + self.timeout
+		if self.active:
+			with lock:
+				self.cancel()
+				self.entry = [self.deadline, next(counter), self]
+				heapq.heappush(timeouts, self.entry)
+
+
 class Callback(Event):
 	def __init__(self, callback, param):
 		super().__init__(callback, param)
-		
+
+	def attach(self):
+		callbacks[self] = True
+
+	def kill(self):
+		callbacks.pop(self, None)
+
 	def update(self):
 		self.trigger()
-		
-		
+		return False
+
+
 thread = None
-events = []
+events = {}
+callbacks = {}
+timeouts = []
+counter = itertools.count()
 
-		
-def add_socket(callback, socket, param=None):
+lock = threading.RLock()
+#Notified after every pass over the events, so that other
+#threads can wait for a state change without polling
+passed = threading.Condition(threading.Lock())
+selector = None
+watched = {}
+wakeup_reader = None
+wakeup_writer = None
+
+#Set if the scheduler runs on an asyncio event loop
+#instead of its own thread
+loop = None
+loop_timer = None
+loop_pending = False
+
+#Statistics for monitoring. The lag is the time between the
+#deadline of a timeout and the moment it was processed.
+passes = 0
+timeouts_fired = 0
+lag_total = 0
+last_lag = 0
+
+
+def watch(sock):
+	if not hasattr(sock, "fileno"):
+		#Sockets without file descriptor are layered on top of
+		#another socket and are fed by the events of that socket
+		return None
+
+	fd = sock.fileno()
+	if fd < 0:
+		return None
+
+	with lock:
+		if fd in watched:
+			#The file descriptor may have been closed and reused
+			#by another socket, so register it again
+			try:
+				selector.unregister(fd)
+			except (KeyError, ValueError, OSError):
+				pass
+			watched[fd] += 1
+		else:
+			watched[fd] = 1
+		selector.register(fd, selectors.EVENT_READ)
+		if loop:
+			loop.add_reader(fd, schedule)
+	return fd
+
+def unwatch(fd):
+	with lock:
+		watched[fd] -= 1
+		if watched[fd] == 0:
+			del watched[fd]
+			try:
+				selector.unregister(fd)
+			except (KeyError, ValueError, OSError):
+				pass
+			if loop:
+				loop.remove_reader(fd)
+
+def wakeup():
+	if loop:
+		schedule()
+	elif threading.current_thread() != thread:
+		try:
+			wakeup_writer.send(b"\0")
+		except (BlockingIOError, InterruptedError):
+			pass
+
+def add_event(event):
 	start_thread()
-	event = Socket(callback, param, socket)
-	events.append(event)
+	event.attach()
+	wakeup()
 	return event
-	
+
+
+def add_socket(callback, socket, param=None):
+	return add_event(Socket(callback, param, socket))
+
 def add_server(callback, socket, param=None):
-	start_thread()
-	event = Server(callback, param, socket)
-	events.append(event)
-	return event
+	return add_event(Server(callback, param, socket))
 
 def add_timeout(callback, timeout, repeat=False, param=None):
-	start_thread()
-	event = Timeout(callback, param, timeout, repeat)
-	events.append(event)
-	return event
-	
+	return add_event(Timeout(callback, param, timeout, repeat))
+
 def add_callback(callback, param=None):
-	start_thread()
-	event = Callback(callback, param)
-	events.append(event)
-	return event
-	
+	return add_event(Callback(callback, param))
+
 def remove(event):
 	event.kill()
-	
+
+def update_event(event):
+	try:
+		return event.update()
+	except:
+		logger.error("An exception occurred while processing an event")
+		import traceback
+		traceback.print_exc()
+		event.kill()
+	return False
+
+def expired_timeouts():
+	global timeouts_fired, lag_total, last_lag
+	expired = []
+	now = time.monotonic()
+	with lock:
+		while timeouts and timeouts[0][0] <= now:
+			entry = heapq.heappop(timeouts)
+			if entry[2]:
+				expired.append(entry)
+		if expired:
+			#The first timeout is the one that is most late
+			last_lag = now - expired[0][0]
+			lag_total += last_lag
+			timeouts_fired += len(expired)
+	return expired
+
+def next_deadline():
+	with lock:
+		while timeouts and timeouts[0][2] is None:
+			heapq.heappop(timeouts)
+		if timeouts:
+			return timeouts[0][0]
+
 def process_events():
-	for event in events[:]:
-		try:
-			event.update()
-		except:
-			logger.error("An exception occurred while processing an event")
-			import traceback
-			traceback.print_exc()
-			event.kill()
-	
+	#Returns True if events were still making progress
+	#when the maximum number of passes was reached
+	global passes
+	for i in range(MAX_PASSES):
+		passes += 1
+		progress = False
+		for entry in expired_timeouts():
+			#Skip timeouts that were removed or reset by
+			#another event during this pass
+			if entry[2] and update_event(entry[2]):
+				progress = True
+		#Events may have been removed by an earlier event during
+		#this pass or by another thread, so skip those
+		for event in list(events):
+			if event in events and update_event(event):
+				progress = True
+		for event in list(callbacks):
+			if event in callbacks:
+				update_event(event)
+		with passed:
+			passed.notify_all()
+		if not progress:
+			return False
+	return True
+
+def count_timeouts():
+	with lock:
+		return sum(1 for entry in timeouts if entry[2])
+
+def wait(limit=None):
+	timeout = limit
+	if callbacks and (timeout is None or timeout > POLL_INTERVAL):
+		timeout = POLL_INTERVAL
+
+	deadline = next_deadline()
+	if deadline is not None:
+		delay = max(deadline - time.monotonic(), 0)
+		if timeout is None or delay < timeout:
+			timeout = delay
+
+	try:
+		ready = selector.select(timeout)
+	except (ValueError, OSError):
+		#One of the sockets was closed without removing its event
+		logger.debug("Selector failed, falling back to polling")
+		time.sleep(POLL_INTERVAL)
+		return
+
+	for key, mask in ready:
+		if key.fd == wakeup_reader.fileno():
+			try:
+				while wakeup_reader.recv(4096): pass
+			except (BlockingIOError, InterruptedError):
+				pass
+
 def update():
 	if threading.current_thread() == thread:
 		process_events()
-	time.sleep(0.02)
+		wait(POLL_INTERVAL)
+	else:
+		#Returns as soon as the events have been processed
+		with passed:
+			passed.wait(POLL_INTERVAL)
+
+def wait_until(predicate, timeout=None):
+	#Blocks until predicate() is true and returns its result, or
+	#returns the falsy result once the timeout expires. The
+	#predicate is checked after every pass over the events.
+	#Blocking calls on the scheduler thread process the events
+	#themselves, which means that they still poll.
+	deadline = None
+	if timeout is not None:
+		deadline = time.monotonic() + timeout
+	
+	if threading.current_thread() == thread:
+		while True:
+			result = predicate()
+			if result: return result
+			
+			remaining = POLL_INTERVAL
+			if deadline is not None:
+				remaining = min(deadline - time.monotonic(), remaining)
+				if remaining <= 0: return result
+			process_events()
+			wait(remaining)
+	
+	with passed:
+		while True:
+			result = predicate()
+			if result: return result
+			
+			#The state may also be changed by another thread
+			#without waking up the scheduler, so never sleep
+			#for too long
+			remaining = 1
+			if deadline is not None:
+				remaining = min(deadline - time.monotonic(), remaining)
+				if remaining <= 0: return result
+			passed.wait(remaining)
+
+def init():
+	global selector, wakeup_reader, wakeup_writer
+	selector = selectors.DefaultSelector()
+	wakeup_reader, wakeup_writer = socket.socketpair()
+	wakeup_reader.setblocking(False)
+	wakeup_writer.setblocking(False)
+	selector.register(wakeup_reader, selectors.EVENT_READ)
 
 def start_thread():
 	global thread
-	if not thread:
-		thread = threading.Thread(target=event_loop, daemon=True)
-		thread.start()
+	with lock:
+		if not thread:
+			init()
+			thread = threading.Thread(target=event_loop, daemon=True)
+			thread.start()
 
 def event_loop():
 	while True:
-		process_events()
-		time.sleep(0.02)
+		if process_events():
+			#Some events still have work to do
+			wait(0)
+		else:
+			wait()
+		
+def attach_loop(event_loop):
+	#Runs the scheduler on the given asyncio event loop instead
+	#of a background thread. This must be called from the thread
+	#that runs the loop, before any event is added. The loop must
+	#support add_reader, which rules out the proactor loop.
+	global thread, loop
+	with lock:
+		if thread:
+			raise RuntimeError("Scheduler is already running")
+		init()
+		thread = threading.current_thread()
+		loop = event_loop
+
+def schedule():
+	#Requests a pass over the events from the asyncio loop
+	global loop_pending
+	with lock:
+		if loop_pending:
+			return
+		loop_pending = True
+	if threading.current_thread() == thread:
+		loop.call_soon(loop_update)
+	else:
+		loop.call_soon_threadsafe(loop_update)
+
+def loop_update():
+	global loop_pending, loop_timer
+	with lock:
+		loop_pending = False
+		
+	busy = process_events()
+	
+	if loop_timer:
+		loop_timer.cancel()
+		loop_timer = None
+	
+	#Events that still have work to do take priority over
+	#polling the callbacks
+	delay = None
+	if callbacks:
+		delay = POLL_INTERVAL
+	if busy:
+		delay = 0
+	
+	deadline = next_deadline()
+	if deadline is not None:
+		remaining = max(deadline - time.monotonic(), 0)
+		if delay is None or remaining < delay:
+			delay = remaining
+	
+	if delay is not None:
+		loop_timer = loop.call_later(delay, loop_update)
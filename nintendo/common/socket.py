@@ -1,6 +1,7 @@
 
 from nintendo.common import scheduler
 import pkg_resources
+import collections
 import socket
 import ssl
 
@@ -11,6 +12,14 @@ CERT = pkg_resources.resource_filename("nintendo", "files/cert/server_default.cr
 KEY = pkg_resources.resource_filename("nintendo", "files/cert/server_default.key")
 
 
+def enable_reuse_port(s):
+	#Lets multiple processes bind the same port. The kernel
+	#distributes incoming traffic by source address.
+	if not hasattr(socket, "SO_REUSEPORT"):
+		raise RuntimeError("SO_REUSEPORT is not supported on this platform")
+	s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+
 TYPE_UDP = 0
 TYPE_TCP = 1
 TYPE_SSL = 2
@@ -31,11 +40,24 @@ class Socket:
 		self.certfile = None
 		self.keyfile = None
 		
+		self.reuse_port = False
+		self.receive_buffer = None
+		
 	def set_certificate(self, certfile, keyfile):
 		self.certfile = certfile
 		self.keyfile = keyfile
 		
+	def set_reuse_port(self, enabled):
+		self.reuse_port = enabled
+		
+	def set_receive_buffer(self, size):
+		self.receive_buffer = size
+		
 	def bind(self, host, port):
+		if self.reuse_port:
+			enable_reuse_port(self.s)
+		if self.receive_buffer:
+			self.s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer)
 		self.s.bind((host, port))
 		self.s.setblocking(False)
 		
@@ -90,47 +112,90 @@ class Socket:
 		except (BlockingIOError, ConnectionResetError):
 			pass
 			
+	def fileno(self): return self.s.fileno()
 	def local_address(self): return self.s.getsockname()
 	def remote_address(self): return self.remote_addr
 	
 	
 class UDPServer:
+	#Maximum number of datagrams that are read at once
+	BATCH_SIZE = 256
+	
+	#Maximum number of datagrams that are queued per peer
+	QUEUE_LIMIT = 1024
+
 	def __init__(self):
 		self.s = self.s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-		self.incoming = []
+		self.incoming = collections.deque()
 		self.packets = {}
 		
+		self.reuse_port = False
+		self.receive_buffer = None
+		
+		self.queued = 0
+		self.delivered = 0
+		self.dropped = 0
+		
+	def set_reuse_port(self, enabled):
+		self.reuse_port = enabled
+		
+	def set_receive_buffer(self, size):
+		self.receive_buffer = size
+		
 	def bind(self, host, port):
+		if self.reuse_port:
+			enable_reuse_port(self.s)
+		if self.receive_buffer:
+			self.s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer)
 		self.s.bind((host, port))
 	
 	def listen(self):
 		self.s.setblocking(False)
-		scheduler.add_callback(self.update)
+		scheduler.add_socket(self.update, self)
+		
+	def fileno(self): return self.s.fileno()
 		
 	def remove(self, addr):
 		del self.packets[addr]
 		
 	def recvfrom(self, addr):
-		if self.packets[addr]:
-			return self.packets[addr].pop(0)
+		queue = self.packets[addr]
+		if queue:
+			self.delivered += 1
+			return queue.popleft()
 	
 	def sendto(self, addr, data):
 		self.s.sendto(data, addr)
 		
-	def update(self):
-		try:
-			data, addr = self.s.recvfrom(4096)
-			if addr not in self.packets:
-				sock = UDPWrapper(self, addr)
-				self.packets[addr] = []
-				self.incoming.append(sock)
-			self.packets[addr].append(data)
-		except (BlockingIOError, ConnectionResetError):
-			pass
+	def recv(self):
+		#Drains the socket until it would block, so that the
+		#kernel buffer does not overflow between two ticks
+		batch = []
+		recvfrom = self.s.recvfrom
+		for i in range(self.BATCH_SIZE):
+			try:
+				batch.append(recvfrom(4096))
+			except (BlockingIOError, ConnectionResetError):
+				break
+		if batch:
+			return batch
+		
+	def update(self, batch):
+		packets = self.packets
+		for data, addr in batch:
+			queue = packets.get(addr)
+			if queue is None:
+				queue = packets[addr] = collections.deque()
+				self.incoming.append(UDPWrapper(self, addr))
+			if len(queue) >= self.QUEUE_LIMIT:
+				self.dropped += 1
+			else:
+				queue.append(data)
+				self.queued += 1
 			
 	def accept(self):
 		if self.incoming:
-			return self.incoming.pop(0)
+			return self.incoming.popleft()
 			
 			
 class UDPWrapper:
@@ -162,15 +227,26 @@ class SocketServer:
 		self.certfile = None
 		self.keyfile = None
 		
+		self.reuse_port = False
+		self.receive_buffer = None
+		
 		self.incoming = []
 		
 	def set_certificate(self, certfile, keyfile):
 		self.certfile = certfile
 		self.keyfile = keyfile
 		
+	def set_reuse_port(self, enabled):
+		self.reuse_port = enabled
+		
+	def set_receive_buffer(self, size):
+		self.receive_buffer = size
+		
 	def start(self, host, port):
 		if self.type == TYPE_SSL:
 			self.socket.set_certificate(self.certfile, self.keyfile)
+		self.socket.set_reuse_port(self.reuse_port)
+		self.socket.set_receive_buffer(self.receive_buffer)
 		self.socket.bind(host, port)
 		self.socket.listen()
 		scheduler.add_server(self.incoming.append, self.socket)
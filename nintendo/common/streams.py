@@ -2,9 +2,45 @@
 import struct
 
 
+class StructTable:
+	def __init__(self, endian):
+		self.u16 = struct.Struct(endian + "H")
+		self.u32 = struct.Struct(endian + "I")
+		self.u64 = struct.Struct(endian + "Q")
+		
+		self.s8 = struct.Struct("b")
+		self.s16 = struct.Struct(endian + "h")
+		self.s32 = struct.Struct(endian + "i")
+		self.s64 = struct.Struct(endian + "q")
+		
+		self.float = struct.Struct(endian + "f")
+		self.double = struct.Struct(endian + "d")
+		
+
+struct_tables = {}
+
+def get_struct_table(endian):
+	if endian not in struct_tables:
+		struct_tables[endian] = StructTable(endian)
+	return struct_tables[endian]
+	
+
+#Primitives that can be packed or unpacked in bulk by repeat
+ARRAY_FORMATS = {
+	"u8": "B", "u16": "H", "u32": "I", "u64": "Q",
+	"s8": "b", "s16": "h", "s32": "i", "s64": "q",
+	"float": "f", "double": "d"
+}
+
+def array_format(stream, func):
+	if getattr(func, "__self__", None) is stream:
+		return ARRAY_FORMATS.get(func.__name__)
+
+
 class StreamOut:
 	def __init__(self, endian="<"):
 		self.endian = endian
+		self.structs = get_struct_table(endian)
 		self.data = bytearray()
 		self.pos = 0
 		self.stack = []
@@ -24,7 +60,10 @@ class StreamOut:
 	def eof(self): return self.pos >= len(self.data)
 		
 	def write(self, data):
-		self.data[self.pos : self.pos + len(data)] = data
+		if self.pos == len(self.data):
+			self.data += data
+		else:
+			self.data[self.pos : self.pos + len(data)] = data
 		self.pos += len(data)
 		
 	def pad(self, num, char=b"\0"):
@@ -34,17 +73,17 @@ class StreamOut:
 		self.write(data.encode("ascii"))
 		
 	def u8(self, value): self.write(bytes([value]))
-	def u16(self, value): self.write(struct.pack(self.endian + "H", value))
-	def u32(self, value): self.write(struct.pack(self.endian + "I", value))
-	def u64(self, value): self.write(struct.pack(self.endian + "Q", value))
+	def u16(self, value): self.write(self.structs.u16.pack(value))
+	def u32(self, value): self.write(self.structs.u32.pack(value))
+	def u64(self, value): self.write(self.structs.u64.pack(value))
 	
-	def s8(self, value): self.write(struct.pack("b", value))
-	def s16(self, value): self.write(struct.pack(self.endian + "h", value))
-	def s32(self, value): self.write(struct.pack(self.endian + "i", value))
-	def s64(self, value): self.write(struct.pack(self.endian + "q", value))
+	def s8(self, value): self.write(self.structs.s8.pack(value))
+	def s16(self, value): self.write(self.structs.s16.pack(value))
+	def s32(self, value): self.write(self.structs.s32.pack(value))
+	def s64(self, value): self.write(self.structs.s64.pack(value))
 	
-	def float(self, value): self.write(struct.pack(self.endian + "f", value))
-	def double(self, value): self.write(struct.pack(self.endian + "d", value))
+	def float(self, value): self.write(self.structs.float.pack(value))
+	def double(self, value): self.write(self.structs.double.pack(value))
 	
 	def bool(self, value): self.u8(1 if value else 0)
 	def char(self, value): self.u8(ord(value))
@@ -53,14 +92,30 @@ class StreamOut:
 	def chars(self, data): self.repeat(data, self.char)
 	def wchars(self, data): self.repeat(data, self.wchar)
 	
+	def fields(self, codec, *values):
+		self.write(codec.pack(*values))
+		
+	def array(self, format, values):
+		self.write(struct.pack(self.endian + "%i%s" %(len(values), format), *values))
+		
+	def u8_array(self, values): self.array("B", values)
+	def u16_array(self, values): self.array("H", values)
+	def u32_array(self, values): self.array("I", values)
+	def u64_array(self, values): self.array("Q", values)
+	
 	def repeat(self, list, func):
-		for value in list:
-			func(value)
+		format = array_format(self, func)
+		if format:
+			self.array(format, list)
+		else:
+			for value in list:
+				func(value)
 
 
 class StreamIn:
 	def __init__(self, data, endian="<"):
 		self.endian = endian
+		self.structs = get_struct_table(endian)
 		self.data = data
 		self.pos = 0
 		
@@ -85,18 +140,32 @@ class StreamIn:
 	def ascii(self, num):
 		return self.read(num).decode("ascii")
 		
-	def u8(self): return self.read(1)[0]
-	def u16(self): return struct.unpack(self.endian + "H", self.read(2))[0]
-	def u32(self): return struct.unpack(self.endian + "I", self.read(4))[0]
-	def u64(self): return struct.unpack(self.endian + "Q", self.read(8))[0]
+	def unpack(self, codec):
+		value = codec.unpack_from(self.data, self.pos)[0]
+		self.pos += codec.size
+		return value
+		
+	def fields(self, codec):
+		values = codec.unpack_from(self.data, self.pos)
+		self.pos += codec.size
+		return values
+		
+	def u8(self):
+		value = self.data[self.pos]
+		self.pos += 1
+		return value
+		
+	def u16(self): return self.unpack(self.structs.u16)
+	def u32(self): return self.unpack(self.structs.u32)
+	def u64(self): return self.unpack(self.structs.u64)
 	
-	def s8(self): return struct.unpack("b", self.read(1))[0]
-	def s16(self): return struct.unpack(self.endian + "h", self.read(2))[0]
-	def s32(self): return struct.unpack(self.endian + "i", self.read(4))[0]
-	def s64(self): return struct.unpack(self.endian + "q", self.read(8))[0]
+	def s8(self): return self.unpack(self.structs.s8)
+	def s16(self): return self.unpack(self.structs.s16)
+	def s32(self): return self.unpack(self.structs.s32)
+	def s64(self): return self.unpack(self.structs.s64)
 	
-	def float(self): return struct.unpack(self.endian + "f", self.read(4))[0]
-	def double(self): return struct.unpack(self.endian + "d", self.read(8))[0]
+	def float(self): return self.unpack(self.structs.float)
+	def double(self): return self.unpack(self.structs.double)
 	
 	def bool(self): return bool(self.u8())
 	def char(self): return chr(self.u8())
@@ -105,7 +174,19 @@ class StreamIn:
 	def chars(self, num): return "".join(self.repeat(self.char, num))
 	def wchars(self, num): return "".join(self.repeat(self.wchar, num))
 	
+	def array(self, format, count):
+		values = struct.unpack(self.endian + "%i%s" %(count, format), self.read(count * struct.calcsize(format)))
+		return list(values)
+		
+	def u8_array(self, count): return self.array("B", count)
+	def u16_array(self, count): return self.array("H", count)
+	def u32_array(self, count): return self.array("I", count)
+	def u64_array(self, count): return self.array("Q", count)
+	
 	def repeat(self, func, count):
+		format = array_format(self, func)
+		if format:
+			return self.array(format, count)
 		return [func() for i in range(count)]
 		
 		
@@ -173,6 +254,17 @@ class BitStreamIn(StreamIn):
 		self.pos = pos
 		self.bitpos = bitpos
 		
+	def unpack(self, codec):
+		return self.fields(codec)[0]
+		
+	def fields(self, codec):
+		if self.bitpos == 0: #Fast method
+			return super().fields(codec)
+		else: #Slow method
+			return codec.unpack(self.read(codec.size))
+		
+	def u8(self): return self.read(1)[0]
+		
 	def bytealign(self):
 		if self.bitpos != 0:
 			self.pos += 1
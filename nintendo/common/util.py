@@ -22,3 +22,34 @@ def crc16(data):
 				
 		hash ^= char
 	return hash
+
+
+class FragmentBuffer:
+	#Collects the fragments of a message and joins them once the
+	#message is complete. Messages larger than limit are dropped.
+	def __init__(self, limit=None):
+		self.limit = limit
+		self.chunks = []
+		self.size = 0
+		self.overflow = False
+		
+	def append(self, data):
+		self.size += len(data)
+		if self.limit and self.size > self.limit:
+			self.chunks = []
+			self.overflow = True
+		if not self.overflow:
+			self.chunks.append(data)
+			
+	def join(self):
+		#Returns None if the message was too large
+		data = None
+		if not self.overflow:
+			data = b"".join(self.chunks)
+		self.clear()
+		return data
+		
+	def clear(self):
+		self.chunks = []
+		self.size = 0
+		self.overflow = False
@@ -1,9 +1,10 @@
 
-from . import socket, scheduler
+from . import socket, scheduler, util
 import hashlib
 import secrets
 import struct
 import base64
+import time
 
 import logging
 logger = logging.getLogger(__name__)
@@ -53,10 +54,18 @@ class WebSocketClient:
 		self.state = STATE_READY
 		self.socket_event = None
 		
-		self.buffer = b""
-		self.fragments = None
+		#Received data is consumed from the buffer by offset, the
+		#buffer is only compacted once most of it has been parsed
+		self.buffer = bytearray()
+		self.offset = 0
+		
+		self.fragments = util.FragmentBuffer()
 		self.message_type = None
 		self.packets = []
+		
+		self.frame_count = 0
+		self.byte_count = 0
+		self.parse_time = 0
 
 	def connect(self, host, port, timeout=None):
 		if self.state != STATE_READY:
@@ -82,8 +91,7 @@ class WebSocketClient:
 		handshake = self.handshake_template %(path, host, self.key, self.protocol)
 		self.sock.send(handshake.encode("ascii"))
 		
-		while self.state == STATE_CONNECTING:
-			scheduler.update()
+		scheduler.wait_until(lambda: self.state != STATE_CONNECTING)
 		if self.state != STATE_CONNECTED:
 			logger.error("Websocket connection failed")
 			return False
@@ -99,8 +107,7 @@ class WebSocketClient:
 			
 		self.socket_event = scheduler.add_socket(self.handle_recv, self.sock)
 		
-		while self.state == STATE_ACCEPTING:
-			scheduler.update()
+		scheduler.wait_until(lambda: self.state != STATE_ACCEPTING)
 		return self.state == STATE_CONNECTED
 		
 	def cleanup(self):
@@ -126,14 +133,32 @@ class WebSocketClient:
 		if not data:
 			logger.debug("Connection was closed")
 			return self.cleanup()
-	
+		
+		start = time.perf_counter()
+		
 		self.buffer += data
-		while self.buffer:
+		self.byte_count += len(data)
+		self.parse_buffer()
+		
+		if self.offset == len(self.buffer):
+			self.buffer.clear()
+			self.offset = 0
+		elif self.offset > len(self.buffer) // 2:
+			del self.buffer[:self.offset]
+			self.offset = 0
+		
+		self.parse_time += time.perf_counter() - start
+		
+	def parse_buffer(self):
+		while self.offset < len(self.buffer):
 			if self.state == STATE_CONNECTING:
-				if b"\r\n\r\n" not in self.buffer:
+				end = self.buffer.find(b"\r\n\r\n", self.offset)
+				if end < 0:
 					return
 
-				response, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+				response = self.buffer[self.offset : end]
+				self.offset = end + 4
+				
 				lines = response.decode("ascii").splitlines()
 				if not lines[0].startswith("HTTP/1.1"):
 					logger.error("Invalid handshake response")
@@ -152,10 +177,13 @@ class WebSocketClient:
 				self.state = STATE_CONNECTED
 					
 			elif self.state == STATE_ACCEPTING:
-				if b"\r\n\r\n" not in self.buffer:
+				end = self.buffer.find(b"\r\n\r\n", self.offset)
+				if end < 0:
 					return
 				
-				request, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+				request = self.buffer[self.offset : end]
+				self.offset = end + 4
+				
 				lines = request.decode("ascii").splitlines()
 				
 				if not lines[0].startswith("GET") or "HTTP/1.1" not in lines[0]:
@@ -181,48 +209,66 @@ class WebSocketClient:
 				self.state = STATE_CONNECTED
 					
 			elif self.state == STATE_CONNECTED:
-				if len(self.buffer) < 2: return
-
-				fin = self.buffer[0] >> 7
-				opcode = self.buffer[0] & 0xF
-				mask = self.buffer[1] >> 7
-				size = self.buffer[1] & 0x7F
+				if not self.parse_frame():
+					return
+			
+			else:
+				return
 				
-				offset = 2
-				if size == 126:
-					if len(self.buffer) < offset + 2: return
-					size = struct.unpack_from(">H", self.buffer, offset)[0]
-					offset += 2
-				elif size == 127:
-					if len(self.buffer) < offset + 8: return
-					size = struct.unpack_from(">Q", self.buffer, 2)[0]
-					offset += 8
+	def parse_frame(self):
+		#Returns False if the frame is incomplete or invalid
+		buffer = self.buffer
+		offset = self.offset
+		available = len(buffer) - offset
+		if available < 2: return False
 
-				mask_key = b"\0\0\0\0"
-				if mask:
-					if len(self.buffer) < offset + 4: return
-					mask_key = self.buffer[offset : offset + 4]
-					offset += 4
-					
-				if len(self.buffer) < offset + size: return
-				payload = self.apply_mask(self.buffer[offset : offset + size], mask_key)
-				
-				if opcode == OPCODE_CONTINUE:
-					if self.message_type not in [OPCODE_TEXT, OPCODE_BINARY]:
-						logger.error("Invalid continuation frame received")
-						return self.cleanup()
-					self.fragments += payload
-				else:
-					self.fragments = payload
-					self.message_type = opcode
-				
-				if fin:
-					self.process_packet(opcode, self.fragments)
-					self.fragments = None
-					self.message_type = None
-				
-				self.buffer = self.buffer[offset + size:]
-				
+		fin = buffer[offset] >> 7
+		opcode = buffer[offset] & 0xF
+		mask = buffer[offset + 1] >> 7
+		size = buffer[offset + 1] & 0x7F
+		
+		header = 2
+		if size == 126:
+			if available < 4: return False
+			size = struct.unpack_from(">H", buffer, offset + 2)[0]
+			header = 4
+		elif size == 127:
+			if available < 10: return False
+			size = struct.unpack_from(">Q", buffer, offset + 2)[0]
+			header = 10
+		
+		if mask:
+			header += 4
+		
+		if available < header + size: return False
+		
+		start = offset + header
+		if mask:
+			payload = self.apply_mask(buffer[start : start + size], buffer[start - 4 : start])
+		else:
+			payload = bytes(buffer[start : start + size])
+		
+		self.offset = start + size
+		self.frame_count += 1
+		
+		if opcode == OPCODE_CONTINUE:
+			if self.message_type not in [OPCODE_TEXT, OPCODE_BINARY]:
+				logger.error("Invalid continuation frame received")
+				self.cleanup()
+				return False
+			self.fragments.append(payload)
+		else:
+			self.fragments.clear()
+			self.fragments.append(payload)
+			self.message_type = opcode
+		
+		if fin:
+			#The opcode of the message is in its first frame
+			message_type = self.message_type
+			self.message_type = None
+			self.process_packet(message_type, self.fragments.join())
+		return True
+		
 	def process_packet(self, opcode, payload):
 		if opcode == OPCODE_BINARY:
 			self.packets.append(payload)
@@ -231,7 +277,11 @@ class WebSocketClient:
 			self.cleanup()
 		
 	def apply_mask(self, data, key):
-		return bytes([data[i] ^ key[i % 4] for i in range(len(data))])
+		#XOR the whole payload at once as one big integer
+		size = len(data)
+		mask = (bytes(key) * (size // 4 + 1))[:size]
+		value = int.from_bytes(data, "little") ^ int.from_bytes(mask, "little")
+		return value.to_bytes(size, "little")
 		
 	def send_packet(self, opcode, payload=b""):
 		data = bytes([0x80 | opcode])
@@ -281,6 +331,12 @@ class WebSocketServer:
 				
 		self.sockets = []
 		
+	def set_reuse_port(self, enabled):
+		self.server.set_reuse_port(enabled)
+		
+	def set_receive_buffer(self, size):
+		self.server.set_receive_buffer(size)
+		
 	def start(self, host, port):
 		self.server.start(host, port)
 		scheduler.add_server(self.handle, self.server)
@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -110,6 +111,9 @@ class AccountClient(AccountProtocol):
 		self.client = client
 	
 	def create_account(self, name, key, groups, email):
+		return self.client.wait(self.create_account_async(name, key, groups, email))
+	
+	def create_account_async(self, name, key, groups, email):
 		logger.info("AccountClient.create_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CREATE_ACCOUNT)
@@ -117,271 +121,331 @@ class AccountClient(AccountProtocol):
 		stream.string(key)
 		stream.u32(groups)
 		stream.string(email)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.result()
-		logger.info("AccountClient.create_account -> done")
-		return result
+		def decode(stream):
+			result = stream.result()
+			logger.info("AccountClient.create_account -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def delete_account(self, pid):
+		return self.client.wait(self.delete_account_async(pid))
+	
+	def delete_account_async(self, pid):
 		logger.info("AccountClient.delete_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_DELETE_ACCOUNT)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.delete_account -> done")
+		def decode(stream):
+			logger.info("AccountClient.delete_account -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def disable_account(self, pid, until, message):
+		return self.client.wait(self.disable_account_async(pid, until, message))
+	
+	def disable_account_async(self, pid, until, message):
 		logger.info("AccountClient.disable_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_DISABLE_ACCOUNT)
 		stream.pid(pid)
 		stream.datetime(until)
 		stream.string(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.result()
-		logger.info("AccountClient.disable_account -> done")
-		return result
+		def decode(stream):
+			result = stream.result()
+			logger.info("AccountClient.disable_account -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def change_password(self, new_key):
+		return self.client.wait(self.change_password_async(new_key))
+	
+	def change_password_async(self, new_key):
 		logger.info("AccountClient.change_password()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CHANGE_PASSWORD)
 		stream.string(new_key)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("AccountClient.change_password -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("AccountClient.change_password -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def test_capability(self, capability):
+		return self.client.wait(self.test_capability_async(capability))
+	
+	def test_capability_async(self, capability):
 		logger.info("AccountClient.test_capability()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_TEST_CAPABILITY)
 		stream.u32(capability)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("AccountClient.test_capability -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("AccountClient.test_capability -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def get_name(self, pid):
+		return self.client.wait(self.get_name_async(pid))
+	
+	def get_name_async(self, pid):
 		logger.info("AccountClient.get_name()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_NAME)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		name = stream.string()
-		logger.info("AccountClient.get_name -> done")
-		return name
+		def decode(stream):
+			name = stream.string()
+			logger.info("AccountClient.get_name -> done")
+			return name
+		return self.client.call(stream, call_id, decode)
 	
 	def get_account_data(self):
+		return self.client.wait(self.get_account_data_async())
+	
+	def get_account_data_async(self):
 		logger.info("AccountClient.get_account_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_ACCOUNT_DATA)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.result()
-		obj.data = stream.extract(AccountData)
-		logger.info("AccountClient.get_account_data -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.result()
+			obj.data = stream.extract(AccountData)
+			logger.info("AccountClient.get_account_data -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_private_data(self):
+		return self.client.wait(self.get_private_data_async())
+	
+	def get_private_data_async(self):
 		logger.info("AccountClient.get_private_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_PRIVATE_DATA)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.bool()
-		obj.data = stream.anydata()
-		logger.info("AccountClient.get_private_data -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.bool()
+			obj.data = stream.anydata()
+			logger.info("AccountClient.get_private_data -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_public_data(self, pid):
+		return self.client.wait(self.get_public_data_async(pid))
+	
+	def get_public_data_async(self, pid):
 		logger.info("AccountClient.get_public_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_PUBLIC_DATA)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.bool()
-		obj.data = stream.anydata()
-		logger.info("AccountClient.get_public_data -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.bool()
+			obj.data = stream.anydata()
+			logger.info("AccountClient.get_public_data -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_multiple_public_data(self, pids):
+		return self.client.wait(self.get_multiple_public_data_async(pids))
+	
+	def get_multiple_public_data_async(self, pids):
 		logger.info("AccountClient.get_multiple_public_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_MULTIPLE_PUBLIC_DATA)
 		stream.list(pids, stream.pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.bool()
-		obj.data = stream.list(stream.anydata)
-		logger.info("AccountClient.get_multiple_public_data -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.bool()
+			obj.data = stream.list(stream.anydata)
+			logger.info("AccountClient.get_multiple_public_data -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def update_account_name(self, name):
+		return self.client.wait(self.update_account_name_async(name))
+	
+	def update_account_name_async(self, name):
 		logger.info("AccountClient.update_account_name()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_ACCOUNT_NAME)
 		stream.string(name)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.result()
-		logger.info("AccountClient.update_account_name -> done")
-		return result
+		def decode(stream):
+			result = stream.result()
+			logger.info("AccountClient.update_account_name -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def update_account_email(self, email):
+		return self.client.wait(self.update_account_email_async(email))
+	
+	def update_account_email_async(self, email):
 		logger.info("AccountClient.update_account_email()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_ACCOUNT_EMAIL)
 		stream.string(email)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.result()
-		logger.info("AccountClient.update_account_email -> done")
-		return result
+		def decode(stream):
+			result = stream.result()
+			logger.info("AccountClient.update_account_email -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def update_custom_data(self, public_data, private_data):
+		return self.client.wait(self.update_custom_data_async(public_data, private_data))
+	
+	def update_custom_data_async(self, public_data, private_data):
 		logger.info("AccountClient.update_custom_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_CUSTOM_DATA)
 		stream.anydata(public_data)
 		stream.anydata(private_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.result()
-		logger.info("AccountClient.update_custom_data -> done")
-		return result
+		def decode(stream):
+			result = stream.result()
+			logger.info("AccountClient.update_custom_data -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def find_by_name_regex(self, groups, regex, range):
+		return self.client.wait(self.find_by_name_regex_async(groups, regex, range))
+	
+	def find_by_name_regex_async(self, groups, regex, range):
 		logger.info("AccountClient.find_by_name_regex()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_FIND_BY_NAME_REGEX)
 		stream.u32(groups)
 		stream.string(regex)
 		stream.add(range)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		accounts = stream.list(BasicAccountInfo)
-		logger.info("AccountClient.find_by_name_regex -> done")
-		return accounts
+		def decode(stream):
+			accounts = stream.list(BasicAccountInfo)
+			logger.info("AccountClient.find_by_name_regex -> done")
+			return accounts
+		return self.client.call(stream, call_id, decode)
 	
 	def update_account_expiry_date(self, pid, expiry, message):
+		return self.client.wait(self.update_account_expiry_date_async(pid, expiry, message))
+	
+	def update_account_expiry_date_async(self, pid, expiry, message):
 		logger.info("AccountClient.update_account_expiry_date()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_ACCOUNT_EXPIRY_DATE)
 		stream.pid(pid)
 		stream.datetime(expiry)
 		stream.string(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.update_account_expiry_date -> done")
+		def decode(stream):
+			logger.info("AccountClient.update_account_expiry_date -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def update_account_effective_date(self, pid, effective_from, message):
+		return self.client.wait(self.update_account_effective_date_async(pid, effective_from, message))
+	
+	def update_account_effective_date_async(self, pid, effective_from, message):
 		logger.info("AccountClient.update_account_effective_date()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_ACCOUNT_EFFECTIVE_DATE)
 		stream.pid(pid)
 		stream.datetime(effective_from)
 		stream.string(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.update_account_effective_date -> done")
+		def decode(stream):
+			logger.info("AccountClient.update_account_effective_date -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def update_status(self, status):
+		return self.client.wait(self.update_status_async(status))
+	
+	def update_status_async(self, status):
 		logger.info("AccountClient.update_status()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_STATUS)
 		stream.string(status)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.update_status -> done")
+		def decode(stream):
+			logger.info("AccountClient.update_status -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_status(self, pid):
+		return self.client.wait(self.get_status_async(pid))
+	
+	def get_status_async(self, pid):
 		logger.info("AccountClient.get_status()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_STATUS)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		status = stream.string()
-		logger.info("AccountClient.get_status -> done")
-		return status
+		def decode(stream):
+			status = stream.string()
+			logger.info("AccountClient.get_status -> done")
+			return status
+		return self.client.call(stream, call_id, decode)
 	
 	def get_last_connection_stats(self, pid):
+		return self.client.wait(self.get_last_connection_stats_async(pid))
+	
+	def get_last_connection_stats_async(self, pid):
 		logger.info("AccountClient.get_last_connection_stats()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_LAST_CONNECTION_STATS)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.last_session_login = stream.datetime()
-		obj.last_session_logout = stream.datetime()
-		obj.current_session_login = stream.datetime()
-		logger.info("AccountClient.get_last_connection_stats -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.last_session_login = stream.datetime()
+			obj.last_session_logout = stream.datetime()
+			obj.current_session_login = stream.datetime()
+			logger.info("AccountClient.get_last_connection_stats -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def reset_password(self):
+		return self.client.wait(self.reset_password_async())
+	
+	def reset_password_async(self):
 		logger.info("AccountClient.reset_password()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_RESET_PASSWORD)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("AccountClient.reset_password -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("AccountClient.reset_password -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def create_account_with_custom_data(self, name, key, groups, email, public_data, private_data):
+		return self.client.wait(self.create_account_with_custom_data_async(name, key, groups, email, public_data, private_data))
+	
+	def create_account_with_custom_data_async(self, name, key, groups, email, public_data, private_data):
 		logger.info("AccountClient.create_account_with_custom_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CREATE_ACCOUNT_WITH_CUSTOM_DATA)
@@ -391,28 +455,34 @@ class AccountClient(AccountProtocol):
 		stream.string(email)
 		stream.anydata(public_data)
 		stream.anydata(private_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.create_account_with_custom_data -> done")
+		def decode(stream):
+			logger.info("AccountClient.create_account_with_custom_data -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def retrieve_account(self):
+		return self.client.wait(self.retrieve_account_async())
+	
+	def retrieve_account_async(self):
 		logger.info("AccountClient.retrieve_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_RETRIEVE_ACCOUNT)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.account_data = stream.extract(AccountData)
-		obj.public_data = stream.anydata()
-		obj.private_data = stream.anydata()
-		logger.info("AccountClient.retrieve_account -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.account_data = stream.extract(AccountData)
+			obj.public_data = stream.anydata()
+			obj.private_data = stream.anydata()
+			logger.info("AccountClient.retrieve_account -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def update_account(self, key, email, public_data, private_data):
+		return self.client.wait(self.update_account_async(key, email, public_data, private_data))
+	
+	def update_account_async(self, key, email, public_data, private_data):
 		logger.info("AccountClient.update_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_ACCOUNT)
@@ -420,41 +490,50 @@ class AccountClient(AccountProtocol):
 		stream.string(email)
 		stream.anydata(public_data)
 		stream.anydata(private_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.update_account -> done")
+		def decode(stream):
+			logger.info("AccountClient.update_account -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def change_password_by_guest(self, name, email, key):
+		return self.client.wait(self.change_password_by_guest_async(name, email, key))
+	
+	def change_password_by_guest_async(self, name, email, key):
 		logger.info("AccountClient.change_password_by_guest()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CHANGE_PASSWORD_BY_GUEST)
 		stream.string(name)
 		stream.string(email)
 		stream.string(key)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("AccountClient.change_password_by_guest -> done")
+		def decode(stream):
+			logger.info("AccountClient.change_password_by_guest -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def find_by_name_like(self, groups, like, range):
+		return self.client.wait(self.find_by_name_like_async(groups, like, range))
+	
+	def find_by_name_like_async(self, groups, like, range):
 		logger.info("AccountClient.find_by_name_like()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_FIND_BY_NAME_LIKE)
 		stream.u32(groups)
 		stream.string(like)
 		stream.add(range)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		accounts = stream.list(BasicAccountInfo)
-		logger.info("AccountClient.find_by_name_like -> done")
-		return accounts
+		def decode(stream):
+			accounts = stream.list(BasicAccountInfo)
+			logger.info("AccountClient.find_by_name_like -> done")
+			return accounts
+		return self.client.call(stream, call_id, decode)
 	
 	def custom_create_account(self, name, key, groups, email, auth_data):
+		return self.client.wait(self.custom_create_account_async(name, key, groups, email, auth_data))
+	
+	def custom_create_account_async(self, name, key, groups, email, auth_data):
 		logger.info("AccountClient.custom_create_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CUSTOM_CREATE_ACCOUNT)
@@ -463,15 +542,18 @@ class AccountClient(AccountProtocol):
 		stream.u32(groups)
 		stream.string(email)
 		stream.anydata(auth_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		pid = stream.pid()
-		logger.info("AccountClient.custom_create_account -> done")
-		return pid
+		def decode(stream):
+			pid = stream.pid()
+			logger.info("AccountClient.custom_create_account -> done")
+			return pid
+		return self.client.call(stream, call_id, decode)
 	
 	def nintendo_create_account(self, name, key, groups, email, auth_data):
+		return self.client.wait(self.nintendo_create_account_async(name, key, groups, email, auth_data))
+	
+	def nintendo_create_account_async(self, name, key, groups, email, auth_data):
 		logger.info("AccountClient.nintendo_create_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_NINTENDO_CREATE_ACCOUNT)
@@ -480,17 +562,20 @@ class AccountClient(AccountProtocol):
 		stream.u32(groups)
 		stream.string(email)
 		stream.anydata(auth_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.pid = stream.pid()
-		obj.pid_hmac = stream.string()
-		logger.info("AccountClient.nintendo_create_account -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.pid = stream.pid()
+			obj.pid_hmac = stream.string()
+			logger.info("AccountClient.nintendo_create_account -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def lookup_or_create_account(self, name, key, groups, email, auth_data):
+		return self.client.wait(self.lookup_or_create_account_async(name, key, groups, email, auth_data))
+	
+	def lookup_or_create_account_async(self, name, key, groups, email, auth_data):
 		logger.info("AccountClient.lookup_or_create_account()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_LOOKUP_OR_CREATE_ACCOUNT)
@@ -499,38 +584,44 @@ class AccountClient(AccountProtocol):
 		stream.u32(groups)
 		stream.string(email)
 		stream.anydata(auth_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		pid = stream.pid()
-		logger.info("AccountClient.lookup_or_create_account -> done")
-		return pid
+		def decode(stream):
+			pid = stream.pid()
+			logger.info("AccountClient.lookup_or_create_account -> done")
+			return pid
+		return self.client.call(stream, call_id, decode)
 	
 	def disconnect_principal(self, pid):
+		return self.client.wait(self.disconnect_principal_async(pid))
+	
+	def disconnect_principal_async(self, pid):
 		logger.info("AccountClient.disconnect_principal()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_DISCONNECT_PRINCIPAL)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("AccountClient.disconnect_principal -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("AccountClient.disconnect_principal -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def disconnect_all_principals(self):
+		return self.client.wait(self.disconnect_all_principals_async())
+	
+	def disconnect_all_principals_async(self):
 		logger.info("AccountClient.disconnect_all_principals()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_DISCONNECT_ALL_PRINCIPALS)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("AccountClient.disconnect_all_principals -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("AccountClient.disconnect_all_principals -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 
 
 class AccountServer(AccountProtocol):
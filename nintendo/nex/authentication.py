@@ -2,12 +2,15 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
 
 
 class AuthenticationInfo(common.Data):
+	FIELDS_0 = struct.Struct("<IBI")
+	
 	def __init__(self):
 		super().__init__()
 		self.token = None
@@ -22,16 +25,12 @@ class AuthenticationInfo(common.Data):
 	
 	def load(self, stream):
 		self.token = stream.string()
-		self.ngs_version = stream.u32()
-		self.token_type = stream.u8()
-		self.server_version = stream.u32()
+		self.ngs_version, self.token_type, self.server_version = stream.fields(AuthenticationInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.string(self.token)
-		stream.u32(self.ngs_version)
-		stream.u8(self.token_type)
-		stream.u32(self.server_version)
+		stream.fields(AuthenticationInfo.FIELDS_0, self.ngs_version, self.token_type, self.server_version)
 common.DataHolder.register(AuthenticationInfo, "AuthenticationInfo")
 
 
@@ -94,6 +93,8 @@ class RVConnectionData(common.Structure):
 
 
 class ValidateAndRequestTicketParam(common.Structure):
+	FIELDS_0 = struct.Struct("<?II")
+	
 	def __init__(self):
 		super().__init__()
 		self.platform = 3
@@ -112,18 +113,14 @@ class ValidateAndRequestTicketParam(common.Structure):
 		self.platform = stream.u32()
 		self.username = stream.string()
 		self.data = stream.anydata()
-		self.unk = stream.bool()
-		self.nex_version = stream.u32()
-		self.client_version = stream.u32()
+		self.unk, self.nex_version, self.client_version = stream.fields(ValidateAndRequestTicketParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.u32(self.platform)
 		stream.string(self.username)
 		stream.anydata(self.data)
-		stream.bool(self.unk)
-		stream.u32(self.nex_version)
-		stream.u32(self.client_version)
+		stream.fields(ValidateAndRequestTicketParam.FIELDS_0, self.unk, self.nex_version, self.client_version)
 
 
 class ValidateAndRequestTicketResult(common.Structure):
@@ -175,96 +172,114 @@ class AuthenticationClient(AuthenticationProtocol):
 		self.client = client
 	
 	def login(self, username):
+		return self.client.wait(self.login_async(username))
+	
+	def login_async(self, username):
 		logger.info("AuthenticationClient.login()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_LOGIN)
 		stream.string(username)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.result()
-		obj.pid = stream.pid()
-		obj.ticket = stream.buffer()
-		obj.connection_data = stream.extract(RVConnectionData)
-		obj.server_name = stream.string()
-		logger.info("AuthenticationClient.login -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.result()
+			obj.pid = stream.pid()
+			obj.ticket = stream.buffer()
+			obj.connection_data = stream.extract(RVConnectionData)
+			obj.server_name = stream.string()
+			logger.info("AuthenticationClient.login -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def login_ex(self, username, extra_data):
+		return self.client.wait(self.login_ex_async(username, extra_data))
+	
+	def login_ex_async(self, username, extra_data):
 		logger.info("AuthenticationClient.login_ex()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_LOGIN_EX)
 		stream.string(username)
 		stream.anydata(extra_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.result()
-		obj.pid = stream.pid()
-		obj.ticket = stream.buffer()
-		obj.connection_data = stream.extract(RVConnectionData)
-		obj.server_name = stream.string()
-		logger.info("AuthenticationClient.login_ex -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.result()
+			obj.pid = stream.pid()
+			obj.ticket = stream.buffer()
+			obj.connection_data = stream.extract(RVConnectionData)
+			obj.server_name = stream.string()
+			logger.info("AuthenticationClient.login_ex -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def request_ticket(self, source, target):
+		return self.client.wait(self.request_ticket_async(source, target))
+	
+	def request_ticket_async(self, source, target):
 		logger.info("AuthenticationClient.request_ticket()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REQUEST_TICKET)
 		stream.pid(source)
 		stream.pid(target)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.result()
-		obj.ticket = stream.buffer()
-		logger.info("AuthenticationClient.request_ticket -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.result()
+			obj.ticket = stream.buffer()
+			logger.info("AuthenticationClient.request_ticket -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_pid(self, username):
+		return self.client.wait(self.get_pid_async(username))
+	
+	def get_pid_async(self, username):
 		logger.info("AuthenticationClient.get_pid()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_PID)
 		stream.string(username)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		pid = stream.pid()
-		logger.info("AuthenticationClient.get_pid -> done")
-		return pid
+		def decode(stream):
+			pid = stream.pid()
+			logger.info("AuthenticationClient.get_pid -> done")
+			return pid
+		return self.client.call(stream, call_id, decode)
 	
 	def get_name(self, pid):
+		return self.client.wait(self.get_name_async(pid))
+	
+	def get_name_async(self, pid):
 		logger.info("AuthenticationClient.get_name()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_NAME)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		name = stream.string()
-		logger.info("AuthenticationClient.get_name -> done")
-		return name
+		def decode(stream):
+			name = stream.string()
+			logger.info("AuthenticationClient.get_name -> done")
+			return name
+		return self.client.call(stream, call_id, decode)
 	
 	def login_with_param(self, param):
+		return self.client.wait(self.login_with_param_async(param))
+	
+	def login_with_param_async(self, param):
 		logger.info("AuthenticationClient.login_with_param()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_LOGIN_WITH_PARAM)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.extract(ValidateAndRequestTicketResult)
-		logger.info("AuthenticationClient.login_with_param -> done")
-		return result
+		def decode(stream):
+			result = stream.extract(ValidateAndRequestTicketResult)
+			logger.info("AuthenticationClient.login_with_param -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 
 
 class AuthenticationServer(AuthenticationProtocol):
@@ -3,6 +3,10 @@ from nintendo.nex import account, authentication, common, datastore, \
 	friends, kerberos, matchmaking, notification, ranking, secure, \
 	service, nattraversal
 from nintendo.settings import Settings
+import collections
+import contextlib
+import threading
+import time
 
 import logging
 logger = logging.getLogger(__name__)
@@ -48,6 +52,10 @@ class BackEndClient:
 		self.auth_client.set_access_key(access_key)
 		self.secure_client.set_access_key(access_key)
 		
+	def set_metrics(self, metrics):
+		self.auth_client.metrics = metrics
+		self.secure_client.metrics = metrics
+		
 	def connect(self, host, port):
 		# Connect to authentication server
 		if not self.auth_client.connect(host, port, 1):
@@ -161,3 +169,140 @@ class BackEndClient:
 		
 	def get_pid(self):
 		return self.pid
+
+
+class BackEndPool:
+	#Keeps logged in backend clients alive so that they can be handed
+	#out again. Idle clients are kept alive by the PRUDP pings. A new
+	#login is performed if a client was disconnected, for example
+	#because its session expired, or if it is older than max_age.
+	def __init__(self, settings, host, port, max_idle=4, max_age=None):
+		if isinstance(settings, Settings):
+			self.settings = settings.copy()
+		else:
+			self.settings = Settings(settings)
+		
+		self.host = host
+		self.port = port
+		self.max_idle = max_idle
+		self.max_age = max_age
+		
+		self.config = None
+		
+		self.lock = threading.Lock()
+		self.idle = {}
+		self.created = {}
+		
+		self.hits = 0
+		self.misses = 0
+		self.expired = 0
+		self.logins = 0
+		self.login_time = 0
+		self.max_login_time = 0
+		
+	def configure(self, access_key, nex_version, client_version=None):
+		self.config = (access_key, nex_version, client_version)
+		
+	def acquire(self, username, password=None, auth_info=None, login_data=None):
+		key = (username, password)
+		
+		stale = []
+		client = None
+		with self.lock:
+			idle = self.idle.get(key)
+			while idle:
+				candidate = idle.popleft()
+				if self.is_usable(candidate):
+					client = candidate
+					break
+				stale.append(candidate)
+			
+			self.expired += len(stale)
+			if client:
+				self.hits += 1
+			else:
+				self.misses += 1
+		
+		for candidate in stale:
+			self.discard(candidate)
+		
+		if not client:
+			client = self.login(username, password, auth_info, login_data)
+			with self.lock:
+				self.created[client] = (key, time.monotonic())
+		return client
+		
+	def release(self, client):
+		with self.lock:
+			key, created = self.created[client]
+			idle = self.idle.setdefault(key, collections.deque())
+			if not self.is_usable(client):
+				self.expired += 1
+			elif len(idle) < self.max_idle:
+				idle.append(client)
+				return
+		self.discard(client)
+		
+	@contextlib.contextmanager
+	def session(self, username, password=None, auth_info=None, login_data=None):
+		client = self.acquire(username, password, auth_info, login_data)
+		try:
+			yield client
+		finally:
+			self.release(client)
+		
+	def close(self):
+		with self.lock:
+			clients = [client for idle in self.idle.values() for client in idle]
+			self.idle = {}
+		for client in clients:
+			self.discard(client)
+			
+	def is_usable(self, client):
+		if not client.secure_client.is_connected():
+			return False
+		if self.max_age is not None:
+			created = self.created[client][1]
+			if time.monotonic() - created >= self.max_age:
+				return False
+		return True
+		
+	def discard(self, client):
+		with self.lock:
+			self.created.pop(client, None)
+		client.close()
+		
+	def login(self, username, password, auth_info, login_data):
+		if not self.config:
+			raise RuntimeError("Backend pool must be configured before use")
+		
+		logger.debug("Pool miss, logging in as %s", username)
+		
+		start = time.perf_counter()
+		
+		client = BackEndClient(self.settings)
+		client.configure(*self.config)
+		try:
+			client.connect(self.host, self.port)
+			client.login(username, password, auth_info, login_data)
+		except:
+			client.close()
+			raise
+		
+		elapsed = time.perf_counter() - start
+		with self.lock:
+			self.logins += 1
+			self.login_time += elapsed
+			self.max_login_time = max(self.max_login_time, elapsed)
+		return client
+		
+	def hit_rate(self):
+		total = self.hits + self.misses
+		if total == 0:
+			return 0
+		return self.hits / total
+		
+	def average_login_time(self):
+		if self.logins == 0:
+			return 0
+		return self.login_time / self.logins
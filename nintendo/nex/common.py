@@ -1,6 +1,5 @@
 
 from nintendo.nex.errors import error_names, error_codes
-from nintendo.nex import streams
 import datetime, time
 
 import logging
@@ -47,8 +46,12 @@ class Result:
 			raise RMCError(self.error_code)
 	
 
+hierarchies = {}
+
 # Black magic going on here
 class Structure:
+	__slots__ = ()
+	
 	def init_version(self, cls, settings):
 		nex_version = settings.get("nex.version")
 		if nex_version < 30500:
@@ -59,12 +62,14 @@ class Structure:
 	def get_version(self, settings): return 0
 			
 	def get_hierarchy(self):
-		hierarchy = []
 		cls = self.__class__
-		while cls != Structure:
-			hierarchy.append(cls)
-			cls = cls.__bases__[0]
-		return hierarchy[::-1]
+		if cls not in hierarchies:
+			hierarchy = []
+			while cls != Structure:
+				hierarchy.append(cls)
+				cls = cls.__bases__[0]
+			hierarchies[self.__class__] = hierarchy[::-1]
+		return hierarchies[self.__class__]
 	
 	def encode(self, stream):
 		hierarchy = self.get_hierarchy()
@@ -73,11 +78,17 @@ class Structure:
 			if version == -1:
 				cls.save(self, stream)
 			else:
-				substream = streams.StreamOut(stream.settings)
-				cls.save(self, substream)
-				
 				stream.u8(version)
-				stream.buffer(substream.get())
+				
+				#Write the struct directly and fill in its size afterwards
+				start = stream.tell()
+				stream.u32(0)
+				cls.save(self, stream)
+				end = stream.tell()
+				
+				stream.seek(start)
+				stream.u32(end - start - 4)
+				stream.seek(end)
 
 	def decode(self, stream):
 		hierarchy = self.get_hierarchy()
@@ -111,6 +122,8 @@ class Structure:
 	
 	
 class Data(Structure):
+	__slots__ = ()
+	
 	def save(self, stream): pass
 	def load(self, stream): pass
 
@@ -125,11 +138,17 @@ class DataHolder:
 	def encode(self, stream):	
 		stream.string(self.data.__class__.__name__)
 		
-		substream = streams.StreamOut(stream.settings)
-		substream.add(self.data)
+		#Write the object directly and fill in both sizes afterwards
+		start = stream.tell()
+		stream.u32(0)
+		stream.u32(0)
+		stream.add(self.data)
+		end = stream.tell()
 		
-		stream.u32(len(substream.get()) + 4)
-		stream.buffer(substream.get())
+		stream.seek(start)
+		stream.u32(end - start - 4)
+		stream.u32(end - start - 8)
+		stream.seek(end)
 		
 	def decode(self, stream):
 		name = stream.string()
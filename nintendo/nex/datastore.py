@@ -2,12 +2,15 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
 
 
 class DataStoreCompletePostParam(common.Structure):
+	FIELDS_0 = struct.Struct("<Q?")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -19,16 +22,16 @@ class DataStoreCompletePostParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.success = stream.bool()
+		self.data_id, self.success = stream.fields(DataStoreCompletePostParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.bool(self.success)
+		stream.fields(DataStoreCompletePostParam.FIELDS_0, self.data_id, self.success)
 
 
 class DataStoreGetMetaParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BQ")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = 0
@@ -42,15 +45,13 @@ class DataStoreGetMetaParam(common.Structure):
 	def load(self, stream):
 		self.data_id = stream.u64()
 		self.persistence_target = stream.extract(PersistenceTarget)
-		self.result_option = stream.u8()
-		self.access_password = stream.u64()
+		self.result_option, self.access_password = stream.fields(DataStoreGetMetaParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.u64(self.data_id)
 		stream.add(self.persistence_target)
-		stream.u8(self.result_option)
-		stream.u64(self.access_password)
+		stream.fields(DataStoreGetMetaParam.FIELDS_0, self.result_option, self.access_password)
 
 
 class DataStoreKeyValue(common.Structure):
@@ -75,6 +76,8 @@ class DataStoreKeyValue(common.Structure):
 
 
 class DataStoreMetaInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<HBIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -113,11 +116,7 @@ class DataStoreMetaInfo(common.Structure):
 		self.delete_permission = stream.extract(DataStorePermission)
 		self.create_time = stream.datetime()
 		self.update_time = stream.datetime()
-		self.period = stream.u16()
-		self.status = stream.u8()
-		self.referred_count = stream.u32()
-		self.refer_data_id = stream.u32()
-		self.flag = stream.u32()
+		self.period, self.status, self.referred_count, self.refer_data_id, self.flag = stream.fields(DataStoreMetaInfo.FIELDS_0)
 		self.referred_time = stream.datetime()
 		self.expire_time = stream.datetime()
 		self.tags = stream.list(stream.string)
@@ -135,11 +134,7 @@ class DataStoreMetaInfo(common.Structure):
 		stream.add(self.delete_permission)
 		stream.datetime(self.create_time)
 		stream.datetime(self.update_time)
-		stream.u16(self.period)
-		stream.u8(self.status)
-		stream.u32(self.referred_count)
-		stream.u32(self.refer_data_id)
-		stream.u32(self.flag)
+		stream.fields(DataStoreMetaInfo.FIELDS_0, self.period, self.status, self.referred_count, self.refer_data_id, self.flag)
 		stream.datetime(self.referred_time)
 		stream.datetime(self.expire_time)
 		stream.list(self.tags, stream.string)
@@ -166,6 +161,8 @@ class DataStorePermission(common.Structure):
 
 
 class DataStorePersistenceInitParam(common.Structure):
+	FIELDS_0 = struct.Struct("<H?")
+	
 	def __init__(self):
 		super().__init__()
 		self.persistence_id = 65535
@@ -175,16 +172,16 @@ class DataStorePersistenceInitParam(common.Structure):
 		pass
 	
 	def load(self, stream):
-		self.persistence_id = stream.u16()
-		self.delete_last_object = stream.bool()
+		self.persistence_id, self.delete_last_object = stream.fields(DataStorePersistenceInitParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u16(self.persistence_id)
-		stream.bool(self.delete_last_object)
+		stream.fields(DataStorePersistenceInitParam.FIELDS_0, self.persistence_id, self.delete_last_object)
 
 
 class DataStorePrepareGetParam(common.Structure):
+	FIELDS_0 = struct.Struct("<QI")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = 0
@@ -200,8 +197,7 @@ class DataStorePrepareGetParam(common.Structure):
 					raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.lock_id = stream.u32()
+		self.data_id, self.lock_id = stream.fields(DataStorePrepareGetParam.FIELDS_0)
 		self.persistence_target = stream.extract(PersistenceTarget)
 		self.access_password = stream.u64()
 		if stream.settings.get("nex.version") >= 30500:
@@ -209,8 +205,7 @@ class DataStorePrepareGetParam(common.Structure):
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u32(self.lock_id)
+		stream.fields(DataStorePrepareGetParam.FIELDS_0, self.data_id, self.lock_id)
 		stream.add(self.persistence_target)
 		stream.u64(self.access_password)
 		if stream.settings.get("nex.version") >= 30500:
@@ -218,6 +213,8 @@ class DataStorePrepareGetParam(common.Structure):
 
 
 class DataStorePreparePostParam(common.Structure):
+	FIELDS_0 = struct.Struct("<IHI")
+	
 	def __init__(self):
 		super().__init__()
 		self.size = None
@@ -250,9 +247,7 @@ class DataStorePreparePostParam(common.Structure):
 		self.meta_binary = stream.qbuffer()
 		self.permission = stream.extract(DataStorePermission)
 		self.delete_permission = stream.extract(DataStorePermission)
-		self.flag = stream.u32()
-		self.period = stream.u16()
-		self.refer_data_id = stream.u32()
+		self.flag, self.period, self.refer_data_id = stream.fields(DataStorePreparePostParam.FIELDS_0)
 		self.tags = stream.list(stream.string)
 		self.rating_init_param = stream.list(DataStoreRatingInitParamWithSlot)
 		self.persistence_init_param = stream.extract(DataStorePersistenceInitParam)
@@ -267,9 +262,7 @@ class DataStorePreparePostParam(common.Structure):
 		stream.qbuffer(self.meta_binary)
 		stream.add(self.permission)
 		stream.add(self.delete_permission)
-		stream.u32(self.flag)
-		stream.u16(self.period)
-		stream.u32(self.refer_data_id)
+		stream.fields(DataStorePreparePostParam.FIELDS_0, self.flag, self.period, self.refer_data_id)
 		stream.list(self.tags, stream.string)
 		stream.list(self.rating_init_param, stream.add)
 		stream.add(self.persistence_init_param)
@@ -278,6 +271,8 @@ class DataStorePreparePostParam(common.Structure):
 
 
 class DataStoreRatingInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<qIq")
+	
 	def __init__(self):
 		super().__init__()
 		self.total_value = None
@@ -290,15 +285,11 @@ class DataStoreRatingInfo(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.total_value = stream.s64()
-		self.count = stream.u32()
-		self.initial_value = stream.s64()
+		self.total_value, self.count, self.initial_value = stream.fields(DataStoreRatingInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.s64(self.total_value)
-		stream.u32(self.count)
-		stream.s64(self.initial_value)
+		stream.fields(DataStoreRatingInfo.FIELDS_0, self.total_value, self.count, self.initial_value)
 
 
 class DataStoreRatingInfoWithSlot(common.Structure):
@@ -323,6 +314,8 @@ class DataStoreRatingInfoWithSlot(common.Structure):
 
 
 class DataStoreRatingInitParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BBBqiibh")
+	
 	def __init__(self):
 		super().__init__()
 		self.flag = None
@@ -340,25 +333,11 @@ class DataStoreRatingInitParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.flag = stream.u8()
-		self.internal_flag = stream.u8()
-		self.lock_type = stream.u8()
-		self.initial_value = stream.s64()
-		self.range_min = stream.s32()
-		self.range_max = stream.s32()
-		self.period_hour = stream.s8()
-		self.period_duration = stream.s16()
+		self.flag, self.internal_flag, self.lock_type, self.initial_value, self.range_min, self.range_max, self.period_hour, self.period_duration = stream.fields(DataStoreRatingInitParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u8(self.flag)
-		stream.u8(self.internal_flag)
-		stream.u8(self.lock_type)
-		stream.s64(self.initial_value)
-		stream.s32(self.range_min)
-		stream.s32(self.range_max)
-		stream.s8(self.period_hour)
-		stream.s16(self.period_duration)
+		stream.fields(DataStoreRatingInitParam.FIELDS_0, self.flag, self.internal_flag, self.lock_type, self.initial_value, self.range_min, self.range_max, self.period_hour, self.period_duration)
 
 
 class DataStoreRatingInitParamWithSlot(common.Structure):
@@ -523,69 +502,84 @@ class DataStoreClient(DataStoreProtocol):
 		self.client = client
 	
 	def get_meta(self, param):
+		return self.client.wait(self.get_meta_async(param))
+	
+	def get_meta_async(self, param):
 		logger.info("DataStoreClient.get_meta()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_META)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreMetaInfo)
-		logger.info("DataStoreClient.get_meta -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreMetaInfo)
+			logger.info("DataStoreClient.get_meta -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_post_object(self, param):
+		return self.client.wait(self.prepare_post_object_async(param))
+	
+	def prepare_post_object_async(self, param):
 		logger.info("DataStoreClient.prepare_post_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_POST_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreReqPostInfo)
-		logger.info("DataStoreClient.prepare_post_object -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreReqPostInfo)
+			logger.info("DataStoreClient.prepare_post_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_get_object(self, param):
+		return self.client.wait(self.prepare_get_object_async(param))
+	
+	def prepare_get_object_async(self, param):
 		logger.info("DataStoreClient.prepare_get_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_GET_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreReqGetInfo)
-		logger.info("DataStoreClient.prepare_get_object -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreReqGetInfo)
+			logger.info("DataStoreClient.prepare_get_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def complete_post_object(self, param):
+		return self.client.wait(self.complete_post_object_async(param))
+	
+	def complete_post_object_async(self, param):
 		logger.info("DataStoreClient.complete_post_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_COMPLETE_POST_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreClient.complete_post_object -> done")
+		def decode(stream):
+			logger.info("DataStoreClient.complete_post_object -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_metas_multiple_param(self, params):
+		return self.client.wait(self.get_metas_multiple_param_async(params))
+	
+	def get_metas_multiple_param_async(self, params):
 		logger.info("DataStoreClient.get_metas_multiple_param()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_METAS_MULTIPLE_PARAM)
 		stream.list(params, stream.add)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.infos = stream.list(DataStoreMetaInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreClient.get_metas_multiple_param -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.infos = stream.list(DataStoreMetaInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreClient.get_metas_multiple_param -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 
 
 class DataStoreServer(DataStoreProtocol):
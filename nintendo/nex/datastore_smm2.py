@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -70,6 +71,8 @@ class PlayStatsKeys:
 
 
 class BadgeInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<HB")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -81,16 +84,17 @@ class BadgeInfo(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u16()
-		self.unk2 = stream.u8()
+		self.unk1, self.unk2 = stream.fields(BadgeInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u16(self.unk1)
-		stream.u8(self.unk2)
+		stream.fields(BadgeInfo.FIELDS_0, self.unk1, self.unk2)
 
 
 class CommentInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<BBQHHBBB??")
+	FIELDS_1 = struct.Struct("<HB")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -120,46 +124,28 @@ class CommentInfo(common.Structure):
 	def load(self, stream):
 		self.unk1 = stream.u64()
 		self.unk2 = stream.string()
-		self.unk3 = stream.u8()
-		self.unk4 = stream.u8()
-		self.unk5 = stream.u64()
-		self.unk6 = stream.u16()
-		self.unk7 = stream.u16()
-		self.unk8 = stream.u8()
-		self.unk9 = stream.u8()
-		self.unk10 = stream.u8()
-		self.unk11 = stream.bool()
-		self.unk12 = stream.bool()
+		self.unk3, self.unk4, self.unk5, self.unk6, self.unk7, self.unk8, self.unk9, self.unk10, self.unk11, self.unk12 = stream.fields(CommentInfo.FIELDS_0)
 		self.unk13 = stream.datetime()
 		self.unk14 = stream.qbuffer()
 		self.unk15 = stream.string()
 		self.picture = stream.extract(CommentPictureReqGetInfoWithoutHeaders)
-		self.unk16 = stream.u16()
-		self.unk17 = stream.u8()
+		self.unk16, self.unk17 = stream.fields(CommentInfo.FIELDS_1)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.u64(self.unk1)
 		stream.string(self.unk2)
-		stream.u8(self.unk3)
-		stream.u8(self.unk4)
-		stream.u64(self.unk5)
-		stream.u16(self.unk6)
-		stream.u16(self.unk7)
-		stream.u8(self.unk8)
-		stream.u8(self.unk9)
-		stream.u8(self.unk10)
-		stream.bool(self.unk11)
-		stream.bool(self.unk12)
+		stream.fields(CommentInfo.FIELDS_0, self.unk3, self.unk4, self.unk5, self.unk6, self.unk7, self.unk8, self.unk9, self.unk10, self.unk11, self.unk12)
 		stream.datetime(self.unk13)
 		stream.qbuffer(self.unk14)
 		stream.string(self.unk15)
 		stream.add(self.picture)
-		stream.u16(self.unk16)
-		stream.u8(self.unk17)
+		stream.fields(CommentInfo.FIELDS_1, self.unk16, self.unk17)
 
 
 class CommentPictureReqGetInfoWithoutHeaders(common.Structure):
+	FIELDS_0 = struct.Struct("<BI")
+	
 	def __init__(self):
 		super().__init__()
 		self.url = None
@@ -175,21 +161,23 @@ class CommentPictureReqGetInfoWithoutHeaders(common.Structure):
 	
 	def load(self, stream):
 		self.url = stream.string()
-		self.data_type = stream.u8()
-		self.unk1 = stream.u32()
+		self.data_type, self.unk1 = stream.fields(CommentPictureReqGetInfoWithoutHeaders.FIELDS_0)
 		self.unk2 = stream.buffer()
 		self.filename = stream.string()
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.string(self.url)
-		stream.u8(self.data_type)
-		stream.u32(self.unk1)
+		stream.fields(CommentPictureReqGetInfoWithoutHeaders.FIELDS_0, self.data_type, self.unk1)
 		stream.buffer(self.unk2)
 		stream.string(self.filename)
 
 
 class CourseInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<BB")
+	FIELDS_1 = struct.Struct("<BBBBIHH")
+	FIELDS_2 = struct.Struct("<BBBB")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -231,26 +219,16 @@ class CourseInfo(common.Structure):
 		self.owner_id = stream.pid()
 		self.name = stream.string()
 		self.description = stream.string()
-		self.game_style = stream.u8()
-		self.course_theme = stream.u8()
+		self.game_style, self.course_theme = stream.fields(CourseInfo.FIELDS_0)
 		self.upload_time = stream.datetime()
-		self.difficulty = stream.u8()
-		self.tag1 = stream.u8()
-		self.tag2 = stream.u8()
-		self.unk1 = stream.u8()
-		self.clear_condition = stream.u32()
-		self.clear_condition_magnitude = stream.u16()
-		self.unk2 = stream.u16()
+		self.difficulty, self.tag1, self.tag2, self.unk1, self.clear_condition, self.clear_condition_magnitude, self.unk2 = stream.fields(CourseInfo.FIELDS_1)
 		self.unk3 = stream.qbuffer()
 		self.unk4 = stream.map(stream.u8, stream.u32)
 		self.unk5 = stream.map(stream.u8, stream.u32)
 		self.unk6 = stream.map(stream.u8, stream.u32)
 		self.unk7 = stream.extract(UnknownStruct2)
 		self.unk8 = stream.map(stream.u8, stream.u32)
-		self.unk9 = stream.u8()
-		self.unk10 = stream.u8()
-		self.unk11 = stream.u8()
-		self.unk12 = stream.u8()
+		self.unk9, self.unk10, self.unk11, self.unk12 = stream.fields(CourseInfo.FIELDS_2)
 		self.one_screen_thumbnail = stream.extract(ThumbnailInfo)
 		self.entire_thumbnail = stream.extract(ThumbnailInfo)
 	
@@ -261,31 +239,23 @@ class CourseInfo(common.Structure):
 		stream.pid(self.owner_id)
 		stream.string(self.name)
 		stream.string(self.description)
-		stream.u8(self.game_style)
-		stream.u8(self.course_theme)
+		stream.fields(CourseInfo.FIELDS_0, self.game_style, self.course_theme)
 		stream.datetime(self.upload_time)
-		stream.u8(self.difficulty)
-		stream.u8(self.tag1)
-		stream.u8(self.tag2)
-		stream.u8(self.unk1)
-		stream.u32(self.clear_condition)
-		stream.u16(self.clear_condition_magnitude)
-		stream.u16(self.unk2)
+		stream.fields(CourseInfo.FIELDS_1, self.difficulty, self.tag1, self.tag2, self.unk1, self.clear_condition, self.clear_condition_magnitude, self.unk2)
 		stream.qbuffer(self.unk3)
 		stream.map(self.unk4, stream.u8, stream.u32)
 		stream.map(self.unk5, stream.u8, stream.u32)
 		stream.map(self.unk6, stream.u8, stream.u32)
 		stream.add(self.unk7)
 		stream.map(self.unk8, stream.u8, stream.u32)
-		stream.u8(self.unk9)
-		stream.u8(self.unk10)
-		stream.u8(self.unk11)
-		stream.u8(self.unk12)
+		stream.fields(CourseInfo.FIELDS_2, self.unk9, self.unk10, self.unk11, self.unk12)
 		stream.add(self.one_screen_thumbnail)
 		stream.add(self.entire_thumbnail)
 
 
 class DataStoreCompletePostParam(common.Structure):
+	FIELDS_0 = struct.Struct("<Q?")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -297,16 +267,16 @@ class DataStoreCompletePostParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.success = stream.bool()
+		self.data_id, self.success = stream.fields(DataStoreCompletePostParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.bool(self.success)
+		stream.fields(DataStoreCompletePostParam.FIELDS_0, self.data_id, self.success)
 
 
 class DataStoreGetMetaParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BQ")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = 0
@@ -320,15 +290,13 @@ class DataStoreGetMetaParam(common.Structure):
 	def load(self, stream):
 		self.data_id = stream.u64()
 		self.persistence_target = stream.extract(PersistenceTarget)
-		self.result_option = stream.u8()
-		self.access_password = stream.u64()
+		self.result_option, self.access_password = stream.fields(DataStoreGetMetaParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.u64(self.data_id)
 		stream.add(self.persistence_target)
-		stream.u8(self.result_option)
-		stream.u64(self.access_password)
+		stream.fields(DataStoreGetMetaParam.FIELDS_0, self.result_option, self.access_password)
 
 
 class DataStoreKeyValue(common.Structure):
@@ -353,6 +321,8 @@ class DataStoreKeyValue(common.Structure):
 
 
 class DataStoreMetaInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<HBIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -391,11 +361,7 @@ class DataStoreMetaInfo(common.Structure):
 		self.delete_permission = stream.extract(DataStorePermission)
 		self.create_time = stream.datetime()
 		self.update_time = stream.datetime()
-		self.period = stream.u16()
-		self.status = stream.u8()
-		self.referred_count = stream.u32()
-		self.refer_data_id = stream.u32()
-		self.flag = stream.u32()
+		self.period, self.status, self.referred_count, self.refer_data_id, self.flag = stream.fields(DataStoreMetaInfo.FIELDS_0)
 		self.referred_time = stream.datetime()
 		self.expire_time = stream.datetime()
 		self.tags = stream.list(stream.string)
@@ -413,11 +379,7 @@ class DataStoreMetaInfo(common.Structure):
 		stream.add(self.delete_permission)
 		stream.datetime(self.create_time)
 		stream.datetime(self.update_time)
-		stream.u16(self.period)
-		stream.u8(self.status)
-		stream.u32(self.referred_count)
-		stream.u32(self.refer_data_id)
-		stream.u32(self.flag)
+		stream.fields(DataStoreMetaInfo.FIELDS_0, self.period, self.status, self.referred_count, self.refer_data_id, self.flag)
 		stream.datetime(self.referred_time)
 		stream.datetime(self.expire_time)
 		stream.list(self.tags, stream.string)
@@ -444,6 +406,8 @@ class DataStorePermission(common.Structure):
 
 
 class DataStorePersistenceInitParam(common.Structure):
+	FIELDS_0 = struct.Struct("<H?")
+	
 	def __init__(self):
 		super().__init__()
 		self.persistence_id = 65535
@@ -453,16 +417,16 @@ class DataStorePersistenceInitParam(common.Structure):
 		pass
 	
 	def load(self, stream):
-		self.persistence_id = stream.u16()
-		self.delete_last_object = stream.bool()
+		self.persistence_id, self.delete_last_object = stream.fields(DataStorePersistenceInitParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u16(self.persistence_id)
-		stream.bool(self.delete_last_object)
+		stream.fields(DataStorePersistenceInitParam.FIELDS_0, self.persistence_id, self.delete_last_object)
 
 
 class DataStorePrepareGetParam(common.Structure):
+	FIELDS_0 = struct.Struct("<QI")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = 0
@@ -478,8 +442,7 @@ class DataStorePrepareGetParam(common.Structure):
 					raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.lock_id = stream.u32()
+		self.data_id, self.lock_id = stream.fields(DataStorePrepareGetParam.FIELDS_0)
 		self.persistence_target = stream.extract(PersistenceTarget)
 		self.access_password = stream.u64()
 		if stream.settings.get("nex.version") >= 30500:
@@ -487,8 +450,7 @@ class DataStorePrepareGetParam(common.Structure):
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u32(self.lock_id)
+		stream.fields(DataStorePrepareGetParam.FIELDS_0, self.data_id, self.lock_id)
 		stream.add(self.persistence_target)
 		stream.u64(self.access_password)
 		if stream.settings.get("nex.version") >= 30500:
@@ -496,6 +458,8 @@ class DataStorePrepareGetParam(common.Structure):
 
 
 class DataStorePreparePostParam(common.Structure):
+	FIELDS_0 = struct.Struct("<IHI")
+	
 	def __init__(self):
 		super().__init__()
 		self.size = None
@@ -528,9 +492,7 @@ class DataStorePreparePostParam(common.Structure):
 		self.meta_binary = stream.qbuffer()
 		self.permission = stream.extract(DataStorePermission)
 		self.delete_permission = stream.extract(DataStorePermission)
-		self.flag = stream.u32()
-		self.period = stream.u16()
-		self.refer_data_id = stream.u32()
+		self.flag, self.period, self.refer_data_id = stream.fields(DataStorePreparePostParam.FIELDS_0)
 		self.tags = stream.list(stream.string)
 		self.rating_init_param = stream.list(DataStoreRatingInitParamWithSlot)
 		self.persistence_init_param = stream.extract(DataStorePersistenceInitParam)
@@ -545,9 +507,7 @@ class DataStorePreparePostParam(common.Structure):
 		stream.qbuffer(self.meta_binary)
 		stream.add(self.permission)
 		stream.add(self.delete_permission)
-		stream.u32(self.flag)
-		stream.u16(self.period)
-		stream.u32(self.refer_data_id)
+		stream.fields(DataStorePreparePostParam.FIELDS_0, self.flag, self.period, self.refer_data_id)
 		stream.list(self.tags, stream.string)
 		stream.list(self.rating_init_param, stream.add)
 		stream.add(self.persistence_init_param)
@@ -556,6 +516,8 @@ class DataStorePreparePostParam(common.Structure):
 
 
 class DataStoreRatingInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<qIq")
+	
 	def __init__(self):
 		super().__init__()
 		self.total_value = None
@@ -568,15 +530,11 @@ class DataStoreRatingInfo(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.total_value = stream.s64()
-		self.count = stream.u32()
-		self.initial_value = stream.s64()
+		self.total_value, self.count, self.initial_value = stream.fields(DataStoreRatingInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.s64(self.total_value)
-		stream.u32(self.count)
-		stream.s64(self.initial_value)
+		stream.fields(DataStoreRatingInfo.FIELDS_0, self.total_value, self.count, self.initial_value)
 
 
 class DataStoreRatingInfoWithSlot(common.Structure):
@@ -601,6 +559,8 @@ class DataStoreRatingInfoWithSlot(common.Structure):
 
 
 class DataStoreRatingInitParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BBBqiibh")
+	
 	def __init__(self):
 		super().__init__()
 		self.flag = None
@@ -618,25 +578,11 @@ class DataStoreRatingInitParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.flag = stream.u8()
-		self.internal_flag = stream.u8()
-		self.lock_type = stream.u8()
-		self.initial_value = stream.s64()
-		self.range_min = stream.s32()
-		self.range_max = stream.s32()
-		self.period_hour = stream.s8()
-		self.period_duration = stream.s16()
+		self.flag, self.internal_flag, self.lock_type, self.initial_value, self.range_min, self.range_max, self.period_hour, self.period_duration = stream.fields(DataStoreRatingInitParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u8(self.flag)
-		stream.u8(self.internal_flag)
-		stream.u8(self.lock_type)
-		stream.s64(self.initial_value)
-		stream.s32(self.range_min)
-		stream.s32(self.range_max)
-		stream.s8(self.period_hour)
-		stream.s16(self.period_duration)
+		stream.fields(DataStoreRatingInitParam.FIELDS_0, self.flag, self.internal_flag, self.lock_type, self.initial_value, self.range_min, self.range_max, self.period_hour, self.period_duration)
 
 
 class DataStoreRatingInitParamWithSlot(common.Structure):
@@ -748,6 +694,8 @@ class GetCourseInfoParam(common.Structure):
 
 
 class GetUserOrCourseParam(common.Structure):
+	FIELDS_0 = struct.Struct("<II")
+	
 	def __init__(self):
 		super().__init__()
 		self.code = None
@@ -761,14 +709,12 @@ class GetUserOrCourseParam(common.Structure):
 	
 	def load(self, stream):
 		self.code = stream.string()
-		self.user_option = stream.u32()
-		self.course_option = stream.u32()
+		self.user_option, self.course_option = stream.fields(GetUserOrCourseParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.string(self.code)
-		stream.u32(self.user_option)
-		stream.u32(self.course_option)
+		stream.fields(GetUserOrCourseParam.FIELDS_0, self.user_option, self.course_option)
 
 
 class GetUsersParam(common.Structure):
@@ -854,6 +800,8 @@ class RelationObjectReqGetInfo(common.Structure):
 
 
 class SearchCoursesEndlessModeParam(common.Structure):
+	FIELDS_0 = struct.Struct("<IIB")
+	
 	def __init__(self):
 		super().__init__()
 		self.option = 463
@@ -866,15 +814,11 @@ class SearchCoursesEndlessModeParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.option = stream.u32()
-		self.count = stream.u32()
-		self.difficulty = stream.u8()
+		self.option, self.count, self.difficulty = stream.fields(SearchCoursesEndlessModeParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.option)
-		stream.u32(self.count)
-		stream.u8(self.difficulty)
+		stream.fields(SearchCoursesEndlessModeParam.FIELDS_0, self.option, self.count, self.difficulty)
 
 
 class SearchCoursesLatestParam(common.Structure):
@@ -924,6 +868,8 @@ class SearchCoursesPointRankingParam(common.Structure):
 
 
 class SyncUserProfileParam(common.Structure):
+	FIELDS_0 = struct.Struct("<??")
+	
 	def __init__(self):
 		super().__init__()
 		self.username = None
@@ -947,8 +893,7 @@ class SyncUserProfileParam(common.Structure):
 		self.unk2 = stream.qbuffer()
 		self.unk3 = stream.u8()
 		self.country = stream.string()
-		self.unk4 = stream.bool()
-		self.unk5 = stream.bool()
+		self.unk4, self.unk5 = stream.fields(SyncUserProfileParam.FIELDS_0)
 		self.unk_guid = stream.string()
 		self.unk6 = stream.u32()
 	
@@ -959,13 +904,14 @@ class SyncUserProfileParam(common.Structure):
 		stream.qbuffer(self.unk2)
 		stream.u8(self.unk3)
 		stream.string(self.country)
-		stream.bool(self.unk4)
-		stream.bool(self.unk5)
+		stream.fields(SyncUserProfileParam.FIELDS_0, self.unk4, self.unk5)
 		stream.string(self.unk_guid)
 		stream.u32(self.unk6)
 
 
 class SyncUserProfileResult(common.Structure):
+	FIELDS_0 = struct.Struct("<B??")
+	
 	def __init__(self):
 		super().__init__()
 		self.pid = None
@@ -990,9 +936,7 @@ class SyncUserProfileResult(common.Structure):
 		self.unk2 = stream.qbuffer()
 		self.unk3 = stream.u8()
 		self.country = stream.string()
-		self.unk4 = stream.u8()
-		self.unk5 = stream.bool()
-		self.unk6 = stream.bool()
+		self.unk4, self.unk5, self.unk6 = stream.fields(SyncUserProfileResult.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
@@ -1002,12 +946,12 @@ class SyncUserProfileResult(common.Structure):
 		stream.qbuffer(self.unk2)
 		stream.u8(self.unk3)
 		stream.string(self.country)
-		stream.u8(self.unk4)
-		stream.bool(self.unk5)
-		stream.bool(self.unk6)
+		stream.fields(SyncUserProfileResult.FIELDS_0, self.unk4, self.unk5, self.unk6)
 
 
 class ThumbnailInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<BI")
+	
 	def __init__(self):
 		super().__init__()
 		self.url = None
@@ -1023,21 +967,21 @@ class ThumbnailInfo(common.Structure):
 	
 	def load(self, stream):
 		self.url = stream.string()
-		self.data_type = stream.u8()
-		self.unk1 = stream.u32()
+		self.data_type, self.unk1 = stream.fields(ThumbnailInfo.FIELDS_0)
 		self.unk2 = stream.buffer()
 		self.filename = stream.string()
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.string(self.url)
-		stream.u8(self.data_type)
-		stream.u32(self.unk1)
+		stream.fields(ThumbnailInfo.FIELDS_0, self.data_type, self.unk1)
 		stream.buffer(self.unk2)
 		stream.string(self.filename)
 
 
 class UnknownStruct1(common.Structure):
+	FIELDS_0 = struct.Struct("<HHHH")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -1051,20 +995,16 @@ class UnknownStruct1(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u16()
-		self.unk2 = stream.u16()
-		self.unk3 = stream.u16()
-		self.unk4 = stream.u16()
+		self.unk1, self.unk2, self.unk3, self.unk4 = stream.fields(UnknownStruct1.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u16(self.unk1)
-		stream.u16(self.unk2)
-		stream.u16(self.unk3)
-		stream.u16(self.unk4)
+		stream.fields(UnknownStruct1.FIELDS_0, self.unk1, self.unk2, self.unk3, self.unk4)
 
 
 class UnknownStruct2(common.Structure):
+	FIELDS_0 = struct.Struct("<QQII")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -1078,20 +1018,16 @@ class UnknownStruct2(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u64()
-		self.unk2 = stream.u64()
-		self.unk3 = stream.u32()
-		self.unk4 = stream.u32()
+		self.unk1, self.unk2, self.unk3, self.unk4 = stream.fields(UnknownStruct2.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.unk1)
-		stream.u64(self.unk2)
-		stream.u32(self.unk3)
-		stream.u32(self.unk4)
+		stream.fields(UnknownStruct2.FIELDS_0, self.unk1, self.unk2, self.unk3, self.unk4)
 
 
 class UserInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<???")
+	
 	def __init__(self):
 		super().__init__()
 		self.pid = None
@@ -1128,9 +1064,7 @@ class UserInfo(common.Structure):
 		self.country = stream.string()
 		self.region = stream.u8()
 		self.last_active = stream.datetime()
-		self.unk3 = stream.bool()
-		self.unk4 = stream.bool()
-		self.unk5 = stream.bool()
+		self.unk3, self.unk4, self.unk5 = stream.fields(UserInfo.FIELDS_0)
 		self.play_stats = stream.map(stream.u8, stream.u32)
 		self.unk6 = stream.map(stream.u8, stream.u32)
 		self.endless_challenge_high_scores = stream.map(stream.u8, stream.u32)
@@ -1150,9 +1084,7 @@ class UserInfo(common.Structure):
 		stream.string(self.country)
 		stream.u8(self.region)
 		stream.datetime(self.last_active)
-		stream.bool(self.unk3)
-		stream.bool(self.unk4)
-		stream.bool(self.unk5)
+		stream.fields(UserInfo.FIELDS_0, self.unk3, self.unk4, self.unk5)
 		stream.map(self.play_stats, stream.u8, stream.u32)
 		stream.map(self.unk6, stream.u8, stream.u32)
 		stream.map(self.endless_challenge_high_scores, stream.u8, stream.u32)
@@ -1230,219 +1162,267 @@ class DataStoreClientSMM2(DataStoreProtocolSMM2):
 		self.client = client
 	
 	def get_meta(self, param):
+		return self.client.wait(self.get_meta_async(param))
+	
+	def get_meta_async(self, param):
 		logger.info("DataStoreClientSMM2.get_meta()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_META)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreMetaInfo)
-		logger.info("DataStoreClientSMM2.get_meta -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreMetaInfo)
+			logger.info("DataStoreClientSMM2.get_meta -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_post_object(self, param):
+		return self.client.wait(self.prepare_post_object_async(param))
+	
+	def prepare_post_object_async(self, param):
 		logger.info("DataStoreClientSMM2.prepare_post_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_POST_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreReqPostInfo)
-		logger.info("DataStoreClientSMM2.prepare_post_object -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreReqPostInfo)
+			logger.info("DataStoreClientSMM2.prepare_post_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_get_object(self, param):
+		return self.client.wait(self.prepare_get_object_async(param))
+	
+	def prepare_get_object_async(self, param):
 		logger.info("DataStoreClientSMM2.prepare_get_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_GET_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreReqGetInfo)
-		logger.info("DataStoreClientSMM2.prepare_get_object -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreReqGetInfo)
+			logger.info("DataStoreClientSMM2.prepare_get_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def complete_post_object(self, param):
+		return self.client.wait(self.complete_post_object_async(param))
+	
+	def complete_post_object_async(self, param):
 		logger.info("DataStoreClientSMM2.complete_post_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_COMPLETE_POST_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreClientSMM2.complete_post_object -> done")
+		def decode(stream):
+			logger.info("DataStoreClientSMM2.complete_post_object -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_metas_multiple_param(self, params):
+		return self.client.wait(self.get_metas_multiple_param_async(params))
+	
+	def get_metas_multiple_param_async(self, params):
 		logger.info("DataStoreClientSMM2.get_metas_multiple_param()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_METAS_MULTIPLE_PARAM)
 		stream.list(params, stream.add)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.infos = stream.list(DataStoreMetaInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreClientSMM2.get_metas_multiple_param -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.infos = stream.list(DataStoreMetaInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreClientSMM2.get_metas_multiple_param -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_users(self, param):
+		return self.client.wait(self.get_users_async(param))
+	
+	def get_users_async(self, param):
 		logger.info("DataStoreClientSMM2.get_users()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_USERS)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.users = stream.list(UserInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreClientSMM2.get_users -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.users = stream.list(UserInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreClientSMM2.get_users -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def sync_user_profile(self, param):
+		return self.client.wait(self.sync_user_profile_async(param))
+	
+	def sync_user_profile_async(self, param):
 		logger.info("DataStoreClientSMM2.sync_user_profile()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SYNC_USER_PROFILE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.extract(SyncUserProfileResult)
-		logger.info("DataStoreClientSMM2.sync_user_profile -> done")
-		return result
+		def decode(stream):
+			result = stream.extract(SyncUserProfileResult)
+			logger.info("DataStoreClientSMM2.sync_user_profile -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def update_last_login_time(self):
+		return self.client.wait(self.update_last_login_time_async())
+	
+	def update_last_login_time_async(self):
 		logger.info("DataStoreClientSMM2.update_last_login_time()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_LAST_LOGIN_TIME)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreClientSMM2.update_last_login_time -> done")
+		def decode(stream):
+			logger.info("DataStoreClientSMM2.update_last_login_time -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_username_ng_type(self):
+		return self.client.wait(self.get_username_ng_type_async())
+	
+	def get_username_ng_type_async(self):
 		logger.info("DataStoreClientSMM2.get_username_ng_type()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_USERNAME_NG_TYPE)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unk = stream.u8()
-		logger.info("DataStoreClientSMM2.get_username_ng_type -> done")
-		return unk
+		def decode(stream):
+			unk = stream.u8()
+			logger.info("DataStoreClientSMM2.get_username_ng_type -> done")
+			return unk
+		return self.client.call(stream, call_id, decode)
 	
 	def get_course_info(self, param):
+		return self.client.wait(self.get_course_info_async(param))
+	
+	def get_course_info_async(self, param):
 		logger.info("DataStoreClientSMM2.get_course_info()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_COURSE_INFO)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.courses = stream.list(CourseInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreClientSMM2.get_course_info -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.courses = stream.list(CourseInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreClientSMM2.get_course_info -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def search_courses_point_ranking(self, param):
+		return self.client.wait(self.search_courses_point_ranking_async(param))
+	
+	def search_courses_point_ranking_async(self, param):
 		logger.info("DataStoreClientSMM2.search_courses_point_ranking()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SEARCH_COURSES_POINT_RANKING)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.courses = stream.list(CourseInfo)
-		obj.unk = stream.list(stream.u32)
-		obj.result = stream.bool()
-		logger.info("DataStoreClientSMM2.search_courses_point_ranking -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.courses = stream.list(CourseInfo)
+			obj.unk = stream.list(stream.u32)
+			obj.result = stream.bool()
+			logger.info("DataStoreClientSMM2.search_courses_point_ranking -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def search_courses_latest(self, param):
+		return self.client.wait(self.search_courses_latest_async(param))
+	
+	def search_courses_latest_async(self, param):
 		logger.info("DataStoreClientSMM2.search_courses_latest()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SEARCH_COURSES_LATEST)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.courses = stream.list(CourseInfo)
-		obj.result = stream.bool()
-		logger.info("DataStoreClientSMM2.search_courses_latest -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.courses = stream.list(CourseInfo)
+			obj.result = stream.bool()
+			logger.info("DataStoreClientSMM2.search_courses_latest -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def search_courses_endless_mode(self, param):
+		return self.client.wait(self.search_courses_endless_mode_async(param))
+	
+	def search_courses_endless_mode_async(self, param):
 		logger.info("DataStoreClientSMM2.search_courses_endless_mode()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SEARCH_COURSES_ENDLESS_MODE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		courses = stream.list(CourseInfo)
-		logger.info("DataStoreClientSMM2.search_courses_endless_mode -> done")
-		return courses
+		def decode(stream):
+			courses = stream.list(CourseInfo)
+			logger.info("DataStoreClientSMM2.search_courses_endless_mode -> done")
+			return courses
+		return self.client.call(stream, call_id, decode)
 	
 	def get_course_comments(self, data_id):
+		return self.client.wait(self.get_course_comments_async(data_id))
+	
+	def get_course_comments_async(self, data_id):
 		logger.info("DataStoreClientSMM2.get_course_comments()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_COURSE_COMMENTS)
 		stream.u64(data_id)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		comments = stream.list(CommentInfo)
-		logger.info("DataStoreClientSMM2.get_course_comments -> done")
-		return comments
+		def decode(stream):
+			comments = stream.list(CommentInfo)
+			logger.info("DataStoreClientSMM2.get_course_comments -> done")
+			return comments
+		return self.client.call(stream, call_id, decode)
 	
 	def get_user_or_course(self, param):
+		return self.client.wait(self.get_user_or_course_async(param))
+	
+	def get_user_or_course_async(self, param):
 		logger.info("DataStoreClientSMM2.get_user_or_course()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_USER_OR_COURSE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.user = stream.extract(UserInfo)
-		obj.course = stream.extract(CourseInfo)
-		logger.info("DataStoreClientSMM2.get_user_or_course -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.user = stream.extract(UserInfo)
+			obj.course = stream.extract(CourseInfo)
+			logger.info("DataStoreClientSMM2.get_user_or_course -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_get_relation_object(self, type):
+		return self.client.wait(self.prepare_get_relation_object_async(type))
+	
+	def prepare_get_relation_object_async(self, type):
 		logger.info("DataStoreClientSMM2.prepare_get_relation_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_GET_RELATION_OBJECT)
 		stream.u8(type)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.extract(RelationObjectReqGetInfo)
-		logger.info("DataStoreClientSMM2.prepare_get_relation_object -> done")
-		return result
+		def decode(stream):
+			result = stream.extract(RelationObjectReqGetInfo)
+			logger.info("DataStoreClientSMM2.prepare_get_relation_object -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 
 
 class DataStoreServerSMM2(DataStoreProtocolSMM2):
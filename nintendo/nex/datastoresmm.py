@@ -2,12 +2,15 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
 
 
 class CourseRecordInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<QB")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -24,8 +27,7 @@ class CourseRecordInfo(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.unk2 = stream.u8()
+		self.data_id, self.unk2 = stream.fields(CourseRecordInfo.FIELDS_0)
 		self.world_record_pid = stream.pid()
 		self.first_clear_pid = stream.pid()
 		self.world_record = stream.u32()
@@ -34,8 +36,7 @@ class CourseRecordInfo(common.Structure):
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u8(self.unk2)
+		stream.fields(CourseRecordInfo.FIELDS_0, self.data_id, self.unk2)
 		stream.pid(self.world_record_pid)
 		stream.pid(self.first_clear_pid)
 		stream.u32(self.world_record)
@@ -44,6 +45,8 @@ class CourseRecordInfo(common.Structure):
 
 
 class DataStoreChangeMetaCompareParam(common.Structure):
+	FIELDS_0 = struct.Struct("<IHB")
+	
 	def __init__(self):
 		super().__init__()
 		self.comparison_flag = None
@@ -70,9 +73,7 @@ class DataStoreChangeMetaCompareParam(common.Structure):
 		self.period = stream.u16()
 		self.meta_binary = stream.qbuffer()
 		self.tags = stream.list(stream.string)
-		self.referred_count = stream.u32()
-		self.data_type = stream.u16()
-		self.status = stream.u8()
+		self.referred_count, self.data_type, self.status = stream.fields(DataStoreChangeMetaCompareParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
@@ -83,12 +84,13 @@ class DataStoreChangeMetaCompareParam(common.Structure):
 		stream.u16(self.period)
 		stream.qbuffer(self.meta_binary)
 		stream.list(self.tags, stream.string)
-		stream.u32(self.referred_count)
-		stream.u16(self.data_type)
-		stream.u8(self.status)
+		stream.fields(DataStoreChangeMetaCompareParam.FIELDS_0, self.referred_count, self.data_type, self.status)
 
 
 class DataStoreChangeMetaParam(common.Structure):
+	FIELDS_0 = struct.Struct("<QI")
+	FIELDS_1 = struct.Struct("<QIHB")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -111,38 +113,32 @@ class DataStoreChangeMetaParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.modifies_flag = stream.u32()
+		self.data_id, self.modifies_flag = stream.fields(DataStoreChangeMetaParam.FIELDS_0)
 		self.name = stream.string()
 		self.permission = stream.extract(DataStorePermission)
 		self.delete_permission = stream.extract(DataStorePermission)
 		self.period = stream.u16()
 		self.meta_binary = stream.qbuffer()
 		self.tags = stream.list(stream.string)
-		self.update_password = stream.u64()
-		self.referred_count = stream.u32()
-		self.data_type = stream.u16()
-		self.status = stream.u8()
+		self.update_password, self.referred_count, self.data_type, self.status = stream.fields(DataStoreChangeMetaParam.FIELDS_1)
 		self.compare_param = stream.extract(DataStoreChangeMetaCompareParam)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u32(self.modifies_flag)
+		stream.fields(DataStoreChangeMetaParam.FIELDS_0, self.data_id, self.modifies_flag)
 		stream.string(self.name)
 		stream.add(self.permission)
 		stream.add(self.delete_permission)
 		stream.u16(self.period)
 		stream.qbuffer(self.meta_binary)
 		stream.list(self.tags, stream.string)
-		stream.u64(self.update_password)
-		stream.u32(self.referred_count)
-		stream.u16(self.data_type)
-		stream.u8(self.status)
+		stream.fields(DataStoreChangeMetaParam.FIELDS_1, self.update_password, self.referred_count, self.data_type, self.status)
 		stream.add(self.compare_param)
 
 
 class DataStoreCompletePostParam(common.Structure):
+	FIELDS_0 = struct.Struct("<Q?")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -154,13 +150,11 @@ class DataStoreCompletePostParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.is_success = stream.bool()
+		self.data_id, self.is_success = stream.fields(DataStoreCompletePostParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.bool(self.is_success)
+		stream.fields(DataStoreCompletePostParam.FIELDS_0, self.data_id, self.is_success)
 
 
 class DataStoreFileServerObjectInfo(common.Structure):
@@ -185,6 +179,8 @@ class DataStoreFileServerObjectInfo(common.Structure):
 
 
 class DataStoreGetMetaParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BQ")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = 0
@@ -198,18 +194,18 @@ class DataStoreGetMetaParam(common.Structure):
 	def load(self, stream):
 		self.data_id = stream.u64()
 		self.persistence_target = stream.extract(PersistenceTarget)
-		self.result_option = stream.u8()
-		self.access_password = stream.u64()
+		self.result_option, self.access_password = stream.fields(DataStoreGetMetaParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.u64(self.data_id)
 		stream.add(self.persistence_target)
-		stream.u8(self.result_option)
-		stream.u64(self.access_password)
+		stream.fields(DataStoreGetMetaParam.FIELDS_0, self.result_option, self.access_password)
 
 
 class DataStoreInfoStuff(common.Structure):
+	FIELDS_0 = struct.Struct("<II")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -222,14 +218,12 @@ class DataStoreInfoStuff(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u32()
-		self.stars_received = stream.u32()
+		self.unk1, self.stars_received = stream.fields(DataStoreInfoStuff.FIELDS_0)
 		self.info = stream.extract(DataStoreMetaInfo)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.unk1)
-		stream.u32(self.stars_received)
+		stream.fields(DataStoreInfoStuff.FIELDS_0, self.unk1, self.stars_received)
 		stream.add(self.info)
 
 
@@ -255,6 +249,8 @@ class DataStoreKeyValue(common.Structure):
 
 
 class DataStoreMetaInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<HBIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -293,11 +289,7 @@ class DataStoreMetaInfo(common.Structure):
 		self.delete_permission = stream.extract(DataStorePermission)
 		self.create_time = stream.datetime()
 		self.update_time = stream.datetime()
-		self.period = stream.u16()
-		self.status = stream.u8()
-		self.referred_count = stream.u32()
-		self.refer_data_id = stream.u32()
-		self.flag = stream.u32()
+		self.period, self.status, self.referred_count, self.refer_data_id, self.flag = stream.fields(DataStoreMetaInfo.FIELDS_0)
 		self.referred_time = stream.datetime()
 		self.expire_time = stream.datetime()
 		self.tags = stream.list(stream.string)
@@ -315,11 +307,7 @@ class DataStoreMetaInfo(common.Structure):
 		stream.add(self.delete_permission)
 		stream.datetime(self.create_time)
 		stream.datetime(self.update_time)
-		stream.u16(self.period)
-		stream.u8(self.status)
-		stream.u32(self.referred_count)
-		stream.u32(self.refer_data_id)
-		stream.u32(self.flag)
+		stream.fields(DataStoreMetaInfo.FIELDS_0, self.period, self.status, self.referred_count, self.refer_data_id, self.flag)
 		stream.datetime(self.referred_time)
 		stream.datetime(self.expire_time)
 		stream.list(self.tags, stream.string)
@@ -348,6 +336,8 @@ class DataStorePermission(common.Structure):
 
 
 class DataStorePersistenceInitParam(common.Structure):
+	FIELDS_0 = struct.Struct("<H?")
+	
 	def __init__(self):
 		super().__init__()
 		self.persistence_slot_id = None
@@ -359,16 +349,16 @@ class DataStorePersistenceInitParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.persistence_slot_id = stream.u16()
-		self.delete_last_object = stream.bool()
+		self.persistence_slot_id, self.delete_last_object = stream.fields(DataStorePersistenceInitParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u16(self.persistence_slot_id)
-		stream.bool(self.delete_last_object)
+		stream.fields(DataStorePersistenceInitParam.FIELDS_0, self.persistence_slot_id, self.delete_last_object)
 
 
 class DataStorePrepareGetParam(common.Structure):
+	FIELDS_0 = struct.Struct("<QI")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = 0
@@ -383,22 +373,22 @@ class DataStorePrepareGetParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.lock_id = stream.u32()
+		self.data_id, self.lock_id = stream.fields(DataStorePrepareGetParam.FIELDS_0)
 		self.persistence_target = stream.extract(PersistenceTarget)
 		self.access_password = stream.u64()
 		self.extra_data = stream.list(stream.string)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u32(self.lock_id)
+		stream.fields(DataStorePrepareGetParam.FIELDS_0, self.data_id, self.lock_id)
 		stream.add(self.persistence_target)
 		stream.u64(self.access_password)
 		stream.list(self.extra_data, stream.string)
 
 
 class DataStorePreparePostParam(common.Structure):
+	FIELDS_0 = struct.Struct("<IHI")
+	
 	def __init__(self):
 		super().__init__()
 		self.size = None
@@ -427,9 +417,7 @@ class DataStorePreparePostParam(common.Structure):
 		self.meta_binary = stream.qbuffer()
 		self.permission = stream.extract(DataStorePermission)
 		self.delete_permission = stream.extract(DataStorePermission)
-		self.flag = stream.u32()
-		self.period = stream.u16()
-		self.refer_data_id = stream.u32()
+		self.flag, self.period, self.refer_data_id = stream.fields(DataStorePreparePostParam.FIELDS_0)
 		self.tags = stream.list(stream.string)
 		self.rating_init_params = stream.list(DataStoreRatingInitParamWithSlot)
 		self.persistence_init_param = stream.extract(DataStorePersistenceInitParam)
@@ -443,9 +431,7 @@ class DataStorePreparePostParam(common.Structure):
 		stream.qbuffer(self.meta_binary)
 		stream.add(self.permission)
 		stream.add(self.delete_permission)
-		stream.u32(self.flag)
-		stream.u16(self.period)
-		stream.u32(self.refer_data_id)
+		stream.fields(DataStorePreparePostParam.FIELDS_0, self.flag, self.period, self.refer_data_id)
 		stream.list(self.tags, stream.string)
 		stream.list(self.rating_init_params, stream.add)
 		stream.add(self.persistence_init_param)
@@ -453,6 +439,8 @@ class DataStorePreparePostParam(common.Structure):
 
 
 class DataStoreRateObjectParam(common.Structure):
+	FIELDS_0 = struct.Struct("<iQ")
+	
 	def __init__(self):
 		super().__init__()
 		self.rating_value = None
@@ -464,16 +452,16 @@ class DataStoreRateObjectParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.rating_value = stream.s32()
-		self.access_password = stream.u64()
+		self.rating_value, self.access_password = stream.fields(DataStoreRateObjectParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.s32(self.rating_value)
-		stream.u64(self.access_password)
+		stream.fields(DataStoreRateObjectParam.FIELDS_0, self.rating_value, self.access_password)
 
 
 class DataStoreRatingInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<qIq")
+	
 	def __init__(self):
 		super().__init__()
 		self.total_value = None
@@ -486,15 +474,11 @@ class DataStoreRatingInfo(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.total_value = stream.s64()
-		self.count = stream.u32()
-		self.initial_value = stream.s64()
+		self.total_value, self.count, self.initial_value = stream.fields(DataStoreRatingInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.s64(self.total_value)
-		stream.u32(self.count)
-		stream.s64(self.initial_value)
+		stream.fields(DataStoreRatingInfo.FIELDS_0, self.total_value, self.count, self.initial_value)
 
 
 class DataStoreRatingInfoWithSlot(common.Structure):
@@ -519,6 +503,8 @@ class DataStoreRatingInfoWithSlot(common.Structure):
 
 
 class DataStoreRatingInitParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BBBqiibh")
+	
 	def __init__(self):
 		super().__init__()
 		self.flag = None
@@ -536,25 +522,11 @@ class DataStoreRatingInitParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.flag = stream.u8()
-		self.internal_flag = stream.u8()
-		self.lock_type = stream.u8()
-		self.initial_value = stream.s64()
-		self.range_min = stream.s32()
-		self.range_max = stream.s32()
-		self.period_hour = stream.s8()
-		self.period_duration = stream.s16()
+		self.flag, self.internal_flag, self.lock_type, self.initial_value, self.range_min, self.range_max, self.period_hour, self.period_duration = stream.fields(DataStoreRatingInitParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u8(self.flag)
-		stream.u8(self.internal_flag)
-		stream.u8(self.lock_type)
-		stream.s64(self.initial_value)
-		stream.s32(self.range_min)
-		stream.s32(self.range_max)
-		stream.s8(self.period_hour)
-		stream.s16(self.period_duration)
+		stream.fields(DataStoreRatingInitParam.FIELDS_0, self.flag, self.internal_flag, self.lock_type, self.initial_value, self.range_min, self.range_max, self.period_hour, self.period_duration)
 
 
 class DataStoreRatingInitParamWithSlot(common.Structure):
@@ -579,6 +551,8 @@ class DataStoreRatingInitParamWithSlot(common.Structure):
 
 
 class DataStoreRatingTarget(common.Structure):
+	FIELDS_0 = struct.Struct("<Qb")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -590,13 +564,11 @@ class DataStoreRatingTarget(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.slot = stream.s8()
+		self.data_id, self.slot = stream.fields(DataStoreRatingTarget.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.s8(self.slot)
+		stream.fields(DataStoreRatingTarget.FIELDS_0, self.data_id, self.slot)
 
 
 class DataStoreReqGetInfo(common.Structure):
@@ -735,6 +707,8 @@ class MethodParam59(common.Structure):
 
 
 class MethodParam71(common.Structure):
+	FIELDS_0 = struct.Struct("<QBI")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -747,15 +721,11 @@ class MethodParam71(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u64()
-		self.unk2 = stream.u8()
-		self.unk3 = stream.u32()
+		self.unk1, self.unk2, self.unk3 = stream.fields(MethodParam71.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.unk1)
-		stream.u8(self.unk2)
-		stream.u32(self.unk3)
+		stream.fields(MethodParam71.FIELDS_0, self.unk1, self.unk2, self.unk3)
 
 
 class MethodParam87(common.Structure):
@@ -805,6 +775,8 @@ class PersistenceTarget(common.Structure):
 
 
 class UnknownStruct(common.Structure):
+	FIELDS_0 = struct.Struct("<II")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -816,16 +788,16 @@ class UnknownStruct(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u32()
-		self.unk2 = stream.u32()
+		self.unk1, self.unk2 = stream.fields(UnknownStruct.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.unk1)
-		stream.u32(self.unk2)
+		stream.fields(UnknownStruct.FIELDS_0, self.unk1, self.unk2)
 
 
 class UnknownStruct2(common.Structure):
+	FIELDS_0 = struct.Struct("<QB")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -837,16 +809,16 @@ class UnknownStruct2(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.unk2 = stream.u8()
+		self.data_id, self.unk2 = stream.fields(UnknownStruct2.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u8(self.unk2)
+		stream.fields(UnknownStruct2.FIELDS_0, self.data_id, self.unk2)
 
 
 class UnknownStruct4(common.Structure):
+	FIELDS_0 = struct.Struct("<QI")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -858,16 +830,16 @@ class UnknownStruct4(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.unk2 = stream.u32()
+		self.data_id, self.unk2 = stream.fields(UnknownStruct4.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u32(self.unk2)
+		stream.fields(UnknownStruct4.FIELDS_0, self.data_id, self.unk2)
 
 
 class UnknownStruct5(common.Structure):
+	FIELDS_0 = struct.Struct("<BIIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -887,22 +859,16 @@ class UnknownStruct5(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u8()
-		self.unk2 = stream.u32()
-		self.unk3 = stream.u32()
-		self.unk4 = stream.u32()
-		self.unk5 = stream.u32()
+		self.unk1, self.unk2, self.unk3, self.unk4, self.unk5 = stream.fields(UnknownStruct5.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u8(self.unk1)
-		stream.u32(self.unk2)
-		stream.u32(self.unk3)
-		stream.u32(self.unk4)
-		stream.u32(self.unk5)
+		stream.fields(UnknownStruct5.FIELDS_0, self.unk1, self.unk2, self.unk3, self.unk4, self.unk5)
 
 
 class UnknownStruct6(common.Structure):
+	FIELDS_0 = struct.Struct("<QIIH")
+	
 	def __init__(self):
 		super().__init__()
 		self.data_id = None
@@ -916,20 +882,17 @@ class UnknownStruct6(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.data_id = stream.u64()
-		self.unk2 = stream.u32()
-		self.unk3 = stream.u32()
-		self.unk4 = stream.u16()
+		self.data_id, self.unk2, self.unk3, self.unk4 = stream.fields(UnknownStruct6.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.data_id)
-		stream.u32(self.unk2)
-		stream.u32(self.unk3)
-		stream.u16(self.unk4)
+		stream.fields(UnknownStruct6.FIELDS_0, self.data_id, self.unk2, self.unk3, self.unk4)
 
 
 class UnknownStruct7(common.Structure):
+	FIELDS_0 = struct.Struct("<BB")
+	FIELDS_1 = struct.Struct("<BI?")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -972,12 +935,9 @@ class UnknownStruct7(common.Structure):
 		self.unk9 = stream.datetime()
 		self.unk10 = stream.u32()
 		self.unk11 = stream.list(stream.string)
-		self.unk12 = stream.u8()
-		self.unk13 = stream.u8()
+		self.unk12, self.unk13 = stream.fields(UnknownStruct7.FIELDS_0)
 		self.unk14 = stream.extract(UnknownStruct)
-		self.unk15 = stream.u8()
-		self.unk16 = stream.u32()
-		self.unk17 = stream.bool()
+		self.unk15, self.unk16, self.unk17 = stream.fields(UnknownStruct7.FIELDS_1)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
@@ -992,12 +952,9 @@ class UnknownStruct7(common.Structure):
 		stream.datetime(self.unk9)
 		stream.u32(self.unk10)
 		stream.list(self.unk11, stream.string)
-		stream.u8(self.unk12)
-		stream.u8(self.unk13)
+		stream.fields(UnknownStruct7.FIELDS_0, self.unk12, self.unk13)
 		stream.add(self.unk14)
-		stream.u8(self.unk15)
-		stream.u32(self.unk16)
-		stream.bool(self.unk17)
+		stream.fields(UnknownStruct7.FIELDS_1, self.unk15, self.unk16, self.unk17)
 
 
 class DataStoreSmmProtocol:
@@ -1052,82 +1009,103 @@ class DataStoreSmmClient(DataStoreSmmProtocol):
 		self.client = client
 	
 	def get_meta(self, param):
+		return self.client.wait(self.get_meta_async(param))
+	
+	def get_meta_async(self, param):
 		logger.info("DataStoreSmmClient.get_meta()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_META)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreMetaInfo)
-		logger.info("DataStoreSmmClient.get_meta -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreMetaInfo)
+			logger.info("DataStoreSmmClient.get_meta -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_post_object(self, param):
+		return self.client.wait(self.prepare_post_object_async(param))
+	
+	def prepare_post_object_async(self, param):
 		logger.info("DataStoreSmmClient.prepare_post_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_POST_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreReqPostInfo)
-		logger.info("DataStoreSmmClient.prepare_post_object -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreReqPostInfo)
+			logger.info("DataStoreSmmClient.prepare_post_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_get_object(self, param):
+		return self.client.wait(self.prepare_get_object_async(param))
+	
+	def prepare_get_object_async(self, param):
 		logger.info("DataStoreSmmClient.prepare_get_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_GET_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(DataStoreReqGetInfo)
-		logger.info("DataStoreSmmClient.prepare_get_object -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(DataStoreReqGetInfo)
+			logger.info("DataStoreSmmClient.prepare_get_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def complete_post_object(self, param):
+		return self.client.wait(self.complete_post_object_async(param))
+	
+	def complete_post_object_async(self, param):
 		logger.info("DataStoreSmmClient.complete_post_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_COMPLETE_POST_OBJECT)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreSmmClient.complete_post_object -> done")
+		def decode(stream):
+			logger.info("DataStoreSmmClient.complete_post_object -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_metas_multiple_param(self, params):
+		return self.client.wait(self.get_metas_multiple_param_async(params))
+	
+	def get_metas_multiple_param_async(self, params):
 		logger.info("DataStoreSmmClient.get_metas_multiple_param()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_METAS_MULTIPLE_PARAM)
 		stream.list(params, stream.add)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.infos = stream.list(DataStoreMetaInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreSmmClient.get_metas_multiple_param -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.infos = stream.list(DataStoreMetaInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreSmmClient.get_metas_multiple_param -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def change_meta(self, param):
+		return self.client.wait(self.change_meta_async(param))
+	
+	def change_meta_async(self, param):
 		logger.info("DataStoreSmmClient.change_meta()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CHANGE_META)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreSmmClient.change_meta -> done")
+		def decode(stream):
+			logger.info("DataStoreSmmClient.change_meta -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def rate_objects(self, targets, params, transactional, fetch_ratings):
+		return self.client.wait(self.rate_objects_async(targets, params, transactional, fetch_ratings))
+	
+	def rate_objects_async(self, targets, params, transactional, fetch_ratings):
 		logger.info("DataStoreSmmClient.rate_objects()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_RATE_OBJECTS)
@@ -1135,339 +1113,411 @@ class DataStoreSmmClient(DataStoreSmmProtocol):
 		stream.list(params, stream.add)
 		stream.bool(transactional)
 		stream.bool(fetch_ratings)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.ratings = stream.list(DataStoreRatingInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreSmmClient.rate_objects -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.ratings = stream.list(DataStoreRatingInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreSmmClient.rate_objects -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_file_server_object_infos(self, object_ids):
+		return self.client.wait(self.get_file_server_object_infos_async(object_ids))
+	
+	def get_file_server_object_infos_async(self, object_ids):
 		logger.info("DataStoreSmmClient.get_file_server_object_infos()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_FILE_SERVER_OBJECT_INFOS)
 		stream.list(object_ids, stream.u64)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreFileServerObjectInfo)
-		logger.info("DataStoreSmmClient.get_file_server_object_infos -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreFileServerObjectInfo)
+			logger.info("DataStoreSmmClient.get_file_server_object_infos -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def rate_custom_ranking(self, param):
+		return self.client.wait(self.rate_custom_ranking_async(param))
+	
+	def rate_custom_ranking_async(self, param):
 		logger.info("DataStoreSmmClient.rate_custom_ranking()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_RATE_CUSTOM_RANKING)
 		stream.list(param, stream.add)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreSmmClient.rate_custom_ranking -> done")
+		def decode(stream):
+			logger.info("DataStoreSmmClient.rate_custom_ranking -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def method49(self, param):
+		return self.client.wait(self.method49_async(param))
+	
+	def method49_async(self, param):
 		logger.info("DataStoreSmmClient.method49()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_METHOD49)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.infos = stream.list(DataStoreInfoStuff)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreSmmClient.method49 -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.infos = stream.list(DataStoreInfoStuff)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreSmmClient.method49 -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def get_custom_ranking_by_data_id(self, param):
+		return self.client.wait(self.get_custom_ranking_by_data_id_async(param))
+	
+	def get_custom_ranking_by_data_id_async(self, param):
 		logger.info("DataStoreSmmClient.get_custom_ranking_by_data_id()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_CUSTOM_RANKING_BY_DATA_ID)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.infos = stream.list(DataStoreInfoStuff)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreSmmClient.get_custom_ranking_by_data_id -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.infos = stream.list(DataStoreInfoStuff)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreSmmClient.get_custom_ranking_by_data_id -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def add_to_buffer_queues(self, unknown1, unknown2):
+		return self.client.wait(self.add_to_buffer_queues_async(unknown1, unknown2))
+	
+	def add_to_buffer_queues_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.add_to_buffer_queues()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_ADD_TO_BUFFER_QUEUES)
 		stream.list(unknown1, stream.add)
 		stream.list(unknown2, stream.qbuffer)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		results = stream.list(stream.result)
-		logger.info("DataStoreSmmClient.add_to_buffer_queues -> done")
-		return results
+		def decode(stream):
+			results = stream.list(stream.result)
+			logger.info("DataStoreSmmClient.add_to_buffer_queues -> done")
+			return results
+		return self.client.call(stream, call_id, decode)
 	
 	def get_buffer_queue(self, param):
+		return self.client.wait(self.get_buffer_queue_async(param))
+	
+	def get_buffer_queue_async(self, param):
 		logger.info("DataStoreSmmClient.get_buffer_queue()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_BUFFER_QUEUE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		results = stream.list(stream.qbuffer)
-		logger.info("DataStoreSmmClient.get_buffer_queue -> done")
-		return results
+		def decode(stream):
+			results = stream.list(stream.qbuffer)
+			logger.info("DataStoreSmmClient.get_buffer_queue -> done")
+			return results
+		return self.client.call(stream, call_id, decode)
 	
 	def complete_attach_file(self, param):
+		return self.client.wait(self.complete_attach_file_async(param))
+	
+	def complete_attach_file_async(self, param):
 		logger.info("DataStoreSmmClient.complete_attach_file()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_COMPLETE_ATTACH_FILE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unknown = stream.string()
-		logger.info("DataStoreSmmClient.complete_attach_file -> done")
-		return unknown
+		def decode(stream):
+			unknown = stream.string()
+			logger.info("DataStoreSmmClient.complete_attach_file -> done")
+			return unknown
+		return self.client.call(stream, call_id, decode)
 	
 	def prepare_attach_file(self, param):
+		return self.client.wait(self.prepare_attach_file_async(param))
+	
+	def prepare_attach_file_async(self, param):
 		logger.info("DataStoreSmmClient.prepare_attach_file()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PREPARE_ATTACH_FILE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.extract(DataStoreReqPostInfo)
-		logger.info("DataStoreSmmClient.prepare_attach_file -> done")
-		return infos
+		def decode(stream):
+			infos = stream.extract(DataStoreReqPostInfo)
+			logger.info("DataStoreSmmClient.prepare_attach_file -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def conditional_search_object(self, unknown1, unknown2, unknown3):
+		return self.client.wait(self.conditional_search_object_async(unknown1, unknown2, unknown3))
+	
+	def conditional_search_object_async(self, unknown1, unknown2, unknown3):
 		logger.info("DataStoreSmmClient.conditional_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CONDITIONAL_SEARCH_OBJECT)
 		stream.u32(unknown1)
 		stream.add(unknown2)
 		stream.list(unknown3, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.conditional_search_object -> done")
-		return info
+		def decode(stream):
+			info = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.conditional_search_object -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def get_application_config(self, param):
+		return self.client.wait(self.get_application_config_async(param))
+	
+	def get_application_config_async(self, param):
 		logger.info("DataStoreSmmClient.get_application_config()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_APPLICATION_CONFIG)
 		stream.u32(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unknown = stream.list(stream.u32)
-		logger.info("DataStoreSmmClient.get_application_config -> done")
-		return unknown
+		def decode(stream):
+			unknown = stream.list(stream.u32)
+			logger.info("DataStoreSmmClient.get_application_config -> done")
+			return unknown
+		return self.client.call(stream, call_id, decode)
 	
 	def latest_course_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.latest_course_search_object_async(unknown1, unknown2))
+	
+	def latest_course_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.latest_course_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_LATEST_COURSE_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.latest_course_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.latest_course_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def followings_latest_course_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.followings_latest_course_search_object_async(unknown1, unknown2))
+	
+	def followings_latest_course_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.followings_latest_course_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_FOLLOWINGS_LATEST_COURSE_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.followings_latest_course_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.followings_latest_course_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def recommended_course_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.recommended_course_search_object_async(unknown1, unknown2))
+	
+	def recommended_course_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.recommended_course_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_RECOMMENDED_COURSE_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.recommended_course_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.recommended_course_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def score_range_cascaded_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.score_range_cascaded_search_object_async(unknown1, unknown2))
+	
+	def score_range_cascaded_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.score_range_cascaded_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SCORE_RANGE_CASCADED_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.score_range_cascaded_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.score_range_cascaded_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def suggested_course_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.suggested_course_search_object_async(unknown1, unknown2))
+	
+	def suggested_course_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.suggested_course_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SUGGESTED_COURSE_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.suggested_course_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.suggested_course_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def upload_course_record(self, param):
+		return self.client.wait(self.upload_course_record_async(param))
+	
+	def upload_course_record_async(self, param):
 		logger.info("DataStoreSmmClient.upload_course_record()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPLOAD_COURSE_RECORD)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreSmmClient.upload_course_record -> done")
+		def decode(stream):
+			logger.info("DataStoreSmmClient.upload_course_record -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_course_record(self, param):
+		return self.client.wait(self.get_course_record_async(param))
+	
+	def get_course_record_async(self, param):
 		logger.info("DataStoreSmmClient.get_course_record()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_COURSE_RECORD)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unknown = stream.extract(CourseRecordInfo)
-		logger.info("DataStoreSmmClient.get_course_record -> done")
-		return unknown
+		def decode(stream):
+			unknown = stream.extract(CourseRecordInfo)
+			logger.info("DataStoreSmmClient.get_course_record -> done")
+			return unknown
+		return self.client.call(stream, call_id, decode)
 	
 	def get_application_config_string(self, param):
+		return self.client.wait(self.get_application_config_string_async(param))
+	
+	def get_application_config_string_async(self, param):
 		logger.info("DataStoreSmmClient.get_application_config_string()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_APPLICATION_CONFIG_STRING)
 		stream.u32(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unknown = stream.list(stream.string)
-		logger.info("DataStoreSmmClient.get_application_config_string -> done")
-		return unknown
+		def decode(stream):
+			unknown = stream.list(stream.string)
+			logger.info("DataStoreSmmClient.get_application_config_string -> done")
+			return unknown
+		return self.client.call(stream, call_id, decode)
 	
 	def get_deletion_reason(self, unknown):
+		return self.client.wait(self.get_deletion_reason_async(unknown))
+	
+	def get_deletion_reason_async(self, unknown):
 		logger.info("DataStoreSmmClient.get_deletion_reason()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_DELETION_REASON)
 		stream.list(unknown, stream.u64)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unknown = stream.list(stream.u32)
-		logger.info("DataStoreSmmClient.get_deletion_reason -> done")
-		return unknown
+		def decode(stream):
+			unknown = stream.list(stream.u32)
+			logger.info("DataStoreSmmClient.get_deletion_reason -> done")
+			return unknown
+		return self.client.call(stream, call_id, decode)
 	
 	def get_metas_with_course_record(self, unknown, get_meta_param):
+		return self.client.wait(self.get_metas_with_course_record_async(unknown, get_meta_param))
+	
+	def get_metas_with_course_record_async(self, unknown, get_meta_param):
 		logger.info("DataStoreSmmClient.get_metas_with_course_record()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_METAS_WITH_COURSE_RECORD)
 		stream.list(unknown, stream.add)
 		stream.add(get_meta_param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.infos = stream.list(DataStoreMetaInfo)
-		obj.unknown = stream.list(CourseRecordInfo)
-		obj.results = stream.list(stream.result)
-		logger.info("DataStoreSmmClient.get_metas_with_course_record -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.infos = stream.list(DataStoreMetaInfo)
+			obj.unknown = stream.list(CourseRecordInfo)
+			obj.results = stream.list(stream.result)
+			logger.info("DataStoreSmmClient.get_metas_with_course_record -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def check_rate_custom_ranking_counter(self, unk1):
+		return self.client.wait(self.check_rate_custom_ranking_counter_async(unk1))
+	
+	def check_rate_custom_ranking_counter_async(self, unk1):
 		logger.info("DataStoreSmmClient.check_rate_custom_ranking_counter()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CHECK_RATE_CUSTOM_RANKING_COUNTER)
 		stream.u32(unk1)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("DataStoreSmmClient.check_rate_custom_ranking_counter -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("DataStoreSmmClient.check_rate_custom_ranking_counter -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def best_score_rate_course_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.best_score_rate_course_search_object_async(unknown1, unknown2))
+	
+	def best_score_rate_course_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.best_score_rate_course_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_BEST_SCORE_RATE_COURSE_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.best_score_rate_course_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.best_score_rate_course_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def ctr_pick_up_course_search_object(self, unknown1, unknown2):
+		return self.client.wait(self.ctr_pick_up_course_search_object_async(unknown1, unknown2))
+	
+	def ctr_pick_up_course_search_object_async(self, unknown1, unknown2):
 		logger.info("DataStoreSmmClient.ctr_pick_up_course_search_object()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CTR_PICK_UP_COURSE_SEARCH_OBJECT)
 		stream.add(unknown1)
 		stream.list(unknown2, stream.string)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(DataStoreInfoStuff)
-		logger.info("DataStoreSmmClient.ctr_pick_up_course_search_object -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(DataStoreInfoStuff)
+			logger.info("DataStoreSmmClient.ctr_pick_up_course_search_object -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def report_course(self, param):
+		return self.client.wait(self.report_course_async(param))
+	
+	def report_course_async(self, param):
 		logger.info("DataStoreSmmClient.report_course()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REPORT_COURSE)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DataStoreSmmClient.report_course -> done")
+		def decode(stream):
+			logger.info("DataStoreSmmClient.report_course -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class DataStoreSmmServer(DataStoreSmmProtocol):
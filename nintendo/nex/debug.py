@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -45,51 +46,63 @@ class DebugClient(DebugProtocol):
 		self.client = client
 	
 	def enable_api_recorder(self):
+		return self.client.wait(self.enable_api_recorder_async())
+	
+	def enable_api_recorder_async(self):
 		logger.info("DebugClient.enable_api_recorder()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_ENABLE_API_RECORDER)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DebugClient.enable_api_recorder -> done")
+		def decode(stream):
+			logger.info("DebugClient.enable_api_recorder -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def disable_api_recorder(self):
+		return self.client.wait(self.disable_api_recorder_async())
+	
+	def disable_api_recorder_async(self):
 		logger.info("DebugClient.disable_api_recorder()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_DISABLE_API_RECORDER)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("DebugClient.disable_api_recorder -> done")
+		def decode(stream):
+			logger.info("DebugClient.disable_api_recorder -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def is_api_recorder_enabled(self):
+		return self.client.wait(self.is_api_recorder_enabled_async())
+	
+	def is_api_recorder_enabled_async(self):
 		logger.info("DebugClient.is_api_recorder_enabled()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_IS_API_RECORDER_ENABLED)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("DebugClient.is_api_recorder_enabled -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("DebugClient.is_api_recorder_enabled -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def get_api_calls(self, pids, unk2, unk3):
+		return self.client.wait(self.get_api_calls_async(pids, unk2, unk3))
+	
+	def get_api_calls_async(self, pids, unk2, unk3):
 		logger.info("DebugClient.get_api_calls()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_API_CALLS)
 		stream.list(pids, stream.pid)
 		stream.u64(unk2)
 		stream.u64(unk3)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		calls = stream.list(ApiCall)
-		logger.info("DebugClient.get_api_calls -> done")
-		return calls
+		def decode(stream):
+			calls = stream.list(ApiCall)
+			logger.info("DebugClient.get_api_calls -> done")
+			return calls
+		return self.client.call(stream, call_id, decode)
 
 
 class DebugServer(DebugProtocol):
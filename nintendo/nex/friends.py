@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -117,6 +118,8 @@ common.DataHolder.register(FriendRequest, "FriendRequest")
 
 
 class FriendRequestMessage(common.Data):
+	FIELDS_0 = struct.Struct("<QBB")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -135,9 +138,7 @@ class FriendRequestMessage(common.Data):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u64()
-		self.unk2 = stream.u8()
-		self.unk3 = stream.u8()
+		self.unk1, self.unk2, self.unk3 = stream.fields(FriendRequestMessage.FIELDS_0)
 		self.message = stream.string()
 		self.unk4 = stream.u8()
 		self.string = stream.string()
@@ -147,9 +148,7 @@ class FriendRequestMessage(common.Data):
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.unk1)
-		stream.u8(self.unk2)
-		stream.u8(self.unk3)
+		stream.fields(FriendRequestMessage.FIELDS_0, self.unk1, self.unk2, self.unk3)
 		stream.string(self.message)
 		stream.u8(self.unk4)
 		stream.string(self.string)
@@ -160,6 +159,8 @@ common.DataHolder.register(FriendRequestMessage, "FriendRequestMessage")
 
 
 class GameKey(common.Data):
+	FIELDS_0 = struct.Struct("<QH")
+	
 	def __init__(self):
 		super().__init__()
 		self.title_id = 0
@@ -169,17 +170,17 @@ class GameKey(common.Data):
 		pass
 	
 	def load(self, stream):
-		self.title_id = stream.u64()
-		self.title_version = stream.u16()
+		self.title_id, self.title_version = stream.fields(GameKey.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.title_id)
-		stream.u16(self.title_version)
+		stream.fields(GameKey.FIELDS_0, self.title_id, self.title_version)
 common.DataHolder.register(GameKey, "GameKey")
 
 
 class MiiV2(common.Data):
+	FIELDS_0 = struct.Struct("<BB")
+	
 	def __init__(self):
 		super().__init__()
 		self.name = None
@@ -195,22 +196,22 @@ class MiiV2(common.Data):
 	
 	def load(self, stream):
 		self.name = stream.string()
-		self.unk1 = stream.u8()
-		self.unk2 = stream.u8()
+		self.unk1, self.unk2 = stream.fields(MiiV2.FIELDS_0)
 		self.data = stream.buffer()
 		self.datetime = stream.datetime()
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.string(self.name)
-		stream.u8(self.unk1)
-		stream.u8(self.unk2)
+		stream.fields(MiiV2.FIELDS_0, self.unk1, self.unk2)
 		stream.buffer(self.data)
 		stream.datetime(self.datetime)
 common.DataHolder.register(MiiV2, "MiiV2")
 
 
 class NNAInfo(common.Data):
+	FIELDS_0 = struct.Struct("<BB")
+	
 	def __init__(self):
 		super().__init__()
 		self.principal_info = PrincipalBasicInfo()
@@ -222,18 +223,20 @@ class NNAInfo(common.Data):
 	
 	def load(self, stream):
 		self.principal_info = stream.extract(PrincipalBasicInfo)
-		self.unk1 = stream.u8()
-		self.unk2 = stream.u8()
+		self.unk1, self.unk2 = stream.fields(NNAInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.add(self.principal_info)
-		stream.u8(self.unk1)
-		stream.u8(self.unk2)
+		stream.fields(NNAInfo.FIELDS_0, self.unk1, self.unk2)
 common.DataHolder.register(NNAInfo, "NNAInfo")
 
 
 class NintendoPresenceV2(common.Data):
+	FIELDS_0 = struct.Struct("<I?")
+	FIELDS_1 = struct.Struct("<IBIIII")
+	FIELDS_2 = struct.Struct("<BBB")
+	
 	def __init__(self):
 		super().__init__()
 		self.flags = 0
@@ -256,43 +259,29 @@ class NintendoPresenceV2(common.Data):
 		pass
 	
 	def load(self, stream):
-		self.flags = stream.u32()
-		self.is_online = stream.bool()
+		self.flags, self.is_online = stream.fields(NintendoPresenceV2.FIELDS_0)
 		self.game_key = stream.extract(GameKey)
 		self.unk1 = stream.u8()
 		self.message = stream.string()
-		self.unk2 = stream.u32()
-		self.unk3 = stream.u8()
-		self.game_server_id = stream.u32()
-		self.unk4 = stream.u32()
-		self.pid = stream.u32()
-		self.gathering_id = stream.u32()
+		self.unk2, self.unk3, self.game_server_id, self.unk4, self.pid, self.gathering_id = stream.fields(NintendoPresenceV2.FIELDS_1)
 		self.application_data = stream.buffer()
-		self.unk5 = stream.u8()
-		self.unk6 = stream.u8()
-		self.unk7 = stream.u8()
+		self.unk5, self.unk6, self.unk7 = stream.fields(NintendoPresenceV2.FIELDS_2)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.flags)
-		stream.bool(self.is_online)
+		stream.fields(NintendoPresenceV2.FIELDS_0, self.flags, self.is_online)
 		stream.add(self.game_key)
 		stream.u8(self.unk1)
 		stream.string(self.message)
-		stream.u32(self.unk2)
-		stream.u8(self.unk3)
-		stream.u32(self.game_server_id)
-		stream.u32(self.unk4)
-		stream.u32(self.pid)
-		stream.u32(self.gathering_id)
+		stream.fields(NintendoPresenceV2.FIELDS_1, self.unk2, self.unk3, self.game_server_id, self.unk4, self.pid, self.gathering_id)
 		stream.buffer(self.application_data)
-		stream.u8(self.unk5)
-		stream.u8(self.unk6)
-		stream.u8(self.unk7)
+		stream.fields(NintendoPresenceV2.FIELDS_2, self.unk5, self.unk6, self.unk7)
 common.DataHolder.register(NintendoPresenceV2, "NintendoPresenceV2")
 
 
 class PersistentNotification(common.Data):
+	FIELDS_0 = struct.Struct("<QIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -307,18 +296,12 @@ class PersistentNotification(common.Data):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u64()
-		self.unk2 = stream.u32()
-		self.unk3 = stream.u32()
-		self.unk4 = stream.u32()
+		self.unk1, self.unk2, self.unk3, self.unk4 = stream.fields(PersistentNotification.FIELDS_0)
 		self.string = stream.string()
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.unk1)
-		stream.u32(self.unk2)
-		stream.u32(self.unk3)
-		stream.u32(self.unk4)
+		stream.fields(PersistentNotification.FIELDS_0, self.unk1, self.unk2, self.unk3, self.unk4)
 		stream.string(self.string)
 common.DataHolder.register(PersistentNotification, "PersistentNotification")
 
@@ -352,6 +335,8 @@ common.DataHolder.register(PrincipalBasicInfo, "PrincipalBasicInfo")
 
 
 class PrincipalPreference(common.Data):
+	FIELDS_0 = struct.Struct("<???")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -364,15 +349,11 @@ class PrincipalPreference(common.Data):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.bool()
-		self.unk2 = stream.bool()
-		self.unk3 = stream.bool()
+		self.unk1, self.unk2, self.unk3 = stream.fields(PrincipalPreference.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.bool(self.unk1)
-		stream.bool(self.unk2)
-		stream.bool(self.unk3)
+		stream.fields(PrincipalPreference.FIELDS_0, self.unk1, self.unk2, self.unk3)
 common.DataHolder.register(PrincipalPreference, "PrincipalPreference")
 
 
@@ -406,39 +387,45 @@ class FriendsClient(FriendsProtocol):
 		self.client = client
 	
 	def get_all_information(self, nna_info, presence, birthday):
+		return self.client.wait(self.get_all_information_async(nna_info, presence, birthday))
+	
+	def get_all_information_async(self, nna_info, presence, birthday):
 		logger.info("FriendsClient.get_all_information()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_ALL_INFORMATION)
 		stream.add(nna_info)
 		stream.add(presence)
 		stream.datetime(birthday)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.principal_preference = stream.extract(PrincipalPreference)
-		obj.comment = stream.extract(Comment)
-		obj.friends = stream.list(FriendInfo)
-		obj.sent_requests = stream.list(FriendRequest)
-		obj.received_requests = stream.list(FriendRequest)
-		obj.blacklist = stream.list(BlacklistedPrincipal)
-		obj.unk1 = stream.bool()
-		obj.notifications = stream.list(PersistentNotification)
-		obj.unk2 = stream.bool()
-		logger.info("FriendsClient.get_all_information -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.principal_preference = stream.extract(PrincipalPreference)
+			obj.comment = stream.extract(Comment)
+			obj.friends = stream.list(FriendInfo)
+			obj.sent_requests = stream.list(FriendRequest)
+			obj.received_requests = stream.list(FriendRequest)
+			obj.blacklist = stream.list(BlacklistedPrincipal)
+			obj.unk1 = stream.bool()
+			obj.notifications = stream.list(PersistentNotification)
+			obj.unk2 = stream.bool()
+			logger.info("FriendsClient.get_all_information -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def update_presence(self, presence):
+		return self.client.wait(self.update_presence_async(presence))
+	
+	def update_presence_async(self, presence):
 		logger.info("FriendsClient.update_presence()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPDATE_PRESENCE)
 		stream.add(presence)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("FriendsClient.update_presence -> done")
+		def decode(stream):
+			logger.info("FriendsClient.update_presence -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class FriendsServer(FriendsProtocol):
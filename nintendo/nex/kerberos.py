@@ -1,6 +1,8 @@
 
 from nintendo.common import crypto
 from nintendo.nex import streams
+import collections
+import threading
 import struct
 import secrets
 import hashlib
@@ -36,6 +38,97 @@ class KeyDerivationNew:
 		return key
 
 
+
+Account = collections.namedtuple("Account", "pid name password")
+
+
+class KeyStore:
+	#Keeps the accounts of a server indexed by name and pid and
+	#caches their kerberos keys, because key derivation may take
+	#tens of thousands of md5 digests. Keys are cached by pid and
+	#password hash, so a password change never returns a stale key.
+	def __init__(self, key_derivation):
+		self.key_derivation = key_derivation
+		
+		self.lock = threading.Lock()
+		self.by_name = {}
+		self.by_pid = {}
+		self.keys = {}
+		
+		self.hits = 0
+		self.misses = 0
+		
+	def set_key_derivation(self, key_derivation):
+		with self.lock:
+			self.key_derivation = key_derivation
+			self.keys = {}
+		
+	def add(self, pid, name, password):
+		if isinstance(password, str):
+			password = password.encode("ascii")
+		
+		account = Account(pid, name, password)
+		with self.lock:
+			#Names and pids are both unique, so this replaces
+			#up to two accounts
+			self.remove_account(pid)
+			if name in self.by_name:
+				self.remove_account(self.by_name[name].pid)
+			self.by_name[name] = account
+			self.by_pid[pid] = account
+		return account
+		
+	def remove(self, pid):
+		with self.lock:
+			self.remove_account(pid)
+			
+	def remove_account(self, pid):
+		account = self.by_pid.pop(pid, None)
+		if account:
+			if self.by_name.get(account.name) is account:
+				del self.by_name[account.name]
+			self.keys.pop(self.cache_key(account), None)
+		
+	def set_password(self, pid, password):
+		account = self.by_pid[pid]
+		return self.add(pid, account.name, password)
+		
+	def get_by_name(self, name):
+		return self.by_name.get(name)
+		
+	def get_by_pid(self, pid):
+		return self.by_pid.get(pid)
+		
+	def get_key(self, pid):
+		account = self.by_pid.get(pid)
+		if not account:
+			raise KeyError("Unknown pid: %i" %pid)
+		
+		cache_key = self.cache_key(account)
+		key = self.keys.get(cache_key)
+		if key is not None:
+			self.hits += 1
+			return key
+		
+		self.misses += 1
+		key_derivation = self.key_derivation
+		key = key_derivation.derive_key(account.password, pid)
+		with self.lock:
+			#Don't cache the key if the account or key derivation
+			#was changed while the key was being derived
+			if self.by_pid.get(pid) is account and self.key_derivation is key_derivation:
+				self.keys[cache_key] = key
+		return key
+		
+	def precompute(self):
+		#Derives the keys of all accounts in advance
+		for pid in list(self.by_pid):
+			self.get_key(pid)
+		
+	def cache_key(self, account):
+		return account.pid, hashlib.sha256(account.password).digest()
+
+
 class KerberosEncryption:
 	def __init__(self, key):
 		self.key = key
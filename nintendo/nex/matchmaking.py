@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -13,6 +14,8 @@ class MatchmakeSystem:
 
 
 class Gathering(common.Structure):
+	FIELDS_0 = struct.Struct("<HHIIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.id = 0
@@ -33,12 +36,7 @@ class Gathering(common.Structure):
 		self.id = stream.u32()
 		self.owner_pid = stream.pid()
 		self.host_pid = stream.pid()
-		self.player_min = stream.u16()
-		self.player_max = stream.u16()
-		self.participation_policy = stream.u32()
-		self.policy_argument = stream.u32()
-		self.flags = stream.u32()
-		self.state = stream.u32()
+		self.player_min, self.player_max, self.participation_policy, self.policy_argument, self.flags, self.state = stream.fields(Gathering.FIELDS_0)
 		self.description = stream.string()
 	
 	def save(self, stream):
@@ -46,16 +44,13 @@ class Gathering(common.Structure):
 		stream.u32(self.id)
 		stream.pid(self.owner_pid)
 		stream.pid(self.host_pid)
-		stream.u16(self.player_min)
-		stream.u16(self.player_max)
-		stream.u32(self.participation_policy)
-		stream.u32(self.policy_argument)
-		stream.u32(self.flags)
-		stream.u32(self.state)
+		stream.fields(Gathering.FIELDS_0, self.player_min, self.player_max, self.participation_policy, self.policy_argument, self.flags, self.state)
 		stream.string(self.description)
 
 
 class MatchmakeSession(Gathering):
+	FIELDS_0 = struct.Struct("<?I")
+	
 	def __init__(self):
 		super().__init__()
 		self.game_mode = 0
@@ -77,8 +72,7 @@ class MatchmakeSession(Gathering):
 	def load(self, stream):
 		self.game_mode = stream.u32()
 		self.attribs = stream.list(stream.u32)
-		self.open_participation = stream.bool()
-		self.matchmake_system = stream.u32()
+		self.open_participation, self.matchmake_system = stream.fields(MatchmakeSession.FIELDS_0)
 		self.application_data = stream.buffer()
 		self.player_count = stream.u32()
 		if stream.settings.get("nex.version") >= 30500:
@@ -91,8 +85,7 @@ class MatchmakeSession(Gathering):
 		self.check_required(stream.settings)
 		stream.u32(self.game_mode)
 		stream.list(self.attribs, stream.u32)
-		stream.bool(self.open_participation)
-		stream.u32(self.matchmake_system)
+		stream.fields(MatchmakeSession.FIELDS_0, self.open_participation, self.matchmake_system)
 		stream.buffer(self.application_data)
 		stream.u32(self.player_count)
 		if stream.settings.get("nex.version") >= 30500:
@@ -104,6 +97,8 @@ common.DataHolder.register(MatchmakeSession, "MatchmakeSession")
 
 
 class MatchmakeSessionSearchCriteria(common.Structure):
+	FIELDS_0 = struct.Struct("<???I")
+	
 	def __init__(self):
 		super().__init__()
 		self.attribs = None
@@ -132,10 +127,7 @@ class MatchmakeSessionSearchCriteria(common.Structure):
 		self.min_players = stream.string()
 		self.max_players = stream.string()
 		self.matchmake_system = stream.string()
-		self.vacant_only = stream.bool()
-		self.exclude_locked = stream.bool()
-		self.exclude_non_host_pid = stream.bool()
-		self.selection_method = stream.u32()
+		self.vacant_only, self.exclude_locked, self.exclude_non_host_pid, self.selection_method = stream.fields(MatchmakeSessionSearchCriteria.FIELDS_0)
 		if stream.settings.get("nex.version") >= 30500:
 			self.vacant_participants = stream.u16()
 	
@@ -146,10 +138,7 @@ class MatchmakeSessionSearchCriteria(common.Structure):
 		stream.string(self.min_players)
 		stream.string(self.max_players)
 		stream.string(self.matchmake_system)
-		stream.bool(self.vacant_only)
-		stream.bool(self.exclude_locked)
-		stream.bool(self.exclude_non_host_pid)
-		stream.u32(self.selection_method)
+		stream.fields(MatchmakeSessionSearchCriteria.FIELDS_0, self.vacant_only, self.exclude_locked, self.exclude_non_host_pid, self.selection_method)
 		if stream.settings.get("nex.version") >= 30500:
 			stream.u16(self.vacant_participants)
 
@@ -176,6 +165,8 @@ class PlayingSession(common.Structure):
 
 
 class SimplePlayingSession(common.Structure):
+	FIELDS_0 = struct.Struct("<III")
+	
 	def __init__(self):
 		super().__init__()
 		self.pid = None
@@ -190,16 +181,12 @@ class SimplePlayingSession(common.Structure):
 	
 	def load(self, stream):
 		self.pid = stream.pid()
-		self.gid = stream.u32()
-		self.game_mode = stream.u32()
-		self.attribute = stream.u32()
+		self.gid, self.game_mode, self.attribute = stream.fields(SimplePlayingSession.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.pid(self.pid)
-		stream.u32(self.gid)
-		stream.u32(self.game_mode)
-		stream.u32(self.attribute)
+		stream.fields(SimplePlayingSession.FIELDS_0, self.gid, self.game_mode, self.attribute)
 
 
 class MatchMakingProtocol:
@@ -306,44 +293,53 @@ class MatchMakingClient(MatchMakingProtocol):
 		self.client = client
 	
 	def find_by_participants(self, pids):
+		return self.client.wait(self.find_by_participants_async(pids))
+	
+	def find_by_participants_async(self, pids):
 		logger.info("MatchMakingClient.find_by_participants()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_FIND_BY_PARTICIPANTS)
 		stream.list(pids, stream.pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		gatherings = stream.list(stream.anydata)
-		logger.info("MatchMakingClient.find_by_participants -> done")
-		return gatherings
+		def decode(stream):
+			gatherings = stream.list(stream.anydata)
+			logger.info("MatchMakingClient.find_by_participants -> done")
+			return gatherings
+		return self.client.call(stream, call_id, decode)
 	
 	def find_by_sql_query(self, query, range):
+		return self.client.wait(self.find_by_sql_query_async(query, range))
+	
+	def find_by_sql_query_async(self, query, range):
 		logger.info("MatchMakingClient.find_by_sql_query()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_FIND_BY_SQL_QUERY)
 		stream.string(query)
 		stream.add(range)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		gatherings = stream.list(stream.anydata)
-		logger.info("MatchMakingClient.find_by_sql_query -> done")
-		return gatherings
+		def decode(stream):
+			gatherings = stream.list(stream.anydata)
+			logger.info("MatchMakingClient.find_by_sql_query -> done")
+			return gatherings
+		return self.client.call(stream, call_id, decode)
 	
 	def get_session_urls(self, gid):
+		return self.client.wait(self.get_session_urls_async(gid))
+	
+	def get_session_urls_async(self, gid):
 		logger.info("MatchMakingClient.get_session_urls()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_SESSION_URLS)
 		stream.u32(gid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		urls = stream.list(stream.stationurl)
-		logger.info("MatchMakingClient.get_session_urls -> done")
-		return urls
+		def decode(stream):
+			urls = stream.list(stream.stationurl)
+			logger.info("MatchMakingClient.get_session_urls -> done")
+			return urls
+		return self.client.call(stream, call_id, decode)
 
 
 class MatchmakeExtensionClient(MatchmakeExtensionProtocol):
@@ -351,104 +347,125 @@ class MatchmakeExtensionClient(MatchmakeExtensionProtocol):
 		self.client = client
 	
 	def auto_matchmake_postpone(self, gathering, message):
+		return self.client.wait(self.auto_matchmake_postpone_async(gathering, message))
+	
+	def auto_matchmake_postpone_async(self, gathering, message):
 		logger.info("MatchmakeExtensionClient.auto_matchmake_postpone()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_AUTO_MATCHMAKE_POSTPONE)
 		stream.anydata(gathering)
 		stream.string(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		gathering = stream.anydata()
-		logger.info("MatchmakeExtensionClient.auto_matchmake_postpone -> done")
-		return gathering
+		def decode(stream):
+			gathering = stream.anydata()
+			logger.info("MatchmakeExtensionClient.auto_matchmake_postpone -> done")
+			return gathering
+		return self.client.call(stream, call_id, decode)
 	
 	def create_matchmake_session(self, gathering, description, participation_count):
+		return self.client.wait(self.create_matchmake_session_async(gathering, description, participation_count))
+	
+	def create_matchmake_session_async(self, gathering, description, participation_count):
 		logger.info("MatchmakeExtensionClient.create_matchmake_session()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_CREATE_MATCHMAKE_SESSION)
 		stream.anydata(gathering)
 		stream.string(description)
 		stream.u16(participation_count)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.gid = stream.u32()
-		obj.session_key = stream.buffer()
-		logger.info("MatchmakeExtensionClient.create_matchmake_session -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.gid = stream.u32()
+			obj.session_key = stream.buffer()
+			logger.info("MatchmakeExtensionClient.create_matchmake_session -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def join_matchmake_session(self, gid, message):
+		return self.client.wait(self.join_matchmake_session_async(gid, message))
+	
+	def join_matchmake_session_async(self, gid, message):
 		logger.info("MatchmakeExtensionClient.join_matchmake_session()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_JOIN_MATCHMAKE_SESSION)
 		stream.u32(gid)
 		stream.string(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		session_key = stream.buffer()
-		logger.info("MatchmakeExtensionClient.join_matchmake_session -> done")
-		return session_key
+		def decode(stream):
+			session_key = stream.buffer()
+			logger.info("MatchmakeExtensionClient.join_matchmake_session -> done")
+			return session_key
+		return self.client.call(stream, call_id, decode)
 	
 	def auto_matchmake_with_search_criteria_postpone(self, search_criteria, gathering, message):
+		return self.client.wait(self.auto_matchmake_with_search_criteria_postpone_async(search_criteria, gathering, message))
+	
+	def auto_matchmake_with_search_criteria_postpone_async(self, search_criteria, gathering, message):
 		logger.info("MatchmakeExtensionClient.auto_matchmake_with_search_criteria_postpone()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_AUTO_MATCHMAKE_WITH_SEARCH_CRITERIA_POSTPONE)
 		stream.list(search_criteria, stream.add)
 		stream.anydata(gathering)
 		stream.string(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		gathering = stream.anydata()
-		logger.info("MatchmakeExtensionClient.auto_matchmake_with_search_criteria_postpone -> done")
-		return gathering
+		def decode(stream):
+			gathering = stream.anydata()
+			logger.info("MatchmakeExtensionClient.auto_matchmake_with_search_criteria_postpone -> done")
+			return gathering
+		return self.client.call(stream, call_id, decode)
 	
 	def get_playing_session(self, pids):
+		return self.client.wait(self.get_playing_session_async(pids))
+	
+	def get_playing_session_async(self, pids):
 		logger.info("MatchmakeExtensionClient.get_playing_session()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_PLAYING_SESSION)
 		stream.list(pids, stream.pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		sessions = stream.list(PlayingSession)
-		logger.info("MatchmakeExtensionClient.get_playing_session -> done")
-		return sessions
+		def decode(stream):
+			sessions = stream.list(PlayingSession)
+			logger.info("MatchmakeExtensionClient.get_playing_session -> done")
+			return sessions
+		return self.client.call(stream, call_id, decode)
 	
 	def get_simple_playing_session(self, pids, include_login_user):
+		return self.client.wait(self.get_simple_playing_session_async(pids, include_login_user))
+	
+	def get_simple_playing_session_async(self, pids, include_login_user):
 		logger.info("MatchmakeExtensionClient.get_simple_playing_session()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_SIMPLE_PLAYING_SESSION)
 		stream.list(pids, stream.pid)
 		stream.bool(include_login_user)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		session = stream.list(SimplePlayingSession)
-		logger.info("MatchmakeExtensionClient.get_simple_playing_session -> done")
-		return session
+		def decode(stream):
+			session = stream.list(SimplePlayingSession)
+			logger.info("MatchmakeExtensionClient.get_simple_playing_session -> done")
+			return session
+		return self.client.call(stream, call_id, decode)
 	
 	def find_matchmake_session_by_gathering_id_detail(self, gid):
+		return self.client.wait(self.find_matchmake_session_by_gathering_id_detail_async(gid))
+	
+	def find_matchmake_session_by_gathering_id_detail_async(self, gid):
 		logger.info("MatchmakeExtensionClient.find_matchmake_session_by_gathering_id_detail()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_FIND_MATCHMAKE_SESSION_BY_GATHERING_ID_DETAIL)
 		stream.u32(gid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		session = stream.extract(MatchmakeSession)
-		logger.info("MatchmakeExtensionClient.find_matchmake_session_by_gathering_id_detail -> done")
-		return session
+		def decode(stream):
+			session = stream.extract(MatchmakeSession)
+			logger.info("MatchmakeExtensionClient.find_matchmake_session_by_gathering_id_detail -> done")
+			return session
+		return self.client.call(stream, call_id, decode)
 
 
 class MatchMakingServer(MatchMakingProtocol):
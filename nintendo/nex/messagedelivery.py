@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -18,15 +19,18 @@ class MessageDeliveryClient(MessageDeliveryProtocol):
 		self.client = client
 	
 	def deliver_message(self, message):
+		return self.client.wait(self.deliver_message_async(message))
+	
+	def deliver_message_async(self, message):
 		logger.info("MessageDeliveryClient.deliver_message()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_DELIVER_MESSAGE)
 		stream.anydata(message)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("MessageDeliveryClient.deliver_message -> done")
+		def decode(stream):
+			logger.info("MessageDeliveryClient.deliver_message -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class MessageDeliveryServer(MessageDeliveryProtocol):
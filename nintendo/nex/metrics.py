@@ -0,0 +1,140 @@
+
+from nintendo.common import metrics
+from nintendo.nex import prudp
+import threading
+import bisect
+
+
+#Upper bounds of the latency buckets in seconds
+LATENCY_BUCKETS = (
+	0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+	0.05, 0.1, 0.25, 0.5, 1, 2.5, 5
+)
+
+
+class Histogram:
+	def __init__(self, buckets):
+		self.buckets = buckets
+		#The last count is for values above the largest bucket
+		self.counts = [0] * (len(buckets) + 1)
+		self.sum = 0
+		self.count = 0
+
+	def observe(self, value):
+		self.counts[bisect.bisect_left(self.buckets, value)] += 1
+		self.sum += value
+		self.count += 1
+
+	def cumulative(self):
+		#Returns (upper bound, count) pairs, with None as the
+		#upper bound of the last bucket
+		total = 0
+		pairs = []
+		for bound, count in zip(self.buckets + (None,), self.counts):
+			total += count
+			pairs.append((bound, total))
+		return pairs
+
+	def quantile(self, q):
+		#Estimates a quantile from the bucket bounds
+		if self.count == 0:
+			return 0
+		rank = q * self.count
+		for bound, total in self.cumulative():
+			if total >= rank:
+				if bound is None:
+					return self.buckets[-1]
+				return bound
+
+
+class MethodStats:
+	def __init__(self, buckets):
+		self.calls = 0
+		self.errors = {}
+		self.request_bytes = 0
+		self.response_bytes = 0
+		self.latency = Histogram(buckets)
+
+
+class RMCMetrics:
+	#Collects statistics per (side, protocol id, method id), where
+	#side is "client" or "server". Nothing is recorded unless an
+	#instance is attached to an RMC client or server.
+	def __init__(self, buckets=LATENCY_BUCKETS):
+		self.buckets = tuple(buckets)
+		self.lock = threading.Lock()
+		self.methods = {}
+
+	def record(self, side, protocol_id, method_id, latency, request_size, response_size, error=None):
+		key = (side, protocol_id, method_id)
+		with self.lock:
+			stats = self.methods.get(key)
+			if not stats:
+				stats = MethodStats(self.buckets)
+				self.methods[key] = stats
+
+			stats.calls += 1
+			stats.request_bytes += request_size
+			stats.response_bytes += response_size
+			stats.latency.observe(latency)
+			if error:
+				stats.errors[error] = stats.errors.get(error, 0) + 1
+
+	def get(self, side, protocol_id, method_id):
+		return self.methods.get((side, protocol_id, method_id))
+
+	def slowest(self, count=10):
+		#Returns the keys with the largest total latency
+		with self.lock:
+			items = list(self.methods.items())
+		items.sort(key=lambda item: item[1].latency.sum, reverse=True)
+		return [key for key, stats in items[:count]]
+
+	def reset(self):
+		with self.lock:
+			self.methods = {}
+
+	def export(self):
+		#Returns the statistics in the Prometheus text format
+		writer = metrics.MetricsWriter()
+		self.collect(writer)
+		return writer.get()
+
+	def collect(self, writer):
+		with self.lock:
+			items = sorted(self.methods.items())
+
+		def labels(key):
+			side, protocol_id, method_id = key
+			return {"side": side, "protocol": protocol_id, "method": method_id}
+
+		writer.metric("rmc_calls_total", "counter", "Number of RMC calls")
+		for key, stats in items:
+			writer.sample("rmc_calls_total", stats.calls, **labels(key))
+
+		writer.metric("rmc_errors_total", "counter", "Number of failed RMC calls by result")
+		for key, stats in items:
+			for error, count in sorted(stats.errors.items()):
+				writer.sample("rmc_errors_total", count, **labels(key), result=error)
+
+		writer.metric("rmc_request_bytes_total", "counter", "Size of RMC requests")
+		for key, stats in items:
+			writer.sample("rmc_request_bytes_total", stats.request_bytes, **labels(key))
+
+		writer.metric("rmc_response_bytes_total", "counter", "Size of RMC responses")
+		for key, stats in items:
+			writer.sample("rmc_response_bytes_total", stats.response_bytes, **labels(key))
+
+		writer.metric("rmc_latency_seconds", "histogram", "Time until the RMC response was sent or received")
+		for key, stats in items:
+			for bound, total in stats.latency.cumulative():
+				le = "+Inf" if bound is None else repr(float(bound))
+				writer.sample("rmc_latency_seconds_bucket", total, **labels(key), le=le)
+			writer.sample("rmc_latency_seconds_sum", float(stats.latency.sum), **labels(key))
+			writer.sample("rmc_latency_seconds_count", stats.latency.count, **labels(key))
+
+
+def collect_prudp(writer):
+	writer.single("prudp_connections", "gauge", "Number of open PRUDP connections", prudp.count_connections())
+	writer.single("prudp_resends_total", "counter", "Number of packets that were sent again", prudp.statistics.resends)
+	writer.single("prudp_timeouts_total", "counter", "Number of packets that reached the resend limit", prudp.statistics.timeouts)
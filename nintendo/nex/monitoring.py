@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -19,28 +20,34 @@ class MonitoringClient(MonitoringProtocol):
 		self.client = client
 	
 	def ping_daemon(self):
+		return self.client.wait(self.ping_daemon_async())
+	
+	def ping_daemon_async(self):
 		logger.info("MonitoringClient.ping_daemon()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PING_DAEMON)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.bool()
-		logger.info("MonitoringClient.ping_daemon -> done")
-		return result
+		def decode(stream):
+			result = stream.bool()
+			logger.info("MonitoringClient.ping_daemon -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def get_cluster_members(self):
+		return self.client.wait(self.get_cluster_members_async())
+	
+	def get_cluster_members_async(self):
 		logger.info("MonitoringClient.get_cluster_members()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_CLUSTER_MEMBERS)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		members = stream.list(stream.string)
-		logger.info("MonitoringClient.get_cluster_members -> done")
-		return members
+		def decode(stream):
+			members = stream.list(stream.string)
+			logger.info("MonitoringClient.get_cluster_members -> done")
+			return members
+		return self.client.call(stream, call_id, decode)
 
 
 class MonitoringServer(MonitoringProtocol):
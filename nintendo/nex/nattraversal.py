@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -24,51 +25,63 @@ class NATTraversalClient(NATTraversalProtocol):
 		self.client = client
 	
 	def request_probe_initiation(self, target_urls):
+		return self.client.wait(self.request_probe_initiation_async(target_urls))
+	
+	def request_probe_initiation_async(self, target_urls):
 		logger.info("NATTraversalClient.request_probe_initiation()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REQUEST_PROBE_INITIATION)
 		stream.list(target_urls, stream.stationurl)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NATTraversalClient.request_probe_initiation -> done")
+		def decode(stream):
+			logger.info("NATTraversalClient.request_probe_initiation -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def initiate_probe(self, station_to_probe):
+		return self.client.wait(self.initiate_probe_async(station_to_probe))
+	
+	def initiate_probe_async(self, station_to_probe):
 		logger.info("NATTraversalClient.initiate_probe()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_INITIATE_PROBE)
 		stream.stationurl(station_to_probe)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NATTraversalClient.initiate_probe -> done")
+		def decode(stream):
+			logger.info("NATTraversalClient.initiate_probe -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def request_probe_initiation_ext(self, target_urls, station_to_probe):
+		return self.client.wait(self.request_probe_initiation_ext_async(target_urls, station_to_probe))
+	
+	def request_probe_initiation_ext_async(self, target_urls, station_to_probe):
 		logger.info("NATTraversalClient.request_probe_initiation_ext()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REQUEST_PROBE_INITIATION_EXT)
 		stream.list(target_urls, stream.stationurl)
 		stream.stationurl(station_to_probe)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NATTraversalClient.request_probe_initiation_ext -> done")
+		def decode(stream):
+			logger.info("NATTraversalClient.request_probe_initiation_ext -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def report_nat_properties(self, natm, natf, rtt):
+		return self.client.wait(self.report_nat_properties_async(natm, natf, rtt))
+	
+	def report_nat_properties_async(self, natm, natf, rtt):
 		logger.info("NATTraversalClient.report_nat_properties()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REPORT_NAT_PROPERTIES)
 		stream.u32(natm)
 		stream.u32(natf)
 		stream.u32(rtt)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NATTraversalClient.report_nat_properties -> done")
+		def decode(stream):
+			logger.info("NATTraversalClient.report_nat_properties -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class NATTraversalServer(NATTraversalProtocol):
@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -78,6 +79,8 @@ class NintendoNotificationEvent(common.Structure):
 
 
 class NintendoNotificationEventGeneral(common.Data):
+	FIELDS_0 = struct.Struct("<IQQ")
+	
 	def __init__(self):
 		super().__init__()
 		self.param1 = None
@@ -91,16 +94,12 @@ class NintendoNotificationEventGeneral(common.Data):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.param1 = stream.u32()
-		self.param2 = stream.u64()
-		self.param3 = stream.u64()
+		self.param1, self.param2, self.param3 = stream.fields(NintendoNotificationEventGeneral.FIELDS_0)
 		self.text = stream.string()
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.param1)
-		stream.u64(self.param2)
-		stream.u64(self.param3)
+		stream.fields(NintendoNotificationEventGeneral.FIELDS_0, self.param1, self.param2, self.param3)
 		stream.string(self.text)
 common.DataHolder.register(NintendoNotificationEventGeneral, "NintendoNotificationEventGeneral")
 
@@ -123,15 +122,18 @@ class NotificationClient(NotificationProtocol):
 		self.client = client
 	
 	def process_notification_event(self, event):
+		return self.client.wait(self.process_notification_event_async(event))
+	
+	def process_notification_event_async(self, event):
 		logger.info("NotificationClient.process_notification_event()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PROCESS_NOTIFICATION_EVENT)
 		stream.add(event)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NotificationClient.process_notification_event -> done")
+		def decode(stream):
+			logger.info("NotificationClient.process_notification_event -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class NintendoNotificationClient(NintendoNotificationProtocol):
@@ -139,26 +141,32 @@ class NintendoNotificationClient(NintendoNotificationProtocol):
 		self.client = client
 	
 	def process_nintendo_notification_event(self, event):
+		return self.client.wait(self.process_nintendo_notification_event_async(event))
+	
+	def process_nintendo_notification_event_async(self, event):
 		logger.info("NintendoNotificationClient.process_nintendo_notification_event()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PROCESS_NINTENDO_NOTIFICATION_EVENT)
 		stream.add(event)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NintendoNotificationClient.process_nintendo_notification_event -> done")
+		def decode(stream):
+			logger.info("NintendoNotificationClient.process_nintendo_notification_event -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def process_presence_change_event(self, event):
+		return self.client.wait(self.process_presence_change_event_async(event))
+	
+	def process_presence_change_event_async(self, event):
 		logger.info("NintendoNotificationClient.process_presence_change_event()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_PROCESS_PRESENCE_CHANGE_EVENT)
 		stream.add(event)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("NintendoNotificationClient.process_presence_change_event -> done")
+		def decode(stream):
+			logger.info("NintendoNotificationClient.process_presence_change_event -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class NotificationServer(NotificationProtocol):
@@ -1,14 +1,24 @@
 
-from nintendo.common import crypto, socket, websocket, scheduler, signal
+from nintendo.common import crypto, socket, websocket, scheduler, signal, util
 from nintendo.nex import kerberos, streams
 
+import collections
 import hashlib
 import hmac
 import struct
+import itertools
 import random
 import secrets
+import array
 import zlib
+import weakref
 import time
+import sys
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
 
 import logging
 logger = logging.getLogger(__name__)
@@ -54,6 +64,21 @@ OPTIONS = {
 	OPTION_CONNECTION_SIG_LITE: (16, "OPTION_CONNECTION_SIG_LITE", None)
 }
 
+
+class Statistics:
+	def __init__(self):
+		self.resends = 0
+		self.timeouts = 0
+
+#Counters for monitoring, shared by all connections
+statistics = Statistics()
+
+#All clients that have not been garbage collected yet
+clients = weakref.WeakSet()
+
+def count_connections():
+	return sum(1 for client in list(clients) if client.is_connected())
+
 STATE_READY = 0
 STATE_ACCEPTING = 1
 STATE_CONNECTING = 2
@@ -62,6 +87,22 @@ STATE_DISCONNECTING = 4
 STATE_DISCONNECTED = 5
 
 
+def sum_words(data):
+	#Returns the sum of all little endian 32-bit words in data,
+	#trailing bytes are ignored
+	count = len(data) // 4
+	if not count:
+		return 0
+	if numpy:
+		return int(numpy.frombuffer(data, "<u4", count).sum(dtype=numpy.uint64))
+	
+	words = array.array("I")
+	words.frombytes(data[:count * 4])
+	if sys.byteorder == "big":
+		words.byteswap()
+	return sum(words)
+	
+
 def decode_options(data):
 	pos = 0
 	options = {}
@@ -87,7 +128,7 @@ def decode_options(data):
 			logger.error("(Opt) Invalid option length in %s" %name)
 			return
 			
-		value = data[pos : pos + length]
+		value = bytes(data[pos : pos + length])
 		if format is not None:
 			value = struct.unpack("<" + format, value)[0]
 		
@@ -145,14 +186,12 @@ class PRUDPMessageV0:
 		
 	def calc_checksum(self, data):
 		if self.checksum_version == 0:
-			data = data.ljust((len(data) + 3) & ~3, b"\0")
 			base = self.client.signature_base & 0xFF
-			words = struct.unpack("<%iI" %(len(data) // 4), data)
-			return (base + sum(words)) & 0xFFFFFFFF
+			tail = int.from_bytes(data[len(data) & ~3:], "little")
+			return (base + sum_words(data) + tail) & 0xFFFFFFFF
 
 		else:
-			words = struct.unpack_from("<%iI" %(len(data) // 4), data)
-			temp = sum(words) & 0xFFFFFFFF
+			temp = sum_words(data) & 0xFFFFFFFF
 			
 			checksum = self.client.signature_base
 			checksum += sum(data[len(data) & ~3:])
@@ -219,15 +258,22 @@ class PRUDPMessageV0:
 		return options
 		
 	def decode(self, data):
-		self.buffer += data
+		if self.buffer:
+			data = self.buffer + data
+		self.reset()
+		
+		#Packets are parsed in place, the payloads are views into data
+		view = memoryview(data)
 	
 		packets = []
-		while self.buffer:
-			if len(self.buffer) < 12: return packets
+		pos = 0
+		while pos < len(view):
+			buffer = view[pos:]
+			if len(buffer) < 12: break
 			
 			#Extract packet header
 			source, dest, type_flags, session_id, signature, packet_id = \
-				struct.unpack_from(self.header_format(), self.buffer)
+				struct.unpack_from(self.header_format(), buffer)
 				
 			packet = PRUDPPacket()
 			packet.source_type = source >> 4
@@ -248,42 +294,42 @@ class PRUDPMessageV0:
 			
 			#Extract connection signature
 			if packet.type in [TYPE_SYN, TYPE_CONNECT]:
-				if len(self.buffer) < offset + 4: return packets
-				packet.connection_signature = self.buffer[offset : offset + 4]
+				if len(buffer) < offset + 4: break
+				packet.connection_signature = bytes(buffer[offset : offset + 4])
 				offset += 4
 
 			#Extract fragment id
 			if packet.type == TYPE_DATA:
-				if len(self.buffer) < offset + 1: return packets
-				packet.fragment_id = self.buffer[offset]
+				if len(buffer) < offset + 1: break
+				packet.fragment_id = buffer[offset]
 				offset += 1
 
 			#Extract payload size
 			if packet.flags & FLAG_HAS_SIZE:
-				if len(self.buffer) < offset + 2: return packets
-				payload_size = struct.unpack_from("<H", self.buffer, offset)[0]
+				if len(buffer) < offset + 2: break
+				payload_size = struct.unpack_from("<H", buffer, offset)[0]
 				offset += 2
 			else:
-				payload_size = len(self.buffer) - offset - self.checksum_size()
+				payload_size = len(buffer) - offset - self.checksum_size()
 
-			if len(self.buffer) < offset + payload_size + self.checksum_size():
-				return packets
+			if len(buffer) < offset + payload_size + self.checksum_size():
+				break
 
 			#Extract checksum
 			if self.checksum_size() == 1:
-				checksum = self.buffer[offset + payload_size]
+				checksum = buffer[offset + payload_size]
 			elif self.checksum_size() == 4:
-				checksum = struct.unpack_from("<I", self.buffer, offset + payload_size)
+				checksum = struct.unpack_from("<I", buffer, offset + payload_size)[0]
 
 			#Verify checksum
-			expected_checksum = self.calc_checksum(self.buffer[:offset + payload_size])
+			expected_checksum = self.calc_checksum(buffer[:offset + payload_size])
 			if checksum != expected_checksum:
 				logger.error("(V0) Invalid checksum (expected %i, got %i)", checksum, expected_checksum)
 				self.reset()
 				return packets
 			
 			#Extract payload
-			packet.payload = self.buffer[offset : offset + payload_size]
+			packet.payload = buffer[offset : offset + payload_size]
 			
 			#Verify packet signature
 			expected_signature = self.calc_packet_signature(packet, self.client.local_signature)
@@ -295,8 +341,10 @@ class PRUDPMessageV0:
 				self.reset()
 				return packets
 			
-			self.buffer = self.buffer[offset + payload_size + self.checksum_size():]
+			pos += offset + payload_size + self.checksum_size()
 			packets.append(packet)
+			
+		self.buffer = bytes(view[pos:])
 		return packets
 
 	
@@ -356,20 +404,27 @@ class PRUDPMessageV1:
 		return options
 		
 	def decode(self, data):
-		self.buffer += data
+		if self.buffer:
+			data = self.buffer + data
+		self.reset()
+		
+		#Packets are parsed in place, the payloads are views into data
+		view = memoryview(data)
 
 		packets = []
-		while self.buffer:
-			if len(self.buffer) < 30: return packets
-			if self.buffer[:2] != b"\xEA\xD0":
+		pos = 0
+		while pos < len(view):
+			buffer = view[pos:]
+			if len(buffer) < 30: break
+			if buffer[:2] != b"\xEA\xD0":
 				logger.error("(V1) Invalid magic number")
 				self.reset()
 				return packets
 		
 			packet = PRUDPPacket()
 
-			header = self.buffer[2 : 14]
-			signature = self.buffer[14 : 30]
+			header = buffer[2 : 14]
+			signature = bytes(buffer[14 : 30])
 			
 			version, option_size, payload_size, source, dest, type_flags, session_id, \
 				packet.stream_id, packet_id = struct.unpack("<BBHBBHBBH", header)
@@ -378,8 +433,8 @@ class PRUDPMessageV1:
 				logger.error("(V1) Version check failed")
 				self.reset()
 				return packets
-			if len(self.buffer) < 30 + option_size + payload_size:
-				return packets
+			if len(buffer) < 30 + option_size + payload_size:
+				break
 				
 			packet.source_type = source >> 4
 			packet.source_port = source & 0xF
@@ -390,7 +445,7 @@ class PRUDPMessageV1:
 			packet.session_id = session_id
 			packet.packet_id = packet_id
 			
-			option_data = self.buffer[30 : 30 + option_size:]
+			option_data = buffer[30 : 30 + option_size]
 			options = decode_options(option_data)
 			if options is None:
 				self.reset()
@@ -409,7 +464,7 @@ class PRUDPMessageV1:
 					return packets
 				packet.fragment_id = options[OPTION_FRAGMENT_ID]
 			
-			packet.payload = self.buffer[30 + option_size : 30 + option_size + payload_size]
+			packet.payload = buffer[30 + option_size : 30 + option_size + payload_size]
 			
 			expected_signature = self.calc_packet_signature(
 				self.client.session_key, header, option_data, self.client.local_signature, packet.payload
@@ -419,8 +474,10 @@ class PRUDPMessageV1:
 				self.reset()
 				return packets
 			
-			self.buffer = self.buffer[30 + option_size + payload_size:]
+			pos += 30 + option_size + payload_size
 			packets.append(packet)
+			
+		self.buffer = bytes(view[pos:])
 		return packets
 
 		
@@ -462,23 +519,30 @@ class PRUDPLiteMessage:
 		return options
 		
 	def decode(self, data):
-		self.buffer += data
+		if self.buffer:
+			data = self.buffer + data
+		self.reset()
+		
+		#Packets are parsed in place, the payloads are views into data
+		view = memoryview(data)
 
 		packets = []
-		while self.buffer:
-			if len(self.buffer) < 12: return packets
+		pos = 0
+		while pos < len(view):
+			buffer = view[pos:]
+			if len(buffer) < 12: break
 		
 			packet = PRUDPPacket()
 			
 			magic, option_size, payload_size, stream_types, source_port, dest_port, \
-				fragment_id, type_flags, packet_id = struct.unpack_from("<BBHBBBBHH", self.buffer)
+				fragment_id, type_flags, packet_id = struct.unpack_from("<BBHBBBBHH", buffer)
 			
 			if magic != 0x80:
 				logger.error("(Lite) Invalid magic number")
 				self.reset()
 				return packets
-			if len(self.buffer) < 12 + option_size + payload_size:
-				return packets
+			if len(buffer) < 12 + option_size + payload_size:
+				break
 				
 			packet.source_type = stream_types >> 4
 			packet.dest_type = stream_types & 0xF
@@ -490,7 +554,7 @@ class PRUDPLiteMessage:
 			packet.packet_id = packet_id
 			packet.session_id = 0
 			
-			option_data = self.buffer[12 : 12 + option_size:]
+			option_data = buffer[12 : 12 + option_size]
 			options = decode_options(option_data)
 			if options is None:
 				self.reset()
@@ -503,16 +567,18 @@ class PRUDPLiteMessage:
 					return packets
 				packet.connection_signature = options[OPTION_CONNECTION_SIG]
 			
-			packet.payload = self.buffer[12 + option_size : 12 + option_size + payload_size]
-			self.buffer = self.buffer[12 + option_size + payload_size:]
+			packet.payload = buffer[12 + option_size : 12 + option_size + payload_size]
+			pos += 12 + option_size + payload_size
 			packets.append(packet)
+			
+		self.buffer = bytes(view[pos:])
 		return packets
 
 		
 class RC4Encryption:
-	def __init__(self, key):
-		self.rc4enc = crypto.RC4(key)
-		self.rc4dec = crypto.RC4(key)
+	def __init__(self, key, cache=None):
+		self.rc4enc = crypto.RC4(key, cache=cache)
+		self.rc4dec = crypto.RC4(key, cache=cache)
 		
 	def set_key(self, key):
 		self.rc4enc.set_key(key)
@@ -587,19 +653,27 @@ class PacketEncoder:
 	def __init__(self, settings):
 		substreams = settings.get("prudp.substreams")
 		
-		self.reliable_encryption = [self.create_encryption(settings) for i in range(substreams)]
-		self.unreliable_encryption = self.create_encryption(settings)
-		
 		self.unreliable_key = bytes(0x20)
 		
+		#Unreliable packets use a different key for every packet id,
+		#so their key schedules are cached. The cache is not created
+		#if the keys are scheduled by pycryptodome, because it would
+		#never be used.
+		self.key_cache = None
+		if not crypto.has_native_rc4(len(self.unreliable_key)):
+			self.key_cache = crypto.RC4Cache(settings.get("prudp.key_cache_size"))
+		
+		self.reliable_encryption = [self.create_encryption(settings) for i in range(substreams)]
+		self.unreliable_encryption = self.create_encryption(settings, self.key_cache)
+		
 		if settings.get("prudp.compression") == 0:
 			self.compression = DummyCompression()
 		else:
 			self.compression = ZlibCompression()
 			
-	def create_encryption(self, settings):
+	def create_encryption(self, settings, cache=None):
 		if settings.get("prudp.transport") == settings.TRANSPORT_UDP:
-			return RC4Encryption(self.DEFAULT_KEY)
+			return RC4Encryption(self.DEFAULT_KEY, cache)
 		return DummyEncryption()
 		
 	def encode(self, packet):
@@ -626,7 +700,7 @@ class PacketEncoder:
 				self.unreliable_encryption.set_key(key)
 				
 				data = self.unreliable_encryption.decrypt(data)
-		return data
+		return bytes(data)
 			
 	def make_unreliable_key(self, packet):
 		key = list(self.unreliable_key)
@@ -680,6 +754,88 @@ class SlidingWindow:
 				self.next = (self.next + 1) & 0xFFFF
 		return packets
 		
+		
+class RoundTripTimer:
+	#Estimates the retransmission timeout from round trip
+	#time samples, as described in RFC 6298
+	
+	MIN_TIMEOUT = 0.2
+	MAX_TIMEOUT = 60
+	
+	def __init__(self, timeout):
+		self.timeout = timeout
+		self.srtt = None
+		self.rttvar = None
+		
+	def update(self, sample):
+		if self.srtt is None:
+			self.srtt = sample
+			self.rttvar = sample / 2
+		else:
+			self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - sample)
+			self.srtt = 0.875 * self.srtt + 0.125 * sample
+		
+		timeout = self.srtt + 4 * self.rttvar
+		self.timeout = min(max(timeout, self.MIN_TIMEOUT), self.MAX_TIMEOUT)
+		
+	def backoff(self, counter):
+		return min(self.timeout * 2 ** counter, self.MAX_TIMEOUT)
+		
+		
+class SendWindow:
+	#Limits the number of unacknowledged packets on a substream.
+	#The congestion window grows with slow start and additive
+	#increase, and is halved when a packet times out. Packets that
+	#were sent before the last reduction do not reduce it again.
+	
+	#A packet is resent early when this many packets that
+	#were sent after it have been acknowledged
+	FAST_RESEND = 3
+	
+	def __init__(self, limit):
+		self.limit = limit
+		self.queue = collections.deque()
+		
+		#Maps the keys of unacknowledged packets to their
+		#send order and the number of later acks, in order
+		self.in_flight = collections.OrderedDict()
+		self.counter = itertools.count()
+		
+		self.window = min(4, limit)
+		self.threshold = limit
+		self.reduced = 0
+		
+	def is_open(self):
+		return len(self.in_flight) < int(self.window)
+		
+	def add(self, key):
+		self.in_flight[key] = [next(self.counter), 0]
+		
+	def acknowledge(self, key):
+		#Returns the packets that should be resent early
+		index = self.in_flight.pop(key)[0]
+		
+		lost = []
+		for key, state in self.in_flight.items():
+			if state[0] > index:
+				break
+			state[1] += 1
+			if state[1] == self.FAST_RESEND:
+				lost.append(key)
+		
+		if self.window < self.threshold:
+			self.window += 1
+		else:
+			self.window += 1 / self.window
+		self.window = min(self.window, self.limit)
+		return lost
+		
+	def timeout(self, start):
+		if start > self.reduced:
+			self.reduced = time.monotonic()
+			self.threshold = max(self.window / 2, 2)
+			self.window = min(self.threshold, self.limit)
+		
 	
 class PRUDPStream:
 	def __init__(self, client, settings, sock=None):
@@ -689,8 +845,22 @@ class PRUDPStream:
 		self.resend_timeout = settings.get("prudp.resend_timeout")
 		self.resend_limit = settings.get("prudp.resend_limit")
 		self.substreams = settings.get("prudp.substreams")
+		self.max_in_flight = settings.get("prudp.max_in_flight")
+		
+		self.timer = RoundTripTimer(self.resend_timeout)
+		
+		#The adaptive timeout only decides when a packet is resent.
+		#A packet is given up on after the same time as with a fixed
+		#resend timeout, no matter how often it was resent.
+		self.resend_deadline = self.resend_timeout * (self.resend_limit + 1)
+		
+		self.send_windows = None
+		if self.max_in_flight:
+			self.send_windows = [SendWindow(self.max_in_flight) for i in range(self.substreams)]
 		
 		self.failure = signal.Signal()
+		self.failed = False
+		self.closing = False
 		
 		self.sock = sock
 		if not self.sock:
@@ -715,6 +885,11 @@ class PRUDPStream:
 		self.ack_events = {}
 		self.ack_packets = {}
 		self.socket_event = None
+		
+		#Ids of unacknowledged DATA packets per substream, in the
+		#order in which they were sent. Packets that were acked
+		#individually are removed once they reach the front.
+		self.outstanding = [collections.deque() for i in range(self.substreams)]
 		self.packets = []
 	
 	def local_address(self): return self.sock.local_address()
@@ -730,8 +905,15 @@ class PRUDPStream:
 		if self.socket_event:
 			scheduler.remove(self.socket_event)
 		for event, block in self.ack_events.values():
-			scheduler.remove(event)
+			if event:
+				scheduler.remove(event)
 		self.ack_events = {}
+		for outstanding in self.outstanding:
+			outstanding.clear()
+		if self.send_windows:
+			for window in self.send_windows:
+				window.queue.clear()
+				window.in_flight.clear()
 		
 	def connect(self, host, port):
 		if not self.sock.connect(host, port):
@@ -744,43 +926,127 @@ class PRUDPStream:
 		self.socket_event = scheduler.add_socket(self.handle_recv, self.sock)
 		
 	def close(self):
-		self.sock.close()
+		#The scheduler thread may still be reading from the socket
+		#while it is closed, which gives an empty read
+		self.closing = True
 		self.cleanup()
+		self.sock.close()
 		
 	def send(self, packet, block=False):
-		if not packet.flags & FLAG_ACK:
+		if not packet.flags & (FLAG_ACK | FLAG_MULTI_ACK):
 			packet.packet_id = self.sequence_mgr.assign(packet)
 			packet.payload = self.message_encoder.encode(packet)
 		
-		logger.debug("Sending packet: %s", packet)
-		self.sock.send(self.packet_encoder.encode(packet))
-		
+		key = None
 		if packet.flags & FLAG_RELIABLE or packet.type == TYPE_SYN:
 			if packet.flags & FLAG_NEED_ACK:
 				key = (packet.type, packet.stream_id, packet.packet_id)
-				event = scheduler.add_timeout(self.handle_timeout, self.resend_timeout, param=(packet, 0))
-				self.ack_events[key] = (event, block)
+				if packet.type == TYPE_DATA:
+					self.outstanding[packet.stream_id].append(packet.packet_id)
 				
-				if block:
-					while key in self.ack_events:
-						scheduler.update()
-						
-					if key in self.ack_packets:
-						return self.ack_packets.pop(key)
+		if key and self.is_windowed(packet):
+			window = self.send_windows[packet.stream_id]
+			self.ack_events[key] = (None, block)
+			window.queue.append(packet)
+			self.flush_window(window)
+		elif key:
+			self.transmit(key, packet, block)
+		else:
+			logger.debug("Sending packet: %s", packet)
+			self.sock.send(self.packet_encoder.encode(packet))
+
+		if key and block:
+			scheduler.wait_until(lambda: key not in self.ack_events)
+
+			if key in self.ack_packets:
+				return self.ack_packets.pop(key)
 		
 	def recv(self):
 		if self.packets:
 			return self.packets.pop(0)
+			
+	def decode(self, packet):
+		return self.message_encoder.decode(packet)
+		
+	def is_windowed(self, packet):
+		return self.send_windows is not None and packet.type == TYPE_DATA
+		
+	def transmit(self, key, packet, block):
+		#The ack event is registered before the packet is sent,
+		#because the ack may arrive before send returns
+		param = (packet, 0, time.monotonic())
+		timeout = min(self.timer.timeout, self.resend_deadline)
+		event = scheduler.add_timeout(self.handle_timeout, timeout, param=param)
+		self.ack_events[key] = (event, block)
+		
+		logger.debug("Sending packet: %s", packet)
+		self.sock.send(self.packet_encoder.encode(packet))
+		
+	def flush_window(self, window):
+		while window.queue and window.is_open():
+			packet = window.queue.popleft()
+			key = (packet.type, packet.stream_id, packet.packet_id)
+			if key in self.ack_events:
+				window.add(key)
+				self.transmit(key, packet, self.ack_events[key][1])
 		
 	def acknowledge(self, key, packet):
 		event, block = self.ack_events.pop(key)
-		scheduler.remove(event)
 		if block:
 			self.ack_packets[key] = packet
 		
+		#Acks for queued packets cannot be valid
+		if event:
+			scheduler.remove(event)
+			
+			#Packets that were resent are ambiguous (Karn's algorithm)
+			sent, counter, start = event.param
+			if counter == 0:
+				self.timer.update(time.monotonic() - start)
+			
+			if self.is_windowed(sent):
+				window = self.send_windows[sent.stream_id]
+				for lost in window.acknowledge(key):
+					#A resend may give up on the packet, which fails
+					#the stream and clears the ack events
+					if self.failed:
+						return
+					if lost in self.ack_events:
+						self.resend_early(lost)
+				if not self.failed:
+					self.flush_window(window)
+				
+	def trim_outstanding(self, stream_id):
+		outstanding = self.outstanding[stream_id]
+		while outstanding and (TYPE_DATA, stream_id, outstanding[0]) not in self.ack_events:
+			outstanding.popleft()
+			
+	def acknowledge_until(self, stream_id, base_id, packet):
+		#Acknowledges every packet up to and including base_id.
+		#Packet ids wrap around, so an id comes after base_id
+		#if it is less than half the id space ahead of it.
+		outstanding = self.outstanding[stream_id]
+		while outstanding:
+			packet_id = outstanding[0]
+			if (base_id - packet_id) & 0xFFFF >= 0x8000:
+				break
+			outstanding.popleft()
+			
+			key = (TYPE_DATA, stream_id, packet_id)
+			if key in self.ack_events:
+				self.acknowledge(key, packet)
+		
+	def resend_early(self, key):
+		event, block = self.ack_events[key]
+		scheduler.remove(event)
+		self.handle_timeout(event.param)
+		
 	def handle_recv(self, data):
 		if not data:
+			if self.closing:
+				return
 			logger.warning("Connection was closed unexpectedly")
+			self.failed = True
 			self.failure()
 			return
 			
@@ -789,9 +1055,12 @@ class PRUDPStream:
 			logger.debug("Packet received: %s", packet)
 			
 			if packet.flags & FLAG_ACK:
+				packet.payload = bytes(packet.payload)
 				key = (packet.type, packet.stream_id, packet.packet_id)
 				if key in self.ack_events:
 					self.acknowledge(key, packet)
+					if packet.type == TYPE_DATA:
+						self.trim_outstanding(packet.stream_id)
 				else:
 					logger.debug("Received unexpected ack packet")
 			
@@ -800,8 +1069,12 @@ class PRUDPStream:
 						
 			else:
 				if packet.stream_id < self.substreams:
-					
-					packet.payload = self.message_encoder.decode(packet)
+					if packet.flags & FLAG_RELIABLE:
+						#Reliable packets share one RC4 stream, so they are
+						#decrypted by the client once they are in order
+						packet.payload = bytes(packet.payload)
+					else:
+						packet.payload = self.message_encoder.decode(packet)
 					self.packets.append(packet)
 				else:
 					logger.error("Received packet with invalid substream id: %i", packet.stream_id)
@@ -835,32 +1108,43 @@ class PRUDPStream:
 				base_id = struct.unpack_from("<H", packet.payload, 2)[0]
 				extra_ids = struct.unpack_from("<%iH" %packet.payload[1], packet.payload, 4)
 			
-			for key in list(self.ack_events):
-				if key[0] == TYPE_DATA and key[1] == stream_id and key[2] <= base_id:
-					self.acknowledge(key, packet)
+			if stream_id >= self.substreams:
+				logger.error("Aggregate ack has invalid substream id: %i", stream_id)
+				return
+			
+			self.acknowledge_until(stream_id, base_id, packet)
 			
 			for packet_id in extra_ids:
 				key = (TYPE_DATA, stream_id, packet_id)
 				if key in self.ack_events:
 					self.acknowledge(key, packet)
+			self.trim_outstanding(stream_id)
 	
 	def handle_timeout(self, param):
-		packet, counter = param
+		packet, counter, start = param
 		
 		key = (packet.type, packet.stream_id, packet.packet_id)
 		
-		if counter < self.resend_limit:
+		remaining = start + self.resend_deadline - time.monotonic()
+		if remaining > 0:
 			logger.debug("Resending packet: %s" %packet)
+			statistics.resends += 1
 			self.sock.send(self.packet_encoder.encode(packet))
 			
-			event = scheduler.add_timeout(self.handle_timeout, self.resend_timeout, param=(packet, counter+1))
+			if self.is_windowed(packet) and counter == 0:
+				self.send_windows[packet.stream_id].timeout(start)
+			
+			timeout = min(self.timer.backoff(counter + 1), remaining)
+			event = scheduler.add_timeout(self.handle_timeout, timeout, param=(packet, counter+1, start))
 			block = self.ack_events[key][1]
 			
 			self.ack_events[key] = (event, block)
 		
 		else:
 			logger.error("Packet timed out: %s" %packet)
+			statistics.timeouts += 1
 			del self.ack_events[key]
+			self.failed = True
 			self.failure()
 		
 
@@ -873,22 +1157,33 @@ class PRUDPClient:
 		self.minor_version = settings.get("prudp.minor_version")
 		self.fragment_size = settings.get("prudp.fragment_size")
 		self.ping_timeout = settings.get("prudp.ping_timeout")
+		self.ack_delay = settings.get("prudp.ack_delay")
+		self.max_message_size = settings.get("prudp.max_message_size")
 		
 		self.stream = PRUDPStream(self, settings, sock)
 		self.stream.failure.add(self.cleanup)
 		
+		#Fired whenever the connection is cleaned up, for
+		#example because the other end point disconnected
+		self.closed = signal.Signal()
+		
+		clients.add(self)
+		
 		self.set_access_key(settings.get("nex.access_key"))
 		
 		substreams = settings.get("prudp.substreams")
 		
 		self.sliding_windows = [SlidingWindow() for i in range(substreams)]
-		self.fragment_buffers = [b""] * substreams
+		self.fragment_buffers = [util.FragmentBuffer(self.max_message_size) for i in range(substreams)]
 		
 		self.packets = []
 		for i in range(substreams):
 			self.packets.append([])
 		self.packets_unreliable = []
 		
+		self.pending_acks = [[] for i in range(substreams)]
+		self.ack_event = None
+		
 		self.session_key = b""
 		
 		self.local_port = 0
@@ -915,9 +1210,13 @@ class PRUDPClient:
 		logger.debug("Cleaning up PRUDP socket")
 		self.state = STATE_DISCONNECTED
 		self.stop_ping()
+		if self.ack_event:
+			scheduler.remove(self.ack_event)
+			self.ack_event = None
 		if self.socket_event:
 			scheduler.remove(self.socket_event)
 		self.stream.cleanup()
+		self.closed()
 		
 	def set_access_key(self, access_key):
 		key = access_key.encode()
@@ -995,9 +1294,7 @@ class PRUDPClient:
 		self.stream.accept()
 		self.socket_event = scheduler.add_socket(self.handle_packet, self.stream)
 		
-		while self.state == STATE_ACCEPTING:
-			scheduler.update()
-			
+		scheduler.wait_until(lambda: self.state != STATE_ACCEPTING)
 		if self.state != STATE_CONNECTED:
 			return False
 			
@@ -1023,6 +1320,7 @@ class PRUDPClient:
 		self.stop_ping()
 		
 		if self.state == STATE_CONNECTED:
+			self.flush_acks()
 			self.state = STATE_DISCONNECTING
 			
 			packet = PRUDPPacket(TYPE_DISCONNECT, FLAG_RELIABLE | FLAG_NEED_ACK)
@@ -1044,14 +1342,14 @@ class PRUDPClient:
 				self.send_packet(syn_ack)
 		else:	
 			if packet.flags & FLAG_RELIABLE:
-				for packet in self.sliding_windows[packet.stream_id].update(packet):
-					if packet.type == TYPE_CONNECT:
+				for message in self.sliding_windows[packet.stream_id].update(packet):
+					if message.type == TYPE_CONNECT:
 						if self.state != STATE_ACCEPTING:
-							logger.error("Unexpected CONNECT packet: %s", packet)
+							logger.error("Unexpected CONNECT packet: %s", message)
 						else:
 							try:
-								self.remote_signature = packet.connection_signature
-								self.connect_response = self.handle_connection_request(packet)
+								self.remote_signature = message.connection_signature
+								self.connect_response = self.handle_connection_request(message)
 								if self.connect_response is None:
 									self.cleanup()
 									return
@@ -1062,12 +1360,16 @@ class PRUDPClient:
 								traceback.print_exc()
 								self.cleanup()
 								return
-					elif packet.type == TYPE_DATA:
-						self.fragment_buffers[packet.stream_id] += packet.payload
-						if packet.fragment_id == 0:
-							self.packets[packet.stream_id].append(self.fragment_buffers[packet.stream_id])
-							self.fragment_buffers[packet.stream_id] = b""
-					elif packet.type == TYPE_DISCONNECT:
+					elif message.type == TYPE_DATA:
+						buffer = self.fragment_buffers[message.stream_id]
+						buffer.append(self.stream.decode(message))
+						if message.fragment_id == 0:
+							data = buffer.join()
+							if data is None:
+								logger.error("Dropped message larger than %i bytes", self.max_message_size)
+							else:
+								self.packets[message.stream_id].append(data)
+					elif message.type == TYPE_DISCONNECT:
 						logger.info("Connection closed by other end point")
 						self.cleanup()
 			else:
@@ -1075,7 +1377,10 @@ class PRUDPClient:
 					self.packets_unreliable.append(packet.payload)
 					
 			if packet.flags & FLAG_NEED_ACK:
-				self.send_ack(packet)
+				if self.can_delay_ack(packet):
+					self.delay_ack(packet)
+				else:
+					self.send_ack(packet)
 				if packet.type == TYPE_DISCONNECT:
 					self.send_ack(packet)
 					self.send_ack(packet)
@@ -1124,6 +1429,67 @@ class PRUDPClient:
 			ack.connection_signature = bytes(self.stream.signature_size())
 		self.send_packet(ack)
 		
+	def aggregate_ack_version(self):
+		#Returns None if aggregate acks can not be sent. Only PRUDP v1
+		#packets have a substream id, which is needed by the new format.
+		if self.transport_type != self.settings.TRANSPORT_UDP:
+			return 0
+		if self.settings.get("prudp.version") == 0:
+			#The flags field is too small for FLAG_MULTI_ACK
+			if self.settings.get("prudp_v0.flags_version") == 0:
+				return None
+			return 0
+		if self.minor_version >= 2:
+			return 1
+		return 0
+		
+	def can_delay_ack(self, packet):
+		if not self.ack_delay or self.state != STATE_CONNECTED:
+			return False
+		if packet.type != TYPE_DATA or not packet.flags & FLAG_RELIABLE:
+			return False
+		
+		version = self.aggregate_ack_version()
+		if version is None:
+			return False
+		#The old format only covers substream 0
+		return version == 1 or packet.stream_id == 0
+		
+	def delay_ack(self, packet):
+		pending = self.pending_acks[packet.stream_id]
+		pending.append(packet.packet_id)
+		if len(pending) >= 0xFF:
+			self.flush_acks()
+		elif not self.ack_event:
+			self.ack_event = scheduler.add_timeout(self.flush_acks, self.ack_delay)
+			
+	def flush_acks(self):
+		if self.ack_event:
+			scheduler.remove(self.ack_event)
+			self.ack_event = None
+		
+		for stream_id, pending in enumerate(self.pending_acks):
+			if pending:
+				self.send_aggregate_ack(stream_id, pending)
+				pending.clear()
+		
+	def send_aggregate_ack(self, stream_id, packet_ids):
+		#Every packet up to the base id has been received. Packets
+		#that were received out of order are acknowledged separately.
+		window = self.sliding_windows[stream_id]
+		base_id = (window.next - 1) & 0xFFFF
+		extra_ids = sorted(set(packet_id for packet_id in packet_ids if packet_id in window.packets))
+		
+		ack = PRUDPPacket(TYPE_DATA, FLAG_MULTI_ACK)
+		if self.aggregate_ack_version() == 1:
+			ack.stream_id = 1
+			ack.payload = struct.pack("<BBH%iH" %len(extra_ids), stream_id, len(extra_ids), base_id, *extra_ids)
+		else:
+			ack.stream_id = 0
+			ack.packet_id = base_id
+			ack.payload = struct.pack("<%iH" %len(extra_ids), *extra_ids)
+		self.send_packet(ack)
+		
 	def send_packet(self, packet, block=False):
 		packet.source_port = self.local_port
 		packet.source_type = self.stream_type
@@ -1270,6 +1636,10 @@ class PRUDPServer:
 	def start(self, host, port, sid):
 		logger.info("Starting PRUDP server at %s:%i:%i", host, port, sid)
 		self.sid = sid
+		if self.settings.get("prudp.reuse_port"):
+			self.server.set_reuse_port(True)
+		if self.settings.get("prudp.receive_buffer"):
+			self.server.set_receive_buffer(self.settings.get("prudp.receive_buffer"))
 		self.server.start(host, port)
 		scheduler.add_server(self.handle, self.server)
 		
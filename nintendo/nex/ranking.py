@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -28,6 +29,8 @@ class RankingStatFlags:
 
 
 class RankingOrderParam(common.Structure):
+	FIELDS_0 = struct.Struct("<BBBBIB")
+	
 	def __init__(self):
 		super().__init__()
 		self.order_calc = 0
@@ -43,24 +46,16 @@ class RankingOrderParam(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.order_calc = stream.u8()
-		self.group_index = stream.u8()
-		self.group_num = stream.u8()
-		self.time_scope = stream.u8()
-		self.offset = stream.u32()
-		self.count = stream.u8()
+		self.order_calc, self.group_index, self.group_num, self.time_scope, self.offset, self.count = stream.fields(RankingOrderParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u8(self.order_calc)
-		stream.u8(self.group_index)
-		stream.u8(self.group_num)
-		stream.u8(self.time_scope)
-		stream.u32(self.offset)
-		stream.u8(self.count)
+		stream.fields(RankingOrderParam.FIELDS_0, self.order_calc, self.group_index, self.group_num, self.time_scope, self.offset, self.count)
 
 
 class RankingRankData(common.Structure):
+	FIELDS_0 = struct.Struct("<QIII")
+	
 	def __init__(self):
 		super().__init__()
 		self.pid = None
@@ -84,10 +79,7 @@ class RankingRankData(common.Structure):
 	
 	def load(self, stream):
 		self.pid = stream.pid()
-		self.unique_id = stream.u64()
-		self.rank = stream.u32()
-		self.category = stream.u32()
-		self.score = stream.u32()
+		self.unique_id, self.rank, self.category, self.score = stream.fields(RankingRankData.FIELDS_0)
 		self.groups = stream.list(stream.u8)
 		self.param = stream.u64()
 		self.common_data = stream.buffer()
@@ -97,10 +89,7 @@ class RankingRankData(common.Structure):
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.pid(self.pid)
-		stream.u64(self.unique_id)
-		stream.u32(self.rank)
-		stream.u32(self.category)
-		stream.u32(self.score)
+		stream.fields(RankingRankData.FIELDS_0, self.unique_id, self.rank, self.category, self.score)
 		stream.list(self.groups, stream.u8)
 		stream.u64(self.param)
 		stream.buffer(self.common_data)
@@ -133,6 +122,8 @@ class RankingResult(common.Structure):
 
 
 class RankingScoreData(common.Structure):
+	FIELDS_0 = struct.Struct("<IIBB")
+	
 	def __init__(self):
 		super().__init__()
 		self.category = None
@@ -148,19 +139,13 @@ class RankingScoreData(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.category = stream.u32()
-		self.score = stream.u32()
-		self.order = stream.u8()
-		self.update_mode = stream.u8()
+		self.category, self.score, self.order, self.update_mode = stream.fields(RankingScoreData.FIELDS_0)
 		self.groups = stream.list(stream.u8)
 		self.param = stream.u64()
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.category)
-		stream.u32(self.score)
-		stream.u8(self.order)
-		stream.u8(self.update_mode)
+		stream.fields(RankingScoreData.FIELDS_0, self.category, self.score, self.order, self.update_mode)
 		stream.list(self.groups, stream.u8)
 		stream.u64(self.param)
 
@@ -208,31 +193,40 @@ class RankingClient(RankingProtocol):
 		self.client = client
 	
 	def upload_score(self, score_data, unique_id):
+		return self.client.wait(self.upload_score_async(score_data, unique_id))
+	
+	def upload_score_async(self, score_data, unique_id):
 		logger.info("RankingClient.upload_score()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_UPLOAD_SCORE)
 		stream.add(score_data)
 		stream.u64(unique_id)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("RankingClient.upload_score -> done")
+		def decode(stream):
+			logger.info("RankingClient.upload_score -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_common_data(self, unique_id):
+		return self.client.wait(self.get_common_data_async(unique_id))
+	
+	def get_common_data_async(self, unique_id):
 		logger.info("RankingClient.get_common_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_COMMON_DATA)
 		stream.u64(unique_id)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		data = stream.buffer()
-		logger.info("RankingClient.get_common_data -> done")
-		return data
+		def decode(stream):
+			data = stream.buffer()
+			logger.info("RankingClient.get_common_data -> done")
+			return data
+		return self.client.call(stream, call_id, decode)
 	
 	def get_ranking(self, mode, category, order, unique_id, pid):
+		return self.client.wait(self.get_ranking_async(mode, category, order, unique_id, pid))
+	
+	def get_ranking_async(self, mode, category, order, unique_id, pid):
 		logger.info("RankingClient.get_ranking()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_RANKING)
@@ -241,30 +235,36 @@ class RankingClient(RankingProtocol):
 		stream.add(order)
 		stream.u64(unique_id)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.extract(RankingResult)
-		logger.info("RankingClient.get_ranking -> done")
-		return result
+		def decode(stream):
+			result = stream.extract(RankingResult)
+			logger.info("RankingClient.get_ranking -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 	
 	def get_stats(self, category, order, flags):
+		return self.client.wait(self.get_stats_async(category, order, flags))
+	
+	def get_stats_async(self, category, order, flags):
 		logger.info("RankingClient.get_stats()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_STATS)
 		stream.u32(category)
 		stream.add(order)
 		stream.u32(flags)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		stats = stream.extract(RankingStats)
-		logger.info("RankingClient.get_stats -> done")
-		return stats
+		def decode(stream):
+			stats = stream.extract(RankingStats)
+			logger.info("RankingClient.get_stats -> done")
+			return stats
+		return self.client.call(stream, call_id, decode)
 	
 	def get_ranking_by_pid_list(self, pids, mode, category, order, unique_id):
+		return self.client.wait(self.get_ranking_by_pid_list_async(pids, mode, category, order, unique_id))
+	
+	def get_ranking_by_pid_list_async(self, pids, mode, category, order, unique_id):
 		logger.info("RankingClient.get_ranking_by_pid_list()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_RANKING_BY_PID_LIST)
@@ -273,13 +273,13 @@ class RankingClient(RankingProtocol):
 		stream.u32(category)
 		stream.add(order)
 		stream.u64(unique_id)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		result = stream.extract(RankingResult)
-		logger.info("RankingClient.get_ranking_by_pid_list -> done")
-		return result
+		def decode(stream):
+			result = stream.extract(RankingResult)
+			logger.info("RankingClient.get_ranking_by_pid_list -> done")
+			return result
+		return self.client.call(stream, call_id, decode)
 
 
 class RankingServer(RankingProtocol):
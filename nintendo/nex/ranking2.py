@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -14,6 +15,8 @@ class RankingMode:
 
 
 class Ranking2CategorySetting(common.Structure):
+	FIELDS_0 = struct.Struct("<IIIHBBBB?")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -32,27 +35,11 @@ class Ranking2CategorySetting(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u32()
-		self.unk2 = stream.u32()
-		self.unk3 = stream.u32()
-		self.unk4 = stream.u16()
-		self.unk5 = stream.u8()
-		self.unk6 = stream.u8()
-		self.unk7 = stream.u8()
-		self.unk8 = stream.u8()
-		self.unk9 = stream.bool()
+		self.unk1, self.unk2, self.unk3, self.unk4, self.unk5, self.unk6, self.unk7, self.unk8, self.unk9 = stream.fields(Ranking2CategorySetting.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u32(self.unk1)
-		stream.u32(self.unk2)
-		stream.u32(self.unk3)
-		stream.u16(self.unk4)
-		stream.u8(self.unk5)
-		stream.u8(self.unk6)
-		stream.u8(self.unk7)
-		stream.u8(self.unk8)
-		stream.bool(self.unk9)
+		stream.fields(Ranking2CategorySetting.FIELDS_0, self.unk1, self.unk2, self.unk3, self.unk4, self.unk5, self.unk6, self.unk7, self.unk8, self.unk9)
 
 
 class Ranking2CommonData(common.Structure):
@@ -80,6 +67,8 @@ class Ranking2CommonData(common.Structure):
 
 
 class Ranking2GetParam(common.Structure):
+	FIELDS_0 = struct.Struct("<IIIIIBB")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = 0
@@ -100,28 +89,18 @@ class Ranking2GetParam(common.Structure):
 	def load(self, stream):
 		self.unk1 = stream.u64()
 		self.pid = stream.pid()
-		self.category = stream.u32()
-		self.offset = stream.u32()
-		self.count = stream.u32()
-		self.unk2 = stream.u32()
-		self.unk3 = stream.u32()
-		self.mode = stream.u8()
-		self.unk4 = stream.u8()
+		self.category, self.offset, self.count, self.unk2, self.unk3, self.mode, self.unk4 = stream.fields(Ranking2GetParam.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.u64(self.unk1)
 		stream.pid(self.pid)
-		stream.u32(self.category)
-		stream.u32(self.offset)
-		stream.u32(self.count)
-		stream.u32(self.unk2)
-		stream.u32(self.unk3)
-		stream.u8(self.mode)
-		stream.u8(self.unk4)
+		stream.fields(Ranking2GetParam.FIELDS_0, self.category, self.offset, self.count, self.unk2, self.unk3, self.mode, self.unk4)
 
 
 class Ranking2Info(common.Structure):
+	FIELDS_0 = struct.Struct("<IIi")
+	
 	def __init__(self):
 		super().__init__()
 		self.data = None
@@ -136,19 +115,18 @@ class Ranking2Info(common.Structure):
 	
 	def load(self, stream):
 		self.data = stream.list(Ranking2RankData)
-		self.unk1 = stream.u32()
-		self.num_entries = stream.u32()
-		self.unk2 = stream.s32()
+		self.unk1, self.num_entries, self.unk2 = stream.fields(Ranking2Info.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
 		stream.list(self.data, stream.add)
-		stream.u32(self.unk1)
-		stream.u32(self.num_entries)
-		stream.s32(self.unk2)
+		stream.fields(Ranking2Info.FIELDS_0, self.unk1, self.num_entries, self.unk2)
 
 
 class Ranking2RankData(common.Structure):
+	FIELDS_0 = struct.Struct("<QQ")
+	FIELDS_1 = struct.Struct("<II")
+	
 	def __init__(self):
 		super().__init__()
 		self.unk1 = None
@@ -164,20 +142,16 @@ class Ranking2RankData(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unk1 = stream.u64()
-		self.unk2 = stream.u64()
+		self.unk1, self.unk2 = stream.fields(Ranking2RankData.FIELDS_0)
 		self.pid = stream.pid()
-		self.rank = stream.u32()
-		self.score = stream.u32()
+		self.rank, self.score = stream.fields(Ranking2RankData.FIELDS_1)
 		self.common_data = stream.extract(Ranking2CommonData)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.unk1)
-		stream.u64(self.unk2)
+		stream.fields(Ranking2RankData.FIELDS_0, self.unk1, self.unk2)
 		stream.pid(self.pid)
-		stream.u32(self.rank)
-		stream.u32(self.score)
+		stream.fields(Ranking2RankData.FIELDS_1, self.rank, self.score)
 		stream.add(self.common_data)
 
 
@@ -198,30 +172,36 @@ class Ranking2Client(Ranking2Protocol):
 		self.client = client
 	
 	def get_ranking(self, param):
+		return self.client.wait(self.get_ranking_async(param))
+	
+	def get_ranking_async(self, param):
 		logger.info("Ranking2Client.get_ranking()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_RANKING)
 		stream.add(param)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(Ranking2Info)
-		logger.info("Ranking2Client.get_ranking -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(Ranking2Info)
+			logger.info("Ranking2Client.get_ranking -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def get_category_setting(self, category):
+		return self.client.wait(self.get_category_setting_async(category))
+	
+	def get_category_setting_async(self, category):
 		logger.info("Ranking2Client.get_category_setting()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_CATEGORY_SETTING)
 		stream.u32(category)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		setting = stream.extract(Ranking2CategorySetting)
-		logger.info("Ranking2Client.get_category_setting -> done")
-		return setting
+		def decode(stream):
+			setting = stream.extract(Ranking2CategorySetting)
+			logger.info("Ranking2Client.get_category_setting -> done")
+			return setting
+		return self.client.call(stream, call_id, decode)
 
 
 class Ranking2Server(Ranking2Protocol):
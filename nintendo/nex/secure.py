@@ -2,6 +2,7 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
@@ -45,103 +46,124 @@ class SecureConnectionClient(SecureConnectionProtocol):
 		self.client = client
 	
 	def register(self, urls):
+		return self.client.wait(self.register_async(urls))
+	
+	def register_async(self, urls):
 		logger.info("SecureConnectionClient.register()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REGISTER)
 		stream.list(urls, stream.stationurl)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.result()
-		obj.connection_id = stream.u32()
-		obj.public_station = stream.stationurl()
-		logger.info("SecureConnectionClient.register -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.result()
+			obj.connection_id = stream.u32()
+			obj.public_station = stream.stationurl()
+			logger.info("SecureConnectionClient.register -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def request_connection_data(self, cid, pid):
+		return self.client.wait(self.request_connection_data_async(cid, pid))
+	
+	def request_connection_data_async(self, cid, pid):
 		logger.info("SecureConnectionClient.request_connection_data()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REQUEST_CONNECTION_DATA)
 		stream.u32(cid)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.bool()
-		obj.connection_data = stream.list(ConnectionData)
-		logger.info("SecureConnectionClient.request_connection_data -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.bool()
+			obj.connection_data = stream.list(ConnectionData)
+			logger.info("SecureConnectionClient.request_connection_data -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def request_urls(self, cid, pid):
+		return self.client.wait(self.request_urls_async(cid, pid))
+	
+	def request_urls_async(self, cid, pid):
 		logger.info("SecureConnectionClient.request_urls()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REQUEST_URLS)
 		stream.u32(cid)
 		stream.pid(pid)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.bool()
-		obj.urls = stream.list(stream.stationurl)
-		logger.info("SecureConnectionClient.request_urls -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.bool()
+			obj.urls = stream.list(stream.stationurl)
+			logger.info("SecureConnectionClient.request_urls -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def register_ex(self, urls, login_data):
+		return self.client.wait(self.register_ex_async(urls, login_data))
+	
+	def register_ex_async(self, urls, login_data):
 		logger.info("SecureConnectionClient.register_ex()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REGISTER_EX)
 		stream.list(urls, stream.stationurl)
 		stream.anydata(login_data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		obj = common.RMCResponse()
-		obj.result = stream.result()
-		obj.connection_id = stream.u32()
-		obj.public_station = stream.stationurl()
-		logger.info("SecureConnectionClient.register_ex -> done")
-		return obj
+		def decode(stream):
+			obj = common.RMCResponse()
+			obj.result = stream.result()
+			obj.connection_id = stream.u32()
+			obj.public_station = stream.stationurl()
+			logger.info("SecureConnectionClient.register_ex -> done")
+			return obj
+		return self.client.call(stream, call_id, decode)
 	
 	def test_connectivity(self):
+		return self.client.wait(self.test_connectivity_async())
+	
+	def test_connectivity_async(self):
 		logger.info("SecureConnectionClient.test_connectivity()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_TEST_CONNECTIVITY)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("SecureConnectionClient.test_connectivity -> done")
+		def decode(stream):
+			logger.info("SecureConnectionClient.test_connectivity -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def replace_url(self, url, new):
+		return self.client.wait(self.replace_url_async(url, new))
+	
+	def replace_url_async(self, url, new):
 		logger.info("SecureConnectionClient.replace_url()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_REPLACE_URL)
 		stream.stationurl(url)
 		stream.stationurl(new)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("SecureConnectionClient.replace_url -> done")
+		def decode(stream):
+			logger.info("SecureConnectionClient.replace_url -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def send_report(self, report_id, data):
+		return self.client.wait(self.send_report_async(report_id, data))
+	
+	def send_report_async(self, report_id, data):
 		logger.info("SecureConnectionClient.send_report()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_SEND_REPORT)
 		stream.u32(report_id)
 		stream.qbuffer(data)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("SecureConnectionClient.send_report -> done")
+		def decode(stream):
+			logger.info("SecureConnectionClient.send_report -> done")
+		return self.client.call(stream, call_id, decode)
 
 
 class SecureConnectionServer(SecureConnectionProtocol):
@@ -1,6 +1,9 @@
 
-from nintendo.common import scheduler
+from nintendo.common import scheduler, future
 from nintendo.nex import prudp, streams, kerberos, common
+import collections
+import itertools
+import threading
 import random
 import struct
 import time
@@ -15,6 +18,116 @@ class RMCContext:
 		self.pid = pid
 
 
+class RMCRequest:
+	def __init__(self, client, protocol_id, call_id, method_id, stream):
+		self.client = client
+		self.protocol_id = protocol_id
+		self.call_id = call_id
+		self.method_id = method_id
+		self.stream = stream
+		self.start = time.perf_counter()
+		self.result = None
+		self.response = None
+		
+	def process(self):
+		return self.client.process_request(
+			self.protocol_id, self.call_id, self.method_id, self.stream
+		)
+		
+		
+class RMCDispatcher:
+	#Runs method handlers on an executor instead of the scheduler
+	#thread. At most limit handlers are submitted at once, other
+	#requests wait in a queue. Responses are sent by the scheduler
+	#thread.
+	#
+	#If ordered is set, the handlers of a connection run one after
+	#another in request order, like they do without an executor, so
+	#handlers that change the state of the connection (login, session
+	#setup) cannot interleave. Otherwise requests of one connection
+	#may run at the same time and their responses are sent as soon
+	#as they are ready.
+	def __init__(self, executor, limit=0, ordered=True):
+		self.executor = executor
+		self.limit = limit
+		self.ordered = ordered
+		
+		self.lock = threading.Lock()
+		self.queue = collections.deque()
+		self.running = 0
+		
+		#Requests that wait for an earlier request of the same
+		#connection, per connection that has a request in progress
+		self.busy = {}
+		self.waiting = 0
+		
+		self.submitted = 0
+		self.completed = 0
+		self.max_queue_depth = 0
+		
+	def queue_depth(self):
+		return len(self.queue) + self.waiting
+		
+	def submit(self, request):
+		with self.lock:
+			self.submitted += 1
+			if self.ordered:
+				if request.client in self.busy:
+					self.busy[request.client].append(request)
+					self.waiting += 1
+					self.update_queue_depth()
+					return
+				self.busy[request.client] = collections.deque()
+			
+			if self.limit and self.running >= self.limit:
+				self.queue.append(request)
+				self.update_queue_depth()
+				return
+			self.running += 1
+		self.start(request)
+		
+	def update_queue_depth(self):
+		self.max_queue_depth = max(self.max_queue_depth, self.queue_depth())
+		
+	def start(self, request):
+		job = self.executor.submit(request.process)
+		job.add_done_callback(lambda job: self.finish(request, job))
+		
+	def finish(self, request, job):
+		try:
+			request.result, request.response = job.result()
+		except Exception:
+			logger.exception("Executor failed to run method handler")
+			request.result = common.Result("PythonCore::Exception")
+			request.response = request.client.init_response(
+				request.protocol_id, request.call_id, request.method_id,
+				request.result
+			)
+		
+		with self.lock:
+			self.completed += 1
+			if self.ordered:
+				#The next request of the connection waits for a free
+				#slot like any other request
+				waiting = self.busy[request.client]
+				if waiting:
+					self.queue.append(waiting.popleft())
+					self.waiting -= 1
+				else:
+					del self.busy[request.client]
+			
+			queued = None
+			if self.queue:
+				queued = self.queue.popleft()
+			else:
+				self.running -= 1
+		if queued:
+			self.start(queued)
+		
+		#The response must be sent by the scheduler thread
+		scheduler.add_timeout(request.client.flush_responses, 0)
+		
+		
 class RMCClient:
 	def __init__(self, settings, sock=None):
 		self.settings = settings
@@ -30,10 +143,21 @@ class RMCClient:
 		self.pid = None
 		
 		self.call_id = 0
+		self.call_ids = itertools.count(1)
 		self.responses = {}
+		self.calls = {}
 		
 		self.socket_event = None
 		
+		self.dispatcher = None
+		self.pending = collections.deque()
+		
+		#Statistics are only recorded if this is set
+		self.metrics = None
+		self.call_metrics = {}
+		
+		self.sock.closed.add(self.fail_calls)
+		
 	def set_access_key(self, key): self.sock.set_access_key(key)
 		
 	def register_server(self, server):
@@ -56,6 +180,7 @@ class RMCClient:
 		if self.socket_event:
 			scheduler.remove(self.socket_event)
 		self.sock.close()
+		self.fail_calls()
 		
 	def stream_id(self): return self.sock.local_port
 		
@@ -67,6 +192,7 @@ class RMCClient:
 		if not data:
 			logger.debug("Connection was closed")
 			scheduler.remove(self.socket_event)
+			self.fail_calls()
 			return
 
 		stream = streams.StreamIn(data, self.settings)
@@ -79,12 +205,14 @@ class RMCClient:
 			self.handle_response(protocol_id, stream)
 
 	def init_request(self, protocol_id, method_id):
-		self.call_id += 1
+		#Requests may be created by multiple threads at once
+		call_id = next(self.call_ids)
+		self.call_id = call_id
 		stream = streams.StreamOut(self.settings)
 		stream.u8(protocol_id | 0x80)
-		stream.u32(self.call_id)
+		stream.u32(call_id)
 		stream.u32(method_id)
-		return stream, self.call_id
+		return stream, call_id
 		
 	def init_response(self, protocol_id, call_id, method_id, error=None):
 		stream = streams.StreamOut(self.settings)
@@ -110,6 +238,19 @@ class RMCClient:
 		method_id = stream.u32()
 		logger.debug("Received RMC request: protocol=%i, call=%i, method=%i", protocol_id, call_id, method_id)
 		
+		if self.dispatcher:
+			request = RMCRequest(self, protocol_id, call_id, method_id, stream)
+			self.pending.append(request)
+			self.dispatcher.submit(request)
+		else:
+			if self.metrics:
+				start = time.perf_counter()
+			result, response = self.process_request(protocol_id, call_id, method_id, stream)
+			self.send_message(response)
+			if self.metrics:
+				self.record_request(protocol_id, method_id, start, stream, result, response)
+			
+	def process_request(self, protocol_id, call_id, method_id, stream):
 		result = common.Result(0x10001)
 		if protocol_id in self.servers:
 			context = RMCContext(self, self.pid)
@@ -136,8 +277,35 @@ class RMCClient:
 		if result.is_error():
 			logger.info("RMC failed with error 0x%08X (%s)" %(result.code(), result.name()))
 			response = self.init_response(protocol_id, call_id, method_id, result)
-			
-		self.send_message(response)
+		return result, response
+		
+	def record_request(self, protocol_id, method_id, start, stream, result, response):
+		error = None
+		if result.is_error():
+			error = result.name()
+		self.metrics.record(
+			"server", protocol_id, method_id, time.perf_counter() - start,
+			stream.size(), response.size() + 4, error
+		)
+		
+	def flush_responses(self):
+		#Sends the responses that are ready. If the dispatcher is
+		#ordered a response also waits for all earlier responses.
+		pending = collections.deque()
+		for request in self.pending:
+			if request.response is not None and (not pending or not self.dispatcher.ordered):
+				if self.sock.is_connected():
+					self.send_message(request.response)
+					if self.metrics:
+						self.record_request(
+							request.protocol_id, request.method_id, request.start,
+							request.stream, request.result, request.response
+						)
+				else:
+					logger.debug("Dropping RMC response because the connection was closed")
+			else:
+				pending.append(request)
+		self.pending = pending
 			
 	def handle_response(self, protocol_id, stream):
 		success = stream.u8()
@@ -146,26 +314,105 @@ class RMCClient:
 			call_id = stream.u32()
 
 			logger.warning("RMC failed with error code 0x%08X", result.code())
-			self.responses[call_id] = (result, None)
+			if self.call_metrics:
+				self.record_call(call_id, stream.size(), result.name())
+			self.complete_call(call_id, result, None)
 
 		else:
 			call_id = stream.u32()
 			method_id = stream.u32() & 0x7FFF
 			logger.debug("Received RMC response: protocol=%i, call=%i, method=%i", protocol_id, call_id, method_id)
 
-			self.responses[call_id] = (None, stream)
+			if self.call_metrics:
+				self.record_call(call_id, stream.size())
+			self.complete_call(call_id, None, stream)
 			
-	def get_response(self, call_id, timeout=5):
-		start = time.monotonic()
-		while call_id not in self.responses:
+	def record_call(self, call_id, response_size, error=None):
+		info = self.call_metrics.pop(call_id, None)
+		if info:
+			protocol_id, method_id, start, request_size = info
+			self.metrics.record(
+				"client", protocol_id, method_id, time.perf_counter() - start,
+				request_size, response_size, error
+			)
+			
+	def complete_call(self, call_id, result, stream):
+		if call_id not in self.calls:
+			#Response to a request that was sent with send_message
+			self.responses[call_id] = (result, stream)
+			return
+		
+		call, event = self.calls.pop(call_id)
+		scheduler.remove(event)
+		if result:
+			call.set_exception(common.RMCError(result.code()))
+		else:
+			call.set_result(stream)
+			
+	def handle_call_timeout(self, call_id):
+		if call_id in self.calls:
+			call, event = self.calls.pop(call_id)
 			if not self.sock.is_connected():
-				raise ConnectionError("RMC failed because the PRUDP connection was closed")
-
-			scheduler.update()
+				if self.call_metrics:
+					self.record_call(call_id, 0, "RendezVous::ConnectionDisconnected")
+				call.set_exception(ConnectionError("RMC failed because the PRUDP connection was closed"))
+			else:
+				if self.call_metrics:
+					self.record_call(call_id, 0, "Core::Timeout")
+				call.set_exception(RuntimeError("RMC request timed out"))
+			
+	def fail_calls(self):
+		#Pending calls will never receive a response once the
+		#connection is gone, so don't let them wait for the timeout
+		while self.calls:
+			try:
+				call_id, (call, event) = self.calls.popitem()
+			except KeyError:
+				break
+			scheduler.remove(event)
+			if self.call_metrics:
+				self.record_call(call_id, 0, "RendezVous::ConnectionDisconnected")
+			call.set_exception(ConnectionError("RMC failed because the PRUDP connection was closed"))
 			
-			now = time.monotonic()
-			if now - start >= timeout:
-				raise RuntimeError("RMC request timed out")
+	def call(self, stream, call_id, decoder=None, timeout=5):
+		#Sends a request without waiting for the response. Returns a
+		#future that holds the decoded response. Any number of calls
+		#may be pending at the same time.
+		call = future.Future()
+		if self.metrics:
+			#The header contains the protocol id, call id and method id
+			data = stream.get()
+			method_id = struct.unpack_from("<I", data, 5)[0]
+			self.call_metrics[call_id] = (
+				data[0] & 0x7F, method_id, time.perf_counter(), len(data) + 4
+			)
+		
+		event = scheduler.add_timeout(self.handle_call_timeout, timeout, param=call_id)
+		self.calls[call_id] = (call, event)
+		try:
+			self.send_message(stream)
+		except:
+			self.calls.pop(call_id, None)
+			self.call_metrics.pop(call_id, None)
+			scheduler.remove(event)
+			raise
+		
+		if decoder:
+			return call.map(decoder)
+		return call
+		
+	def wait(self, call):
+		scheduler.wait_until(call.done)
+		return call.result()
+			
+	def get_response(self, call_id, timeout=5):
+		def done():
+			return call_id in self.responses or not self.sock.is_connected()
+		
+		if not scheduler.wait_until(done, timeout):
+			raise RuntimeError("RMC request timed out")
+		if call_id not in self.responses:
+			raise ConnectionError("RMC failed because the PRUDP connection was closed")
 			
 		result, stream = self.responses.pop(call_id)
 		if result:
@@ -185,6 +432,16 @@ class RMCServer:
 			raise TypeError("RMC server must lie on top of RV server")
 			
 		self.protocols = {}
+		self.dispatcher = None
+		self.metrics = None
+		
+	def set_executor(self, executor, limit=0, ordered=True):
+		#Method handlers are called with a context that refers to the
+		#connection, so the executor must run them in this process
+		self.dispatcher = RMCDispatcher(executor, limit, ordered)
+		
+	def set_metrics(self, metrics):
+		self.metrics = metrics
 		
 	def register_protocol(self, protocol):
 		if protocol.PROTOCOL_ID in self.protocols:
@@ -197,6 +454,8 @@ class RMCServer:
 		
 	def handle(self, socket):
 		client = RMCClient(self.settings, socket)
+		client.dispatcher = self.dispatcher
+		client.metrics = self.metrics
 		if client.accept():
 			for protocol in self.protocols.values():
 				client.register_server(protocol)
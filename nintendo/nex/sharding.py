@@ -0,0 +1,90 @@
+
+from nintendo.common import scheduler
+import multiprocessing
+import threading
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#Every worker process binds the same port with SO_REUSEPORT. The
+#kernel picks a worker based on the source address of a packet, so
+#each worker owns a disjoint set of connections. State that must be
+#seen by all workers goes through a store.
+
+
+class LocalStore:
+	#Store for a single process
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.values = {}
+		self.counters = {}
+
+	def get(self, key, default=None):
+		return self.values.get(key, default)
+
+	def set(self, key, value):
+		self.values[key] = value
+
+	def remove(self, key):
+		self.values.pop(key, None)
+
+	def next_id(self, name, start=1):
+		with self.lock:
+			value = self.counters.get(name, start)
+			self.counters[name] = value + 1
+			return value
+
+
+class SharedStore(LocalStore):
+	#Store that is shared by all worker processes through a
+	#manager process. Must be created before the workers.
+	def __init__(self):
+		self.manager = multiprocessing.Manager()
+		self.lock = self.manager.Lock()
+		self.values = self.manager.dict()
+		self.counters = self.manager.dict()
+
+
+class ShardedServer:
+	def __init__(self, settings, workers, store=None):
+		self.settings = settings.copy()
+		self.settings.set("prudp.reuse_port", 1)
+
+		self.workers = workers
+		self.store = store
+		if not self.store:
+			self.store = SharedStore()
+
+		self.processes = []
+
+	def start(self, target, *args):
+		#Calls target(settings, index, store, *args) in every worker.
+		#The target should start the servers of the worker. Workers
+		#are forked, so this must be called before the scheduler is
+		#started in this process.
+		if scheduler.thread:
+			raise RuntimeError("Sharded server must be started before the scheduler")
+
+		logger.info("Starting %i workers", self.workers)
+		context = multiprocessing.get_context("fork")
+		for index in range(self.workers):
+			process = context.Process(
+				target=self.run_worker, args=(target, index, args), daemon=True
+			)
+			process.start()
+			self.processes.append(process)
+
+	def run_worker(self, target, index, args):
+		target(self.settings, index, self.store, *args)
+		threading.Event().wait()
+
+	def wait(self):
+		for process in self.processes:
+			process.join()
+
+	def stop(self):
+		for process in self.processes:
+			process.terminate()
+		self.wait()
+		self.processes = []
@@ -83,7 +83,9 @@ class StreamIn(streams.StreamIn):
 		return map
 		
 	def repeat(self, func, count):
-		return [self.callback(func) for i in range(count)]
+		if isinstance(func, type) and issubclass(func, common.Structure):
+			return [self.extract(func) for i in range(count)]
+		return super().repeat(func, count)
 		
 	def callback(self, func):
 		if isinstance(func, type) and issubclass(func, common.Structure):
@@ -2,12 +2,15 @@
 # This file was generated automatically by generate_protocols.py
 
 from nintendo.nex import common
+import struct
 
 import logging
 logger = logging.getLogger(__name__)
 
 
 class UniqueIdInfo(common.Structure):
+	FIELDS_0 = struct.Struct("<QQ")
+	
 	def __init__(self):
 		super().__init__()
 		self.unique_id = None
@@ -19,13 +22,11 @@ class UniqueIdInfo(common.Structure):
 				raise ValueError("No value assigned to required field: %s" %field)
 	
 	def load(self, stream):
-		self.unique_id = stream.u64()
-		self.password = stream.u64()
+		self.unique_id, self.password = stream.fields(UniqueIdInfo.FIELDS_0)
 	
 	def save(self, stream):
 		self.check_required(stream.settings)
-		stream.u64(self.unique_id)
-		stream.u64(self.password)
+		stream.fields(UniqueIdInfo.FIELDS_0, self.unique_id, self.password)
 
 
 class UtilityProtocol:
@@ -46,100 +47,124 @@ class UtilityClient(UtilityProtocol):
 		self.client = client
 	
 	def acquire_nex_unique_id(self):
+		return self.client.wait(self.acquire_nex_unique_id_async())
+	
+	def acquire_nex_unique_id_async(self):
 		logger.info("UtilityClient.acquire_nex_unique_id()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_ACQUIRE_NEX_UNIQUE_ID)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		unique_id = stream.u64()
-		logger.info("UtilityClient.acquire_nex_unique_id -> done")
-		return unique_id
+		def decode(stream):
+			unique_id = stream.u64()
+			logger.info("UtilityClient.acquire_nex_unique_id -> done")
+			return unique_id
+		return self.client.call(stream, call_id, decode)
 	
 	def acquire_nex_unique_id_with_password(self):
+		return self.client.wait(self.acquire_nex_unique_id_with_password_async())
+	
+	def acquire_nex_unique_id_with_password_async(self):
 		logger.info("UtilityClient.acquire_nex_unique_id_with_password()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_ACQUIRE_NEX_UNIQUE_ID_WITH_PASSWORD)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(UniqueIdInfo)
-		logger.info("UtilityClient.acquire_nex_unique_id_with_password -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(UniqueIdInfo)
+			logger.info("UtilityClient.acquire_nex_unique_id_with_password -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def associate_nex_unique_id_with_my_principal_id(self, info):
+		return self.client.wait(self.associate_nex_unique_id_with_my_principal_id_async(info))
+	
+	def associate_nex_unique_id_with_my_principal_id_async(self, info):
 		logger.info("UtilityClient.associate_nex_unique_id_with_my_principal_id()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_ASSOCIATE_NEX_UNIQUE_ID_WITH_MY_PRINCIPAL_ID)
 		stream.add(info)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("UtilityClient.associate_nex_unique_id_with_my_principal_id -> done")
+		def decode(stream):
+			logger.info("UtilityClient.associate_nex_unique_id_with_my_principal_id -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def associate_nex_unique_ids_with_my_principal_id(self, infos):
+		return self.client.wait(self.associate_nex_unique_ids_with_my_principal_id_async(infos))
+	
+	def associate_nex_unique_ids_with_my_principal_id_async(self, infos):
 		logger.info("UtilityClient.associate_nex_unique_ids_with_my_principal_id()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_ASSOCIATE_NEX_UNIQUE_IDS_WITH_MY_PRINCIPAL_ID)
 		stream.list(infos, stream.add)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		self.client.get_response(call_id)
-		logger.info("UtilityClient.associate_nex_unique_ids_with_my_principal_id -> done")
+		def decode(stream):
+			logger.info("UtilityClient.associate_nex_unique_ids_with_my_principal_id -> done")
+		return self.client.call(stream, call_id, decode)
 	
 	def get_associated_nex_unique_id_with_my_principal_id(self):
+		return self.client.wait(self.get_associated_nex_unique_id_with_my_principal_id_async())
+	
+	def get_associated_nex_unique_id_with_my_principal_id_async(self):
 		logger.info("UtilityClient.get_associated_nex_unique_id_with_my_principal_id()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_ASSOCIATED_NEX_UNIQUE_ID_WITH_MY_PRINCIPAL_ID)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		info = stream.extract(UniqueIdInfo)
-		logger.info("UtilityClient.get_associated_nex_unique_id_with_my_principal_id -> done")
-		return info
+		def decode(stream):
+			info = stream.extract(UniqueIdInfo)
+			logger.info("UtilityClient.get_associated_nex_unique_id_with_my_principal_id -> done")
+			return info
+		return self.client.call(stream, call_id, decode)
 	
 	def get_associated_nex_unique_ids_with_my_principal_id(self):
+		return self.client.wait(self.get_associated_nex_unique_ids_with_my_principal_id_async())
+	
+	def get_associated_nex_unique_ids_with_my_principal_id_async(self):
 		logger.info("UtilityClient.get_associated_nex_unique_ids_with_my_principal_id()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_ASSOCIATED_NEX_UNIQUE_IDS_WITH_MY_PRINCIPAL_ID)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		infos = stream.list(UniqueIdInfo)
-		logger.info("UtilityClient.get_associated_nex_unique_ids_with_my_principal_id -> done")
-		return infos
+		def decode(stream):
+			infos = stream.list(UniqueIdInfo)
+			logger.info("UtilityClient.get_associated_nex_unique_ids_with_my_principal_id -> done")
+			return infos
+		return self.client.call(stream, call_id, decode)
 	
 	def get_integer_settings(self, index):
+		return self.client.wait(self.get_integer_settings_async(index))
+	
+	def get_integer_settings_async(self, index):
 		logger.info("UtilityClient.get_integer_settings()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_INTEGER_SETTINGS)
 		stream.u32(index)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		settings = stream.map(stream.u16, stream.s32)
-		logger.info("UtilityClient.get_integer_settings -> done")
-		return settings
+		def decode(stream):
+			settings = stream.map(stream.u16, stream.s32)
+			logger.info("UtilityClient.get_integer_settings -> done")
+			return settings
+		return self.client.call(stream, call_id, decode)
 	
 	def get_string_settings(self, index):
+		return self.client.wait(self.get_string_settings_async(index))
+	
+	def get_string_settings_async(self, index):
 		logger.info("UtilityClient.get_string_settings()")
 		#--- request ---
 		stream, call_id = self.client.init_request(self.PROTOCOL_ID, self.METHOD_GET_STRING_SETTINGS)
 		stream.u32(index)
-		self.client.send_message(stream)
 		
 		#--- response ---
-		stream = self.client.get_response(call_id)
-		settings = stream.map(stream.u16, stream.string)
-		logger.info("UtilityClient.get_string_settings -> done")
-		return settings
+		def decode(stream):
+			settings = stream.map(stream.u16, stream.string)
+			logger.info("UtilityClient.get_string_settings -> done")
+			return settings
+		return self.client.call(stream, call_id, decode)
 
 
 class UtilityServer(UtilityProtocol):
@@ -4,8 +4,8 @@ from nintendo.pia.streams import StreamOut, StreamIn
 from nintendo.pia.common import ResultRange, Range
 from nintendo.pia.station import StationLocation
 from nintendo.common.socket import Socket, TYPE_UDP
-from nintendo.common import scheduler
 import netifaces
+import selectors
 import socket
 import struct
 import secrets
@@ -360,14 +360,20 @@ class LanBrowser:
 		return session_info
 		
 	def receive_browse_reply(self, timeout, key, challenge):
-		start = time.monotonic()
-		while True:
-			if time.monotonic() - start >= timeout:
-				return None
-			result = self.s.recvfrom()
-			if result:
-				data, addr = result
-				reply = self.parse_browse_reply(data, key, challenge)
-				if reply:
-					return reply
-			scheduler.update()
+		#The socket is not handled by the scheduler, so wait
+		#until it is readable instead of polling it
+		deadline = time.monotonic() + timeout
+		with selectors.DefaultSelector() as selector:
+			selector.register(self.s, selectors.EVENT_READ)
+			while True:
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					return None
+				if not selector.select(remaining):
+					continue
+				result = self.s.recvfrom()
+				if result:
+					data, addr = result
+					reply = self.parse_browse_reply(data, key, challenge)
+					if reply:
+						return reply
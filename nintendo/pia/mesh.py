@@ -453,17 +453,12 @@ class MeshMgr:
 	def join(self, host_station):
 		self.join_state = self.JOIN_WAITING
 		self.protocol.send_join_request(host_station)
-		while self.join_state == self.JOIN_WAITING:
-			scheduler.update()
+		scheduler.wait_until(lambda: self.join_state != self.JOIN_WAITING)
 		if self.join_state == self.JOIN_DENIED:
 			raise RuntimeError("Join request denied")
 		
 		logger.info("Wait until all stations are connected")
-		all_connected = False
-		while not all_connected:
-			all_connected = True
-			for station in self.stations:
-				if not station.is_connected:
-					all_connected = False
-			scheduler.update()
+		scheduler.wait_until(
+			lambda: all(station.is_connected for station in self.stations)
+		)
 		logger.info("Successfully joined a mesh!")
@@ -0,0 +1,10 @@
+
+from nintendo.pia import transport
+
+
+def collect_transport(writer):
+	statistics = transport.statistics
+	writer.single("pia_packets_sent_total", "counter", "Number of PIA packets that were sent", statistics.packets_sent)
+	writer.single("pia_packets_received_total", "counter", "Number of PIA packets that were received", statistics.packets_received)
+	writer.single("pia_resends_total", "counter", "Number of messages that were sent again", statistics.resends)
+	writer.single("pia_timeouts_total", "counter", "Number of messages that reached the resend limit", statistics.timeouts)
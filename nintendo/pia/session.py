@@ -67,8 +67,7 @@ class ConnectionMgr:
 		
 	def wait(self, info):
 		rvcid = info.public_station.rvcid
-		while self.results[rvcid] == self.RESULT_NONE:
-			scheduler.update()
+		scheduler.wait_until(lambda: self.results[rvcid] != self.RESULT_NONE)
 			
 		result = self.results[rvcid]
 		if result == self.RESULT_TIMEOUT:
@@ -27,4 +27,5 @@ class P2PSocket:
 	def send(self, data, addr):
 		self.s.sendto(data, addr)
 			
+	def fileno(self): return self.s.fileno()
 	def client_address(self): return self.s.getsockname()
@@ -1,7 +1,7 @@
 
 from nintendo.pia.packet import PIAPacket, PIAMessage
 from nintendo.pia.socket import P2PSocket
-from nintendo.common import scheduler, signal
+from nintendo.common import scheduler, signal, util
 import itertools
 import random
 import struct
@@ -11,6 +11,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class Statistics:
+	def __init__(self):
+		self.packets_sent = 0
+		self.packets_received = 0
+		self.resends = 0
+		self.timeouts = 0
+
+#Counters for monitoring, shared by all transports
+statistics = Statistics()
+
+
 class PacketTransport:
 	def __init__(self, session):
 		self.session = session
@@ -37,6 +48,7 @@ class PacketTransport:
 		
 		packet = PIAPacket()
 		if packet.decode(data, self.session_key):
+			statistics.packets_received += 1
 			station.rtt_timer = packet.session_timer
 			station.base_timer = self.get_session_time()
 			self.packets.append((station, packet))
@@ -66,6 +78,7 @@ class PacketTransport:
 
 		data = packet.encode(self.session_key)
 		self.socket.send(data, station.address)
+		statistics.packets_sent += 1
 		
 	def size_limit(self):
 		return 1200
@@ -135,10 +148,12 @@ class ResendingTransport:
 		handle.counter += 1
 		if handle.counter == handle.limit:
 			logger.warning("Removing message from queue because its resend limit was reached")
+			statistics.timeouts += 1
 			self.messages.pop(handle.ack_id)
 			scheduler.remove(handle.timeout)
 		else:
 			logger.debug("Resending message with ack_id=%i" %handle.ack_id)
+			statistics.resends += 1
 			self.transport.send(handle.station, handle.message)
 		
 	def handle_ack(self, payload):
@@ -152,8 +167,7 @@ class ResendingTransport:
 		
 	def wait_ack(self, message):
 		ack_id = struct.unpack_from(">I", message.payload, -4)[0]
-		while ack_id not in self.messages:
-			scheduler.update()
+		scheduler.wait_until(lambda: ack_id in self.messages)
 			
 
 class ReliableMessage:
@@ -163,7 +177,7 @@ class ReliableMessage:
 		self.timeout = None
 
 class ReliableTransport:
-	def __init__(self, transport, station, protocol_id, protocol_port, callback):
+	def __init__(self, transport, station, protocol_id, protocol_port, callback, max_size=None):
 		self.transport = transport
 		self.station = station
 		self.protocol_id = protocol_id
@@ -179,7 +193,7 @@ class ReliableTransport:
 		self.messages = {}
 		self.incoming = {}
 		self.packets = []
-		self.fragments = b""
+		self.fragments = util.FragmentBuffer(max_size)
 		
 	def send(self, data, delay=0.5):
 		limit = (self.transport.size_limit() & ~7) - 0x18
@@ -208,6 +222,7 @@ class ReliableTransport:
 		
 	def handle_timeout(self, message):
 		logger.debug("Resending reliable message (%X)" %message.packet_id)
+		statistics.resends += 1
 		self.send_raw(message.data)
 			
 	def send_raw(self, data):
@@ -270,7 +285,10 @@ class ReliableTransport:
 		flags = struct.unpack_from(">H", message.payload)[0]
 		payload = message.payload[0x18:]
 		
-		self.fragments += payload
+		self.fragments.append(payload)
 		if flags & 2:
-			self.callback(self.station, self.fragments)
-			self.fragments = b""
+			data = self.fragments.join()
+			if data is None:
+				logger.warning("Dropped reliable message that was too large")
+			else:
+				self.callback(self.station, data)
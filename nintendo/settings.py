@@ -14,11 +14,17 @@ class Settings:
 		"prudp.minor_version": int,
 		"prudp.stream_type": int,
 		"prudp.fragment_size": int,
+		"prudp.max_message_size": int,
 		"prudp.resend_timeout": float,
 		"prudp.resend_limit": int,
+		"prudp.max_in_flight": int,
 		"prudp.ping_timeout": float,
+		"prudp.ack_delay": float,
 		"prudp.substreams": int,
 		"prudp.compression": int,
+		"prudp.key_cache_size": int,
+		"prudp.reuse_port": int,
+		"prudp.receive_buffer": int,
 		
 		"prudp_v0.signature_version": int,
 		"prudp_v0.flags_version": int,
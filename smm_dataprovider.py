@@ -1,7 +1,5 @@
-import random
-
 from nintendo.nex import backend, service, kerberos, \
-    authentication, secure, datastoresmm, common
+    authentication, secure, datastoresmm, common, streams
 
 from nintendo.miis import MiiData
 
@@ -53,18 +51,20 @@ class SmmDataProvider:
         self.smmdb_queue = smmdb.SmmdbQueue()
         self.smmdb_queue.fetch_async()
         self.smmdb_queue.wait()
+        self.course_index = smmdb.CourseIndex("www/smmdb")
+        self.course_index.start()
 
     def init_mario100_data(self):
         global smm_mario100
-        stream = common.streams.StreamIn(smm_mario100, self.settings)
+        stream = streams.StreamIn(smm_mario100, self.settings)
         return stream.list(datastoresmm.DataStoreInfoStuff)
 
     def init_mii_data(self):
         global smm_miidata
         global miidata2
-        stream = common.streams.StreamIn(smm_miidata, self.settings)
+        stream = streams.StreamIn(smm_miidata, self.settings)
         infos = stream.list(datastoresmm.DataStoreInfoStuff)
-        stream = common.streams.StreamIn(miidata2, self.settings)
+        stream = streams.StreamIn(miidata2, self.settings)
         stuff = stream.extract(datastoresmm.DataStoreInfoStuff)
         infos.append(stuff)
         mii_data_id, mii_data_pid = {}, {}
@@ -77,7 +77,7 @@ class SmmDataProvider:
 
     def init_course_data(self):
         global smm_coursedata
-        stream = common.streams.StreamIn(smm_coursedata, self.settings)
+        stream = streams.StreamIn(smm_coursedata, self.settings)
         infos = stream.list(datastoresmm.DataStoreInfoStuff)
         course_data = {}
         info: datastoresmm.DataStoreInfoStuff
@@ -89,7 +89,7 @@ class SmmDataProvider:
 
     def init_unkdata(self):
         global smm_unkdata
-        stream = common.streams.StreamIn(smm_unkdata, self.settings)
+        stream = streams.StreamIn(smm_unkdata, self.settings)
         count = stream.u32()
         unkdata = {}
         for i in range(0, count):
@@ -100,7 +100,7 @@ class SmmDataProvider:
 
     def init_rankings(self):
         global smm_rankings
-        stream = common.streams.StreamIn(smm_rankings, self.settings)
+        stream = streams.StreamIn(smm_rankings, self.settings)
         rankings = {}
         infos = stream.list(datastoresmm.CourseRecordInfo)
         ranking: datastoresmm.CourseRecordInfo
@@ -218,21 +218,19 @@ class SmmDataProvider:
         if data_id in self.course_data:
             return self.course_data[data_id]
 
-        expected_filename = "{:011d}-00001".format(data_id)
-        for file in smmdb.get_course_files("www/smmdb", recursive=True):
-            if file.endswith(expected_filename):
-                course_data = self.construct_fake_coursedata(data_id, file)
-                if course_data:
-                    self.course_data[data_id] = course_data  # cache result
-                return course_data
+        course = self.course_index.get(data_id)
+        if course:
+            course_data = self.construct_fake_coursedata(data_id, course.path)
+            if course_data:
+                self.course_data[data_id] = course_data  # cache result
+            return course_data
 
         return None
 
     def get_course_filename(self, data_id):
-        expected_filename = "{:011d}-00001".format(data_id)
-        for file in smmdb.get_course_files("www/smmdb", recursive=True):
-            if file.endswith(expected_filename):
-                return file
+        course = self.course_index.get(data_id)
+        if course:
+            return course.path
         return None
 
     def get_course_url(self, data_id):
@@ -247,16 +245,11 @@ class SmmDataProvider:
             played_filename = course_filename + ".played"
             if not os.path.exists(played_filename):
                 open(played_filename, 'a').close()
+                self.course_index.mark_played(data_id)
                 self.smmdb_queue.fetch_async()
 
     def get_random_courses_by_difficulty(self, difficulty, amount):
-        unplayed_course_ids = []
-        for file in smmdb.get_course_files("www/smmdb/{}".format(difficulty)):
-            if not os.path.exists(file + ".played"):
-                filename = os.path.basename(file)
-                index = int(filename[:filename.index('-00001')])
-                unplayed_course_ids.append(index)
-        random_sample = random.sample(unplayed_course_ids, amount)
+        random_sample = self.course_index.random_unplayed(difficulty, amount)
         return [self.get_course_data(index) for index in random_sample]
 
     def get_unkdata(self, data_id):
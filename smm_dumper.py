@@ -1,5 +1,5 @@
 from nintendo.nex import backend, service, kerberos, \
-    authentication, secure, datastoresmm, common
+    authentication, secure, datastoresmm, common, streams
 from nintendo.games import SMM
 import collections
 import itertools
@@ -456,7 +456,7 @@ AAAAAAAAALAAAAAAAAAAAAAAAAAaAAAABQAUAAAArQAAAAAAAACtAAAAAAAAAAAA
 AAAAGgAAAAYAFAAAAAEAAAAAAAAAAQAAAAAAAAAAAAAA
 """)
 
-    stream = common.streams.StreamIn(data, settings)
+    stream = streams.StreamIn(data, settings)
     infos = stream.list(datastoresmm.DataStoreInfoStuff)
 
 
@@ -1,4 +1,4 @@
-from nintendo.nex import backend, authentication, ranking, datastore, datastoresmm, common
+from nintendo.nex import backend, authentication, ranking, datastore, datastoresmm, common, streams
 from nintendo.games import SMM
 from nintendo import account
 import requests
@@ -67,7 +67,7 @@ def save_stream(outfile, func):
     settings.set("nex.access_key", SMM.ACCESS_KEY)
     settings.set("nex.version", SMM.NEX_VERSION)
     settings.set("prudp.ping_timeout", 10.0)
-    stream = common.streams.StreamOut(settings)
+    stream = streams.StreamOut(settings)
     func(stream)
     f = open(outfile, "wb")
     f.write(stream.get())
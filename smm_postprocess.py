@@ -1,5 +1,5 @@
 from nintendo.nex import backend, service, kerberos, \
-    authentication, secure, datastoresmm, common
+    authentication, secure, datastoresmm, common, streams
 from nintendo.games import SMM
 
 import glob
@@ -17,14 +17,14 @@ for file in unkdata_files:
     f = open(file, "rb")
     data = f.read()
     f.close()
-    stream = common.streams.StreamIn(data, settings)
+    stream = streams.StreamIn(data, settings)
     blub = stream.list(stream.qbuffer)
     bfile = ntpath.basename(file)
     id = int(bfile[8:-4])
     unkid.append(id)
     unkdata.append(blub)
 
-unkstream = common.streams.StreamOut(settings)
+unkstream = streams.StreamOut(settings)
 unkstream.u32(len(unkdata))
 for i in range(0, len(unkdata)):
     unkstream.u64(unkid[i])
@@ -40,13 +40,13 @@ smm_mii_infos = []
 
 for file in smm_mii_files:
     f = open(file, "rb")
-    stream = common.streams.StreamIn(f.read(), settings)
+    stream = streams.StreamIn(f.read(), settings)
     infos = stream.list(datastoresmm.DataStoreInfoStuff)
     for info in infos:
         smm_mii_infos.append(info)
     f.close()
 
-smm_mii_stream = common.streams.StreamOut(settings)
+smm_mii_stream = streams.StreamOut(settings)
 smm_mii_stream.list(smm_mii_infos, smm_mii_stream.add)
 f = open("smm_miidata.bin", "wb")
 f.write(smm_mii_stream.get())
@@ -56,13 +56,13 @@ course_files = glob.glob("./smm_scrape/coursedatas*.bin")
 course_infos = []
 for file in course_files:
     f = open(file, "rb")
-    stream = common.streams.StreamIn(f.read(), settings)
+    stream = streams.StreamIn(f.read(), settings)
     infos = stream.list(datastoresmm.DataStoreInfoStuff)
     for info in infos:
         course_infos.append(info)
     f.close()
 
-coursedata_stream = common.streams.StreamOut(settings)
+coursedata_stream = streams.StreamOut(settings)
 coursedata_stream.list(course_infos, coursedata_stream.add)
 f = open("smm_coursedata.bin", "wb")
 f.write(coursedata_stream.get())
@@ -72,12 +72,12 @@ ranking_files = glob.glob("./smm_scrape/ranking*.bin")
 rankings = []
 for file in ranking_files:
     f = open(file, "rb")
-    stream = common.streams.StreamIn(f.read(), settings)
+    stream = streams.StreamIn(f.read(), settings)
     ranking = stream.extract(datastoresmm.CourseRecordInfo)
     rankings.append(ranking)
     f.close()
 
-rankings_stream = common.streams.StreamOut(settings)
+rankings_stream = streams.StreamOut(settings)
 rankings_stream.list(rankings, rankings_stream.add)
 f = open("smm_rankings.bin", "wb")
 f.write(rankings_stream.get())
@@ -10,8 +10,9 @@ import subprocess
 import zlib
 import struct
 import jsons
-from threading import Thread
+from threading import Thread, Lock, Event
 import queue
+import random
 import logging
 
 logger = logging.getLogger(__name__)
@@ -213,6 +214,176 @@ def get_course_files(basedir, *, recursive=False):
             yield file
 
 
+@dataclass
+class CourseEntry:
+    path: str
+    difficulty: int
+    size: int
+    played: bool
+
+
+class CourseIndex:
+    """
+    Maps course data ids to the course files below basedir. The index is built
+    once and then kept current by polling the modification time of every
+    directory, so only directories that changed are scanned again.
+    """
+
+    def __init__(self, basedir, poll_interval=5):
+        self.basedir = basedir
+        self.poll_interval = poll_interval
+        self.lock = Lock()
+        self.stopped = Event()
+        self.courses = {}  # data_id -> CourseEntry
+        self.dir_courses = {}  # directory -> set of data ids
+        self.dir_played = {}  # directory -> set of played data ids
+        self.dir_mtimes = {}  # directory -> st_mtime_ns
+        # unplayed data ids per difficulty, as a list for random.sample
+        # and a position map for removal in constant time
+        self.unplayed = {}
+        self.unplayed_pos = {}
+
+    def start(self):
+        self.refresh()
+        Thread(target=self.poll, daemon=True).start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def poll(self):
+        while not self.stopped.wait(self.poll_interval):
+            # noinspection PyBroadException
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('[smmdb] failed to refresh course index')
+
+    def refresh(self):
+        pending = [self.basedir]
+        seen = set()
+        while pending:
+            directory = pending.pop()
+            seen.add(directory)
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self.dir_mtimes.get(directory) != mtime:
+                try:
+                    pending.extend(self.scan_dir(directory))
+                except OSError:
+                    # keep the old entries and try again on the next poll
+                    logger.exception('[smmdb] failed to scan {}'.format(directory))
+                else:
+                    # only recorded after a successful scan
+                    self.dir_mtimes[directory] = mtime
+                    continue
+            pending.extend(d for d in self.dir_mtimes if os.path.dirname(d) == directory)
+
+        # forget directories that were removed
+        for directory in list(self.dir_mtimes):
+            if directory not in seen:
+                del self.dir_mtimes[directory]
+                self.update_dir(directory, {}, set())
+                self.dir_courses.pop(directory, None)
+                self.dir_played.pop(directory, None)
+
+    def scan_dir(self, directory):
+        subdirs = []
+        found = {}  # data_id -> (path, size), None for courses that are already known
+        played = set()
+        known = self.dir_courses.get(directory, set())
+        for entry in os.scandir(directory):
+            if entry.is_dir():
+                subdirs.append(entry.path)
+                continue
+            name = entry.name
+            if name.endswith('-00001.played'):
+                name = name[:-7]
+                is_played = True
+            elif name.endswith('-00001'):
+                is_played = False
+            else:
+                continue
+            try:
+                data_id = int(name[:-6])
+            except ValueError:
+                continue
+            if is_played:
+                played.add(data_id)
+            elif data_id in known:
+                found[data_id] = None
+            else:
+                found[data_id] = (entry.path, entry.stat().st_size)
+        self.update_dir(directory, found, played)
+        return subdirs
+
+    def update_dir(self, directory, found, played):
+        difficulty = None
+        name = os.path.basename(directory)
+        if name.isdigit():
+            difficulty = int(name)
+        with self.lock:
+            known = self.dir_courses.get(directory, set())
+            was_played = self.dir_played.get(directory, set())
+            for data_id in known - found.keys():
+                course = self.courses.get(data_id)
+                # the course may have been moved to another directory
+                if course and os.path.dirname(course.path) == directory:
+                    self.remove_course(data_id)
+            for data_id in found.keys() - known:
+                if data_id in self.courses:
+                    # indexed in another directory before
+                    self.remove_course(data_id)
+                path, size = found[data_id]
+                course = CourseEntry(path, difficulty, size, False)
+                self.courses[data_id] = course
+                self.set_played(data_id, course, data_id in played, force=True)
+            # only the played flags of known courses that changed
+            for data_id in (played ^ was_played) & known:
+                course = self.courses.get(data_id)
+                if course and os.path.dirname(course.path) == directory:
+                    self.set_played(data_id, course, data_id in played)
+            self.dir_courses[directory] = set(found)
+            self.dir_played[directory] = played
+
+    def remove_course(self, data_id):
+        course = self.courses.pop(data_id)
+        self.set_played(data_id, course, True)
+
+    def set_played(self, data_id, course, played, force=False):
+        if course.played == played and not force:
+            return
+        course.played = played
+        ids = self.unplayed.setdefault(course.difficulty, [])
+        if played:
+            pos = self.unplayed_pos.pop(data_id, None)
+            if pos is not None:
+                last = ids.pop()
+                if last != data_id:
+                    ids[pos] = last
+                    self.unplayed_pos[last] = pos
+        elif data_id not in self.unplayed_pos:
+            self.unplayed_pos[data_id] = len(ids)
+            ids.append(data_id)
+
+    def mark_played(self, data_id):
+        with self.lock:
+            course = self.courses.get(data_id)
+            if course:
+                self.set_played(data_id, course, True)
+
+    def get(self, data_id):
+        return self.courses.get(data_id)
+
+    def random_unplayed(self, difficulty, amount):
+        with self.lock:
+            return random.sample(self.unplayed.get(difficulty, []), amount)
+
+    def __len__(self):
+        return len(self.courses)
+
+
 def fetch_courses(difficulty, total_required):
     create_smmdb()
     total_played = 0
@@ -0,0 +1,66 @@
+
+from nintendo.nex import kerberos
+
+
+class KeyDerivation:
+	#Counts the derived keys instead of running thousands of md5 digests
+	def __init__(self):
+		self.derived = 0
+
+	def derive_key(self, password, pid):
+		self.derived += 1
+		return b"%i:%s" %(pid, password)
+
+
+def test_get_key_cached():
+	derivation = KeyDerivation()
+	store = kerberos.KeyStore(derivation)
+	store.add(100, "guest", "password")
+
+	assert store.get_key(100) == b"100:password"
+	assert store.get_key(100) == b"100:password"
+	assert derivation.derived == 1
+	assert (store.hits, store.misses) == (1, 1)
+
+def test_set_password():
+	store = kerberos.KeyStore(KeyDerivation())
+	store.add(100, "guest", "password")
+	store.get_key(100)
+
+	store.set_password(100, "other")
+	assert store.get_key(100) == b"100:other"
+	assert store.get_by_name("guest").password == b"other"
+
+def test_add_same_name_new_pid():
+	store = kerberos.KeyStore(KeyDerivation())
+	store.add(100, "guest", "password")
+	store.get_key(100)
+
+	account = store.add(200, "guest", "other")
+	assert store.get_by_name("guest") is account
+	assert store.get_by_pid(100) is None
+	assert store.get_by_pid(200) is account
+	assert len(store.keys) == 0
+
+	#Removing the old pid must not affect the new account
+	store.remove(100)
+	assert store.get_by_name("guest") is account
+	assert store.get_key(200) == b"200:other"
+
+def test_add_same_pid_new_name():
+	store = kerberos.KeyStore(KeyDerivation())
+	store.add(100, "guest", "password")
+
+	account = store.add(100, "player", "password")
+	assert store.get_by_name("guest") is None
+	assert store.get_by_name("player") is account
+
+def test_add_replaces_two_accounts():
+	store = kerberos.KeyStore(KeyDerivation())
+	store.add(100, "guest", "password")
+	store.add(200, "player", "password")
+
+	#Takes the pid of one account and the name of the other
+	account = store.add(100, "player", "other")
+	assert store.by_name == {"player": account}
+	assert store.by_pid == {100: account}
@@ -0,0 +1,95 @@
+
+#Encodes the bundled Super Mario Maker dumps again after decoding them
+#and checks that the result is byte-identical. The structure classes are
+#generated from the .proto files both with and without the fast path.
+
+from nintendo.nex import streams
+from nintendo.settings import Settings
+from nintendo.games import SMM
+import importlib.util
+import subprocess
+import pytest
+import sys
+import os
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CORPUS = ["smm_coursedata.bin", "smm_miidata.bin"]
+
+#The dumps were captured with structure headers. The structures are
+#also encoded without them (the default) and with NEX 4.0.
+VERSIONS = [None, 40000]
+
+
+def read_dump(name):
+	with open(os.path.join(ROOT, name), "rb") as f:
+		return f.read()
+
+def make_settings(nex_version):
+	settings = Settings("default.cfg")
+	if nex_version is not None:
+		settings.set("nex.version", nex_version)
+	return settings
+
+def encode(items, settings):
+	stream = streams.StreamOut(settings)
+	stream.list(items, stream.add)
+	return stream.get()
+
+def decode(data, module, settings):
+	stream = streams.StreamIn(data, settings)
+	items = stream.list(module.DataStoreInfoStuff)
+	assert stream.eof()
+	return items
+
+
+@pytest.fixture(scope="module", params=["fast", "no-fast-path"])
+def datastoresmm(request, tmp_path_factory):
+	#The generator writes to nintendo/nex relative to the working directory
+	path = tmp_path_factory.mktemp(request.param)
+	os.makedirs(path / "nintendo" / "nex")
+	os.symlink(os.path.join(ROOT, "nintendo", "files"), path / "nintendo" / "files")
+
+	args = [sys.executable, os.path.join(ROOT, "generate_protocols.py")]
+	if request.param == "no-fast-path":
+		args.append("--no-fast-path")
+	subprocess.run(args, cwd=path, check=True, stdout=subprocess.DEVNULL)
+
+	filename = path / "nintendo" / "nex" / "datastoresmm.py"
+	spec = importlib.util.spec_from_file_location("datastoresmm_" + request.param, filename)
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+	return module
+
+
+@pytest.mark.parametrize("name", CORPUS)
+def test_roundtrip(datastoresmm, name):
+	data = read_dump(name)
+	settings = make_settings(SMM.NEX_VERSION)
+	items = decode(data, datastoresmm, settings)
+	assert encode(items, settings) == data
+
+@pytest.mark.parametrize("name", CORPUS)
+@pytest.mark.parametrize("nex_version", VERSIONS)
+def test_roundtrip_version(datastoresmm, name, nex_version):
+	items = decode(read_dump(name), datastoresmm, make_settings(SMM.NEX_VERSION))
+
+	settings = make_settings(nex_version)
+	data = encode(items, settings)
+	items = decode(data, datastoresmm, settings)
+	assert encode(items, settings) == data
+
+@pytest.mark.parametrize("name", CORPUS)
+@pytest.mark.parametrize("nex_version", VERSIONS)
+def test_generated_code(datastoresmm, name, nex_version):
+	#The generated code must produce the same output as the committed
+	#protocol modules
+	from nintendo.nex import datastoresmm as expected
+
+	data = read_dump(name)
+	items = decode(data, datastoresmm, make_settings(SMM.NEX_VERSION))
+	reference = decode(data, expected, make_settings(SMM.NEX_VERSION))
+
+	settings = make_settings(nex_version)
+	assert encode(items, settings) == encode(reference, settings)